@@ -4,6 +4,7 @@ Provides common CRUD operations and utilities for database entities.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any
 
 import duckdb
@@ -94,7 +95,7 @@ class BaseModel(ABC):
 
             if row:
                 columns = [desc[0] for desc in result.description]
-                return dict(zip(columns, row))
+                return dict(zip(columns, row, strict=True))
             return None
         except duckdb.Error as e:
             print(f"Error fetching record {record_id}: {e}")
@@ -105,6 +106,7 @@ class BaseModel(ABC):
         limit: int | None = None,
         offset: int | None = None,
         order_by: str | None = None,
+        columns: Sequence[str] | None = None,
     ) -> pl.DataFrame:
         """Get all records from the table.
 
@@ -112,11 +114,16 @@ class BaseModel(ABC):
             limit: Maximum number of records to return
             offset: Number of records to skip
             order_by: Column(s) to order by
+            columns: Columns to select, in order (None = all columns)
 
         Returns:
             pl.DataFrame: Polars DataFrame with the results
         """
-        query = f"SELECT * FROM {self.table_name}"
+        # Quote column names - some tables use reserved words (e.g. "order")
+        projection = (
+            ", ".join(f'"{column}"' for column in columns) if columns else "*"
+        )
+        query = f"SELECT {projection} FROM {self.table_name}"
 
         if order_by:
             query += f" ORDER BY {order_by}"
@@ -184,7 +191,7 @@ class BaseModel(ABC):
             int | str | None: ID of the created record, or None if failed
         """
         try:
-            columns = ", ".join(data.keys())
+            columns = ", ".join(f'"{column}"' for column in data)
             placeholders = ", ".join(["?" for _ in data])
             query = f"INSERT INTO {self.table_name} ({columns}) VALUES ({placeholders})"
 
@@ -196,6 +203,35 @@ class BaseModel(ABC):
             print(f"Error creating record: {e}")
             return None
 
+    def create_with_next_id(self, data: dict[str, Any]) -> int:
+        """Create a record, allocating the next integer ID in the same statement.
+
+        Folds the MAX(id) lookup into the INSERT so creating a record is a
+        single round-trip.
+
+        Args:
+            data: Column names and values, excluding the ID column
+
+        Returns:
+            int: ID of the created record
+
+        Raises:
+            duckdb.Error: If the insert fails
+        """
+        columns = ", ".join(f'"{column}"' for column in data)
+        placeholders = ", ".join(["?" for _ in data])
+        query = f"""
+            INSERT INTO {self.table_name} ({self.id_column}, {columns})
+            VALUES (
+                (SELECT COALESCE(MAX({self.id_column}), 0) + 1 FROM {self.table_name}),
+                {placeholders}
+            )
+            RETURNING {self.id_column}
+        """  # noqa: S608 - only table and column names are interpolated
+
+        result = self.execute_raw_query(query, list(data.values()))
+        return result.fetchone()[0]
+
     def update(self, record_id: int | str, data: dict[str, Any]) -> bool:
         """Update an existing record.
 
@@ -207,7 +243,8 @@ class BaseModel(ABC):
             bool: True if update was successful
         """
         try:
-            set_clause = ", ".join([f"{col} = ?" for col in data.keys()])
+            # Quoted, as some columns (e.g. species "order") are reserved words
+            set_clause = ", ".join(f'"{column}" = ?' for column in data)
             query = f"UPDATE {self.table_name} SET {set_clause} WHERE {self.id_column} = ?"
 
             parameters = list(data.values()) + [record_id]
@@ -229,6 +266,58 @@ class BaseModel(ABC):
         """
         return db.execute_query(query, parameters)
 
+    def get_with_relations(
+        self,
+        record_id: int | str,
+        relations: dict[str, tuple[str, str]],
+        alias: str,
+    ) -> dict[str, Any] | None:
+        """Get a record together with related rows, in a single query.
+
+        Each relationship is aggregated into a list of structs by a correlated
+        subquery and then unpacked into its own DataFrame. Counts are taken
+        from the lengths of those DataFrames.
+
+        Args:
+            record_id: ID of the record
+            relations: Relationship name -> (subquery correlated on
+                ``alias``, ORDER BY over its rows, which are aliased ``r``)
+            alias: Alias given to this model's table in the query
+
+        Returns:
+            dict: {"data": record dict, <relationship name>: DataFrame, ...,
+                "counts": relationship name -> count}, or None if the record
+                does not exist
+        """
+        relation_columns = ",\n".join(
+            f"(SELECT list(r ORDER BY {order_by}) FROM ({subquery}) r) as {name}"
+            for name, (subquery, order_by) in relations.items()
+        )
+        query = f"""
+            SELECT
+                {alias}.*,
+                {relation_columns}
+            FROM {self.table_name} {alias}
+            WHERE {alias}.{self.id_column} = ?
+        """  # noqa: S608 - only static SQL fragments are interpolated
+
+        frame = self.execute_raw_query(query, [record_id]).pl()
+        if frame.is_empty():
+            return None
+
+        record_columns = [c for c in frame.columns if c not in relations]
+        bundle = {"data": frame.select(record_columns).row(0, named=True)}
+        for name in relations:
+            # An empty relationship aggregates to NULL, which explodes to a null row
+            bundle[name] = (
+                frame.select(pl.col(name).explode())
+                .filter(pl.col(name).is_not_null())
+                .unnest(name)
+            )
+
+        bundle["counts"] = {name: len(bundle[name]) for name in relations}
+        return bundle
+
     def get_summary_stats(self) -> dict[str, Any]:
         """Get summary statistics for the entity.
 
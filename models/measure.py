@@ -1,6 +1,8 @@
 """Measure entity model for biodiversity measures."""
 
 import logging
+from dataclasses import dataclass, fields
+from typing import Any
 
 import duckdb
 import polars as pl
@@ -13,6 +15,122 @@ from models.base import BaseModel
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class Measure:
+    """A single measure record with typed attribute access."""
+
+    measure_id: int
+    measure: str | None = None
+    concise_measure: str | None = None
+    core_supplementary: str | None = None
+    mapped_unmapped: str | None = None
+    link_to_further_guidance: str | None = None
+    other_priorities_delivered: str | None = None
+    relevant_map_layer: str | None = None
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> "Measure":
+        """Build a Measure from a column name -> value mapping.
+
+        Columns that are not fields of Measure are ignored.
+
+        Args:
+            record: Measure row as a dictionary
+
+        Returns:
+            Measure: Typed measure record
+        """
+        return cls(**{f.name: record.get(f.name) for f in fields(cls)})
+
+
+# Measures with aggregated types/stakeholders and relationship counts (no ORDER BY),
+# shared by the list and search queries.
+MEASURES_WITH_COUNTS_QUERY = """
+    SELECT
+        m.measure_id,
+        m.measure,
+        m.concise_measure,
+        m.core_supplementary,
+        m.mapped_unmapped,
+        (SELECT STRING_AGG(DISTINCT mt.measure_type, ', ')
+         FROM measure_has_type mht
+         JOIN measure_type mt ON mht.measure_type_id = mt.measure_type_id
+         WHERE mht.measure_id = m.measure_id) as types,
+        (SELECT STRING_AGG(DISTINCT s.stakeholder, ', ')
+         FROM measure_has_stakeholder mhs
+         JOIN stakeholder s ON mhs.stakeholder_id = s.stakeholder_id
+         WHERE mhs.measure_id = m.measure_id) as stakeholders,
+        (SELECT COUNT(DISTINCT area_id)
+         FROM measure_area_priority
+         WHERE measure_id = m.measure_id) as areas,
+        (SELECT COUNT(DISTINCT priority_id)
+         FROM measure_area_priority
+         WHERE measure_id = m.measure_id) as priorities,
+        (SELECT COUNT(DISTINCT species_id)
+         FROM measure_has_species
+         WHERE measure_id = m.measure_id) as species,
+        (SELECT COUNT(DISTINCT benefit_id)
+         FROM measure_has_benefits
+         WHERE measure_id = m.measure_id) as benefits
+    FROM measure m
+"""
+
+# Relationship name -> (subquery correlated on m.measure_id, ORDER BY for its rows).
+# Mirrors the individual get_* relationship getters on MeasureModel, but selects
+# only the columns shown on the measure detail page.
+MEASURE_DETAIL_RELATIONS: dict[str, tuple[str, str]] = {
+    "types": (
+        """SELECT mt.measure_type_id, mt.measure_type
+        FROM measure_type mt
+        JOIN measure_has_type mht ON mt.measure_type_id = mht.measure_type_id
+        WHERE mht.measure_id = m.measure_id""",
+        "r.measure_type",
+    ),
+    "stakeholders": (
+        """SELECT s.stakeholder_id, s.stakeholder
+        FROM stakeholder s
+        JOIN measure_has_stakeholder mhs ON s.stakeholder_id = mhs.stakeholder_id
+        WHERE mhs.measure_id = m.measure_id""",
+        "r.stakeholder",
+    ),
+    "areas": (
+        """SELECT DISTINCT a.area_id, a.area_name, a.area_description
+        FROM area a
+        JOIN measure_area_priority map ON a.area_id = map.area_id
+        WHERE map.measure_id = m.measure_id""",
+        "r.area_name",
+    ),
+    "priorities": (
+        """SELECT DISTINCT p.priority_id, p.biodiversity_priority, p.theme
+        FROM priority p
+        JOIN measure_area_priority map ON p.priority_id = map.priority_id
+        WHERE map.measure_id = m.measure_id""",
+        "r.theme, r.biodiversity_priority",
+    ),
+    "grants": (
+        """SELECT DISTINCT g.grant_id, g.grant_name, g.grant_scheme, g.url
+        FROM grant_table g
+        JOIN measure_area_priority_grant mapg ON g.grant_id = mapg.grant_id
+        WHERE mapg.measure_id = m.measure_id""",
+        "r.grant_scheme, r.grant_name",
+    ),
+    "species": (
+        """SELECT s.species_id, s.common_name, s.linnaean_name, s.assemblage
+        FROM species s
+        JOIN measure_has_species mhs ON s.species_id = mhs.species_id
+        WHERE mhs.measure_id = m.measure_id""",
+        "r.common_name",
+    ),
+    "benefits": (
+        """SELECT b.benefit_id, b.benefit
+        FROM benefits b
+        JOIN measure_has_benefits mhb ON b.benefit_id = mhb.benefit_id
+        WHERE mhb.measure_id = m.measure_id""",
+        "r.benefit",
+    ),
+}
+
+
 class MeasureModel(BaseModel):
     """Model for managing measure entities."""
 
@@ -32,40 +150,37 @@ class MeasureModel(BaseModel):
         Returns:
             pl.DataFrame: Measures with relationship counts and aggregated types/stakeholders
         """
-        query = """
-            SELECT
-                m.measure_id,
-                m.measure,
-                m.concise_measure,
-                m.core_supplementary,
-                m.mapped_unmapped,
-                (SELECT STRING_AGG(DISTINCT mt.measure_type, ', ')
-                 FROM measure_has_type mht
-                 JOIN measure_type mt ON mht.measure_type_id = mt.measure_type_id
-                 WHERE mht.measure_id = m.measure_id) as types,
-                (SELECT STRING_AGG(DISTINCT s.stakeholder, ', ')
-                 FROM measure_has_stakeholder mhs
-                 JOIN stakeholder s ON mhs.stakeholder_id = s.stakeholder_id
-                 WHERE mhs.measure_id = m.measure_id) as stakeholders,
-                (SELECT COUNT(DISTINCT area_id)
-                 FROM measure_area_priority
-                 WHERE measure_id = m.measure_id) as areas,
-                (SELECT COUNT(DISTINCT priority_id)
-                 FROM measure_area_priority
-                 WHERE measure_id = m.measure_id) as priorities,
-                (SELECT COUNT(DISTINCT species_id)
-                 FROM measure_has_species
-                 WHERE measure_id = m.measure_id) as species,
-                (SELECT COUNT(DISTINCT benefit_id)
-                 FROM measure_has_benefits
-                 WHERE measure_id = m.measure_id) as benefits
-            FROM measure m
-            ORDER BY m.measure_id
-        """
+        query = f"{MEASURES_WITH_COUNTS_QUERY} ORDER BY m.measure_id"
 
         result = self.execute_raw_query(query)
         return result.pl()
 
+    def search_with_counts(self, term: str) -> pl.DataFrame:
+        """Search measures with relationship counts in the database.
+
+        Matches the term case-insensitively as a literal substring of the
+        measure text, concise measure, measure types or stakeholders.
+
+        Args:
+            term: Search text
+
+        Returns:
+            pl.DataFrame: Matching measures in the same shape as
+                get_with_relationship_counts
+        """
+        query = f"""
+            SELECT *
+            FROM ({MEASURES_WITH_COUNTS_QUERY}) measures
+            WHERE contains(lower(measure), ?)
+               OR contains(lower(concise_measure), ?)
+               OR contains(lower(types), ?)
+               OR contains(lower(stakeholders), ?)
+            ORDER BY measure_id
+        """  # noqa: S608 - only the static base query is interpolated
+
+        result = self.execute_raw_query(query, [term.strip().lower()] * 4)
+        return result.pl()
+
     def get_types(self, measure_id: int) -> pl.DataFrame:
         """Get types for this measure.
 
@@ -231,29 +346,60 @@ class MeasureModel(BaseModel):
     def get_relationship_counts(self, measure_id: int) -> dict[str, int]:
         """Get counts of all related entities for a measure.
 
+        All seven counts are returned by a single query using scalar subqueries,
+        so only one round trip is made to the database.
+
         Args:
             measure_id: ID of the measure
 
         Returns:
             dict: Entity name -> count
         """
-        types = self.get_types(measure_id)
-        stakeholders = self.get_stakeholders(measure_id)
-        areas = self.get_related_areas(measure_id)
-        priorities = self.get_related_priorities(measure_id)
-        grants = self.get_related_grants(measure_id)
-        species = self.get_related_species(measure_id)
-        benefits = self.get_benefits(measure_id)
-
-        return {
-            "types": len(types),
-            "stakeholders": len(stakeholders),
-            "areas": len(areas),
-            "priorities": len(priorities),
-            "grants": len(grants),
-            "species": len(species),
-            "benefits": len(benefits),
-        }
+        query = """
+            SELECT
+                (SELECT COUNT(*)
+                 FROM measure_has_type
+                 WHERE measure_id = ?) as types,
+                (SELECT COUNT(*)
+                 FROM measure_has_stakeholder
+                 WHERE measure_id = ?) as stakeholders,
+                (SELECT COUNT(DISTINCT area_id)
+                 FROM measure_area_priority
+                 WHERE measure_id = ?) as areas,
+                (SELECT COUNT(DISTINCT priority_id)
+                 FROM measure_area_priority
+                 WHERE measure_id = ?) as priorities,
+                (SELECT COUNT(DISTINCT grant_id)
+                 FROM measure_area_priority_grant
+                 WHERE measure_id = ?) as grants,
+                (SELECT COUNT(*)
+                 FROM measure_has_species
+                 WHERE measure_id = ?) as species,
+                (SELECT COUNT(*)
+                 FROM measure_has_benefits
+                 WHERE measure_id = ?) as benefits
+        """
+
+        result = self.execute_raw_query(query, [measure_id] * 7)
+        row = result.fetchone()
+        columns = [desc[0] for desc in result.description]
+        return dict(zip(columns, row, strict=True))
+
+    def get_detail_bundle(self, measure_id: int) -> dict | None:
+        """Get a measure record together with all of its related entities.
+
+        Args:
+            measure_id: ID of the measure
+
+        Returns:
+            dict: {"measure": Measure, "types": DataFrame, ...,
+                "counts": entity name -> count}, or None if the measure does
+                not exist
+        """
+        bundle = self.get_with_relations(measure_id, MEASURE_DETAIL_RELATIONS, "m")
+        if bundle:
+            bundle["measure"] = Measure.from_record(bundle.pop("data"))
+        return bundle
 
     @st.cache_data(ttl=3600, show_spinner=False)
     def get_all_measure_types(_self) -> pl.DataFrame:
@@ -294,6 +440,28 @@ class MeasureModel(BaseModel):
         result = _self.execute_raw_query(query)
         return result.pl()
 
+    @st.cache_data(ttl=3600, show_spinner=False)
+    def get_all_lookups(_self) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+        """Get all measure types, stakeholders and benefits in one call.
+
+        The three lookup queries run back to back on the shared connection and
+        the result is cached for 1 hour as this reference data rarely changes.
+
+        Returns:
+            tuple: (measure types, stakeholders, benefits) DataFrames
+        """
+        conn = db.get_connection()
+        types = conn.execute(
+            "SELECT measure_type_id, measure_type FROM measure_type ORDER BY measure_type"
+        ).pl()
+        stakeholders = conn.execute(
+            "SELECT stakeholder_id, stakeholder FROM stakeholder ORDER BY stakeholder"
+        ).pl()
+        benefits = conn.execute(
+            "SELECT benefit_id, benefit FROM benefits ORDER BY benefit"
+        ).pl()
+        return types, stakeholders, benefits
+
     @monitor_performance("measure_delete_cascade")
     @with_snapshot("delete", "measure")
     def delete_with_cascade(self, measure_id: int) -> bool:
@@ -1,6 +1,7 @@
 """Priority entity model for biodiversity priorities."""
 
 import logging
+from collections.abc import Sequence
 
 import duckdb
 import polars as pl
@@ -10,6 +11,33 @@ from models.base import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# Relationship name -> (subquery correlated on p.priority_id, ORDER BY for its rows).
+# Mirrors get_related_measures, get_related_areas and get_related_species.
+PRIORITY_DETAIL_RELATIONS: dict[str, tuple[str, str]] = {
+    "measures": (
+        """SELECT DISTINCT m.measure_id, m.measure, m.concise_measure,
+            m.core_supplementary
+        FROM measure m
+        JOIN measure_area_priority map ON m.measure_id = map.measure_id
+        WHERE map.priority_id = p.priority_id""",
+        "r.measure_id",
+    ),
+    "areas": (
+        """SELECT DISTINCT a.area_id, a.area_name, a.area_description
+        FROM area a
+        JOIN measure_area_priority map ON a.area_id = map.area_id
+        WHERE map.priority_id = p.priority_id""",
+        "r.area_name",
+    ),
+    "species": (
+        """SELECT DISTINCT s.species_id, s.common_name, s.linnaean_name, s.assemblage
+        FROM species s
+        JOIN species_area_priority sap ON s.species_id = sap.species_id
+        WHERE sap.priority_id = p.priority_id""",
+        "r.common_name",
+    ),
+}
+
 
 class PriorityModel(BaseModel):
     """Model for managing biodiversity priority entities."""
@@ -22,13 +50,29 @@ class PriorityModel(BaseModel):
     def id_column(self) -> str:
         return "priority_id"
 
-    def get_by_theme(self) -> dict[str, pl.DataFrame]:
+    def get_by_theme(
+        self, columns: Sequence[str] | None = None
+    ) -> dict[str, pl.DataFrame]:
         """Get priorities grouped by theme.
 
+        Args:
+            columns: Columns to select for each priority (None = all). The
+                projection is done in the query; theme is always read for
+                grouping but only returned if requested.
+
         Returns:
             dict: Theme name -> DataFrame of priorities in that theme
         """
-        all_priorities = self.get_all(order_by="theme, biodiversity_priority")
+        if columns is None:
+            all_priorities = self.get_all(order_by="theme, biodiversity_priority")
+        else:
+            select_columns = ", ".join(dict.fromkeys([*columns, "theme"]))
+            query = f"""
+                SELECT {select_columns}
+                FROM priority
+                ORDER BY theme, biodiversity_priority
+            """  # noqa: S608 - column names come from the caller, not user input
+            all_priorities = self.execute_raw_query(query).pl()
 
         # Group by theme
         themes = all_priorities["theme"].unique().sort()
@@ -36,10 +80,34 @@ class PriorityModel(BaseModel):
 
         for theme in themes:
             theme_data = all_priorities.filter(pl.col("theme") == theme)
+            if columns is not None:
+                theme_data = theme_data.select(columns)
             grouped[theme] = theme_data
 
         return grouped
 
+    def get_all_clean_theme(self) -> pl.DataFrame:
+        """Get all priorities with theme names cleaned in the query.
+
+        Non-breaking spaces and surrounding whitespace are removed from the
+        theme by DuckDB, so callers receive display-ready values.
+
+        Returns:
+            pl.DataFrame: Priorities ordered by theme and biodiversity priority
+        """
+        query = """
+            SELECT
+                priority_id,
+                biodiversity_priority,
+                simplified_biodiversity_priority,
+                trim(replace(theme, chr(160), '')) AS theme
+            FROM priority
+            ORDER BY theme, biodiversity_priority
+        """
+
+        result = self.execute_raw_query(query)
+        return result.pl()
+
     def get_related_measures(self, priority_id: int) -> pl.DataFrame:
         """Get measures linked to this priority.
 
@@ -130,6 +198,19 @@ class PriorityModel(BaseModel):
             "species": len(species),
         }
 
+    def get_detail_bundle(self, priority_id: int) -> dict | None:
+        """Get a priority record together with its related entities.
+
+        Args:
+            priority_id: ID of the priority
+
+        Returns:
+            dict: {"data": record dict, "measures": DataFrame, "areas":
+                DataFrame, "species": DataFrame, "counts": entity name -> count},
+                or None if the priority does not exist
+        """
+        return self.get_with_relations(priority_id, PRIORITY_DETAIL_RELATIONS, "p")
+
     @with_snapshot("delete", "priority")
     def delete_with_cascade(self, priority_id: int) -> bool:
         """Delete a priority and all its relationships.
@@ -191,6 +191,54 @@ class RelationshipModel(BaseModel):
             )
             raise
 
+    def delete_measure_area_priority_link_checked(
+        self, measure_id: int, area_id: int, priority_id: int
+    ) -> bool:
+        """Delete a measure-area-priority link if it exists, cascading to grants.
+
+        Unlike delete_measure_area_priority_link, no separate existence check
+        is needed: the parent DELETE uses RETURNING to report whether a link
+        was removed. Grants are deleted first (see the FK note on
+        delete_measure_area_priority_link); for a missing link that step
+        matches no rows.
+
+        Args:
+            measure_id: ID of the measure
+            area_id: ID of the area
+            priority_id: ID of the priority
+
+        Returns:
+            bool: True if a link was deleted, False if it did not exist
+
+        Raises:
+            duckdb.Error: If deletion fails
+        """
+        conn = db.get_connection()
+        params = [measure_id, area_id, priority_id]
+
+        try:
+            conn.execute(
+                """DELETE FROM measure_area_priority_grant
+                   WHERE measure_id = ? AND area_id = ? AND priority_id = ?""",
+                params,
+            )
+            deleted = conn.execute(
+                """DELETE FROM measure_area_priority
+                   WHERE measure_id = ? AND area_id = ? AND priority_id = ?
+                   RETURNING 1""",
+                params,
+            ).fetchall()
+        except duckdb.Error as e:
+            logger.error(
+                f"Failed to delete MAP link M{measure_id}-A{area_id}-P{priority_id}: {e}",
+                exc_info=True,
+            )
+            raise
+
+        if deleted:
+            logger.info(f"Deleted MAP link M{measure_id}-A{area_id}-P{priority_id}")
+        return bool(deleted)
+
     def get_areas_for_measure(self, measure_id: int) -> pl.DataFrame:
         """Get all area-priority combinations for a measure.
 
@@ -686,8 +734,8 @@ class RelationshipModel(BaseModel):
     ) -> tuple[int, list[str]]:
         """Create multiple measure-area-priority links atomically (Cartesian product).
 
-        All links are created in a single transaction - either all succeed or all fail.
-        Links that already exist are skipped.
+        Builds every combination with a Polars cross join and hands the frame to
+        bulk_create_measure_area_priority_links_df.
 
         Args:
             measure_ids: List of measure IDs
@@ -700,39 +748,89 @@ class RelationshipModel(BaseModel):
         Raises:
             duckdb.Error: If transaction fails (all changes rolled back)
         """
-        queries = []
-        skipped = []
-
-        # Generate all combinations (Cartesian product)
-        for measure_id in measure_ids:
-            for area_id in area_ids:
-                for priority_id in priority_ids:
-                    # Check if link already exists
-                    if self.link_exists_measure_area_priority(
-                        measure_id, area_id, priority_id
-                    ):
-                        skipped.append(
-                            f"Link already exists: M{measure_id}-A{area_id}-P{priority_id}"
-                        )
-                    else:
-                        queries.append(
-                            (
-                                "INSERT INTO measure_area_priority (measure_id, area_id, priority_id) VALUES (?, ?, ?)",
-                                [measure_id, area_id, priority_id],
-                            )
-                        )
-
-        if not queries:
+        combos = (
+            pl.DataFrame({"measure_id": measure_ids})
+            .join(pl.DataFrame({"area_id": area_ids}), how="cross")
+            .join(pl.DataFrame({"priority_id": priority_ids}), how="cross")
+        )
+        return self.bulk_create_measure_area_priority_links_df(combos)
+
+    def bulk_create_measure_area_priority_links_df(
+        self, combos: pl.DataFrame
+    ) -> tuple[int, list[str]]:
+        """Create measure-area-priority links from a frame of ID combinations.
+
+        Existing links are found with one query and every new link is inserted
+        with a single INSERT ... SELECT, run in a transaction so either all
+        links are created or none are. Links that already exist are skipped.
+
+        Args:
+            combos: Frame with measure_id, area_id and priority_id columns
+
+        Returns:
+            tuple: (number of links created, list of skipped/error messages)
+
+        Raises:
+            duckdb.Error: If transaction fails (all changes rolled back)
+        """
+        combos = combos.select(["measure_id", "area_id", "priority_id"]).unique(
+            maintain_order=True
+        )
+        if combos.is_empty():
+            return 0, []
+
+        # The combinations are passed as three parallel lists and unnested
+        # side by side, so the whole batch is a single set of parameters
+        combos_cte = """
+            WITH combos AS (
+                SELECT
+                    unnest(?::INTEGER[]) AS measure_id,
+                    unnest(?::INTEGER[]) AS area_id,
+                    unnest(?::INTEGER[]) AS priority_id
+            )
+        """
+        parameters = [
+            combos["measure_id"].to_list(),
+            combos["area_id"].to_list(),
+            combos["priority_id"].to_list(),
+        ]
+
+        existing = self.execute_raw_query(
+            f"""{combos_cte}
+            SELECT c.measure_id, c.area_id, c.priority_id
+            FROM combos c
+            JOIN measure_area_priority map
+                USING (measure_id, area_id, priority_id)
+            """,
+            parameters,
+        ).fetchall()
+        skipped = [f"Link already exists: M{m}-A{a}-P{p}" for m, a, p in existing]
+
+        to_create = len(combos) - len(existing)
+        if to_create == 0:
             logger.info("No new MAP links to create (all already exist)")
             return 0, skipped
 
+        insert_query = f"""{combos_cte}
+            INSERT INTO measure_area_priority (measure_id, area_id, priority_id)
+            SELECT c.measure_id, c.area_id, c.priority_id
+            FROM combos c
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM measure_area_priority map
+                WHERE map.measure_id = c.measure_id
+                    AND map.area_id = c.area_id
+                    AND map.priority_id = c.priority_id
+            )
+        """
+
         try:
-            db.execute_transaction(queries)
+            db.execute_transaction([(insert_query, parameters)])
             logger.info(
-                f"Successfully created {len(queries)} MAP links in bulk "
+                f"Successfully created {to_create} MAP links in bulk "
                 f"({len(skipped)} skipped as duplicates)"
             )
-            return len(queries), skipped
+            return to_create, skipped
         except duckdb.Error as e:
             logger.error(
                 f"Failed to bulk create MAP links: {e}. Transaction rolled back.",
@@ -1,6 +1,7 @@
 """Species entity model for biodiversity species."""
 
 import logging
+from collections.abc import Sequence
 
 import duckdb
 import polars as pl
@@ -10,6 +11,38 @@ from models.base import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# Text columns matched by SpeciesModel.search
+SPECIES_SEARCH_COLUMNS = ("common_name", "scientific_name", "assemblage", "taxa")
+
+# Relationships shown on the species detail page: name -> (subquery correlated
+# on s.species_id, ORDER BY over its rows). Each matches the get_related_*
+# method of the same name.
+SPECIES_DETAIL_RELATIONS: dict[str, tuple[str, str]] = {
+    "measures": (
+        """SELECT DISTINCT m.measure_id, m.measure, m.concise_measure,
+            m.core_supplementary
+        FROM measure m
+        JOIN measure_has_species mhs ON m.measure_id = mhs.measure_id
+        WHERE mhs.species_id = s.species_id""",
+        "r.measure_id",
+    ),
+    "areas": (
+        """SELECT DISTINCT a.area_id, a.area_name, a.area_description
+        FROM area a
+        JOIN species_area_priority sap ON a.area_id = sap.area_id
+        WHERE sap.species_id = s.species_id""",
+        "r.area_name",
+    ),
+    "priorities": (
+        """SELECT DISTINCT p.priority_id, p.biodiversity_priority,
+            p.simplified_biodiversity_priority, p.theme
+        FROM priority p
+        JOIN species_area_priority sap ON p.priority_id = sap.priority_id
+        WHERE sap.species_id = s.species_id""",
+        "r.theme, r.biodiversity_priority",
+    ),
+}
+
 
 class SpeciesModel(BaseModel):
     """Model for managing species entities."""
@@ -22,6 +55,40 @@ class SpeciesModel(BaseModel):
     def id_column(self) -> str:
         return "species_id"
 
+    def search(
+        self, term: str, columns: Sequence[str] | None = None
+    ) -> pl.DataFrame:
+        """Search species in the database.
+
+        Matches the term case-insensitively as a literal substring of any
+        column in SPECIES_SEARCH_COLUMNS, so only matching rows are read.
+
+        Args:
+            term: Search text
+            columns: Columns to select, in order (None = all columns)
+
+        Returns:
+            pl.DataFrame: Matching species ordered by common name
+        """
+        projection = (
+            ", ".join(f'"{column}"' for column in columns) if columns else "*"
+        )
+        predicate = " OR ".join(
+            f"contains(lower({column}), ?)" for column in SPECIES_SEARCH_COLUMNS
+        )
+        query = f"""
+            SELECT {projection}
+            FROM species
+            WHERE {predicate}
+            ORDER BY common_name
+        """  # noqa: S608 - only static column names are interpolated
+
+        needle = term.strip().lower()
+        result = self.execute_raw_query(
+            query, [needle] * len(SPECIES_SEARCH_COLUMNS)
+        )
+        return result.pl()
+
     def get_related_measures(self, species_id: int) -> pl.DataFrame:
         """Get measures linked to this species.
 
@@ -96,21 +163,45 @@ class SpeciesModel(BaseModel):
     def get_relationship_counts(self, species_id: int) -> dict[str, int]:
         """Get counts of all related entities for a species.
 
+        All three counts are returned by a single query using scalar
+        subqueries, without fetching the related rows.
+
         Args:
             species_id: ID of the species
 
         Returns:
             dict: Entity name -> count
         """
-        measures = self.get_related_measures(species_id)
-        areas = self.get_related_areas(species_id)
-        priorities = self.get_related_priorities(species_id)
-
-        return {
-            "measures": len(measures),
-            "areas": len(areas),
-            "priorities": len(priorities),
-        }
+        query = """
+            SELECT
+                (SELECT COUNT(DISTINCT measure_id)
+                 FROM measure_has_species
+                 WHERE species_id = ?) as measures,
+                (SELECT COUNT(DISTINCT area_id)
+                 FROM species_area_priority
+                 WHERE species_id = ?) as areas,
+                (SELECT COUNT(DISTINCT priority_id)
+                 FROM species_area_priority
+                 WHERE species_id = ?) as priorities
+        """
+
+        result = self.execute_raw_query(query, [species_id] * 3)
+        row = result.fetchone()
+        columns = [desc[0] for desc in result.description]
+        return dict(zip(columns, row, strict=True))
+
+    def get_detail_bundle(self, species_id: int) -> dict | None:
+        """Get a species record together with its related entities.
+
+        Args:
+            species_id: ID of the species
+
+        Returns:
+            dict: {"data": record dict, "measures": DataFrame, "areas":
+                DataFrame, "priorities": DataFrame, "counts": dict},
+                or None if the species does not exist
+        """
+        return self.get_with_relations(species_id, SPECIES_DETAIL_RELATIONS, "s")
 
     @with_snapshot("delete", "species")
     def delete_with_cascade(self, species_id: int) -> bool:
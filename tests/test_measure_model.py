@@ -0,0 +1,98 @@
+"""Tests for MeasureModel read queries.
+
+This module checks that the consolidated detail queries return the same
+data as the individual relationship getters they replace.
+"""
+
+import logging
+
+import pytest
+
+from models.measure import Measure, MeasureModel
+
+logger = logging.getLogger(__name__)
+
+
+def _measure_with_relationships(conn) -> int:
+    """Return the ID of a measure linked to at least one area."""
+    existing = conn.execute(
+        "SELECT measure_id FROM measure_area_priority ORDER BY measure_id LIMIT 1"
+    ).fetchone()
+    if not existing:
+        pytest.skip("No measures with relationships found for testing")
+    return existing[0]
+
+
+def test_detail_bundle_matches_individual_getters(test_db):
+    """Test get_detail_bundle returns the same rows as the individual getters.
+
+    The bundle projects only displayed columns, so the getter results are
+    narrowed to the bundle's columns before comparing.
+    """
+    measure_model = MeasureModel()
+    measure_id = _measure_with_relationships(test_db.get_connection())
+
+    bundle = measure_model.get_detail_bundle(measure_id)
+    assert bundle is not None
+
+    record = measure_model.get_by_id(measure_id)
+    assert bundle["measure"] == Measure.from_record(record)
+
+    getters = {
+        "types": measure_model.get_types,
+        "stakeholders": measure_model.get_stakeholders,
+        "areas": measure_model.get_related_areas,
+        "priorities": measure_model.get_related_priorities,
+        "grants": measure_model.get_related_grants,
+        "species": measure_model.get_related_species,
+        "benefits": measure_model.get_benefits,
+    }
+    for name, getter in getters.items():
+        expected = getter(measure_id)
+        assert set(bundle[name].columns) <= set(expected.columns), name
+        expected = expected.select(bundle[name].columns)
+        assert bundle[name].rows() == expected.rows(), name
+        assert bundle["counts"][name] == len(expected), name
+
+    logger.info(f"Detail bundle for measure {measure_id}: {bundle['counts']}")
+
+
+def test_detail_bundle_missing_measure(test_db):
+    """Test get_detail_bundle returns None for an unknown measure."""
+    measure_model = MeasureModel()
+
+    assert measure_model.get_detail_bundle(-1) is None
+
+
+def test_relationship_counts_match_detail_bundle(test_db):
+    """Test the single-query relationship counts agree with the bundle."""
+    measure_model = MeasureModel()
+    measure_id = _measure_with_relationships(test_db.get_connection())
+
+    counts = measure_model.get_relationship_counts(measure_id)
+    bundle = measure_model.get_detail_bundle(measure_id)
+
+    assert counts == bundle["counts"]
+
+
+def test_search_with_counts_matches_in_memory_filter(test_db):
+    """Test the SQL search returns the same measures as filtering the full list."""
+    measure_model = MeasureModel()
+    all_measures = measure_model.get_with_relationship_counts()
+    if all_measures.is_empty():
+        pytest.skip("No measures found for testing")
+
+    term = "Hedgerow"
+    results = measure_model.search_with_counts(term)
+
+    needle = term.lower()
+    expected = [
+        row["measure_id"]
+        for row in all_measures.iter_rows(named=True)
+        if any(
+            needle in (row[col] or "").lower()
+            for col in ("measure", "concise_measure", "types", "stakeholders")
+        )
+    ]
+    assert results["measure_id"].to_list() == expected
+    assert results.columns == all_measures.columns
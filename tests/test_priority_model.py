@@ -0,0 +1,86 @@
+"""Tests for PriorityModel queries.
+
+This module checks the priority model's single-statement create and read
+helpers against the data they replace.
+"""
+
+import logging
+
+import polars as pl
+import pytest
+
+from models.priority import PriorityModel
+
+logger = logging.getLogger(__name__)
+
+
+def test_create_with_next_id_allocates_next_priority_id(test_db):
+    """Test create_with_next_id inserts with MAX(priority_id) + 1."""
+    priority_model = PriorityModel()
+    conn = test_db.get_connection()
+
+    max_id = conn.execute("SELECT MAX(priority_id) FROM priority").fetchone()[0]
+
+    new_id = priority_model.create_with_next_id(
+        {
+            "biodiversity_priority": "Test priority",
+            "simplified_biodiversity_priority": None,
+            "theme": "Woodland",
+        }
+    )
+
+    assert new_id == (max_id or 0) + 1
+    created = priority_model.get_by_id(new_id)
+    assert created["biodiversity_priority"] == "Test priority"
+    assert created["theme"] == "Woodland"
+
+    logger.info(f"Created priority {new_id}")
+
+
+def test_get_all_clean_theme_matches_polars_cleaning(test_db):
+    """Test the SQL theme cleaning matches the previous Polars cleaning."""
+    priority_model = PriorityModel()
+
+    cleaned = priority_model.get_all_clean_theme()
+    expected = priority_model.get_all(order_by="priority_id").with_columns(
+        pl.col("theme").str.strip_chars().str.replace_all("\xa0", "")
+    )
+
+    assert cleaned.columns == expected.columns
+    assert cleaned.sort("priority_id").rows() == expected.rows()
+
+
+def test_detail_bundle_matches_individual_getters(test_db):
+    """Test get_detail_bundle returns the same rows as the individual getters."""
+    priority_model = PriorityModel()
+    conn = test_db.get_connection()
+
+    existing = conn.execute(
+        "SELECT priority_id FROM measure_area_priority ORDER BY priority_id LIMIT 1"
+    ).fetchone()
+    if not existing:
+        pytest.skip("No priorities with relationships found for testing")
+    priority_id = existing[0]
+
+    bundle = priority_model.get_detail_bundle(priority_id)
+    assert bundle is not None
+    assert bundle["data"] == priority_model.get_by_id(priority_id)
+
+    getters = {
+        "measures": priority_model.get_related_measures,
+        "areas": priority_model.get_related_areas,
+        "species": priority_model.get_related_species,
+    }
+    for name, getter in getters.items():
+        expected = getter(priority_id)
+        assert bundle[name].columns == expected.columns, name
+        assert bundle[name].rows() == expected.rows(), name
+
+    assert bundle["counts"] == priority_model.get_relationship_counts(priority_id)
+
+
+def test_detail_bundle_missing_priority(test_db):
+    """Test get_detail_bundle returns None for an unknown priority."""
+    priority_model = PriorityModel()
+
+    assert priority_model.get_detail_bundle(-1) is None
@@ -0,0 +1,101 @@
+"""Tests for RelationshipModel link operations.
+
+This module checks the single-statement link helpers against the row counts
+they are expected to change.
+"""
+
+import logging
+
+import duckdb
+import polars as pl
+import pytest
+
+from models.relationship import RelationshipModel
+
+logger = logging.getLogger(__name__)
+
+
+def test_delete_map_link_checked_reports_existence(test_db):
+    """Test the checked delete removes an existing link and reports a missing one."""
+    model = RelationshipModel()
+    conn = test_db.get_connection()
+
+    existing = conn.execute(
+        "SELECT measure_id, area_id, priority_id FROM measure_area_priority LIMIT 1"
+    ).fetchone()
+    if not existing:
+        pytest.skip("No measure-area-priority links found for testing")
+    measure_id, area_id, priority_id = existing
+
+    assert model.delete_measure_area_priority_link_checked(
+        measure_id, area_id, priority_id
+    )
+    assert not model.link_exists_measure_area_priority(
+        measure_id, area_id, priority_id
+    )
+    assert not model.delete_measure_area_priority_link_checked(
+        measure_id, area_id, priority_id
+    )
+
+    logger.info(f"Deleted MAP link M{measure_id}-A{area_id}-P{priority_id}")
+
+
+def test_bulk_create_skips_existing_links(test_db):
+    """Test bulk create inserts new combinations and skips existing links."""
+    model = RelationshipModel()
+    conn = test_db.get_connection()
+
+    existing = conn.execute(
+        "SELECT measure_id, area_id, priority_id FROM measure_area_priority LIMIT 1"
+    ).fetchone()
+    if not existing:
+        pytest.skip("No measure-area-priority links found for testing")
+    measure_id, area_id, priority_id = existing
+
+    # Remove the link, then bulk create it alongside a duplicate of itself
+    # and the already existing combinations for the same measure and area
+    model.delete_measure_area_priority_link_checked(*existing)
+    others = conn.execute(
+        """
+        SELECT priority_id FROM measure_area_priority
+        WHERE measure_id = ? AND area_id = ?
+        """,
+        [measure_id, area_id],
+    ).fetchall()
+    priority_ids = [priority_id, priority_id] + [row[0] for row in others]
+
+    created, skipped = model.bulk_create_measure_area_priority_links(
+        [measure_id], [area_id], priority_ids
+    )
+
+    assert created == 1
+    assert len(skipped) == len(others)
+    assert model.link_exists_measure_area_priority(*existing)
+
+
+def test_bulk_create_is_atomic(test_db):
+    """Test a failing combination rolls back every link in the bulk create."""
+    model = RelationshipModel()
+    conn = test_db.get_connection()
+
+    existing = conn.execute(
+        "SELECT measure_id, area_id, priority_id FROM measure_area_priority LIMIT 1"
+    ).fetchone()
+    if not existing:
+        pytest.skip("No measure-area-priority links found for testing")
+
+    # One valid new link and one that violates the measure foreign key
+    model.delete_measure_area_priority_link_checked(*existing)
+    combos = pl.DataFrame(
+        [existing, (-1, existing[1], existing[2])],
+        schema=["measure_id", "area_id", "priority_id"],
+        orient="row",
+    )
+    before = conn.execute("SELECT COUNT(*) FROM measure_area_priority").fetchone()[0]
+
+    with pytest.raises(duckdb.Error):
+        model.bulk_create_measure_area_priority_links_df(combos)
+
+    after = conn.execute("SELECT COUNT(*) FROM measure_area_priority").fetchone()[0]
+    assert after == before
+    assert not model.link_exists_measure_area_priority(*existing)
@@ -0,0 +1,159 @@
+"""Tests for SpeciesModel queries.
+
+This module checks the species list projection, single-statement create and
+consolidated detail query against the reads they replace.
+"""
+
+import logging
+
+import pytest
+
+from models.species import SPECIES_SEARCH_COLUMNS, SpeciesModel
+
+logger = logging.getLogger(__name__)
+
+
+def test_get_all_projects_requested_columns(test_db):
+    """Test get_all(columns=...) selects only those columns, in order."""
+    species_model = SpeciesModel()
+    # "class" and "order" are reserved words and must be quoted
+    columns = ["species_id", "common_name", "class", "order"]
+
+    projected = species_model.get_all(order_by="species_id", columns=columns)
+    expected = species_model.get_all(order_by="species_id").select(columns)
+
+    assert projected.columns == columns
+    assert projected.rows() == expected.rows()
+
+
+def test_create_with_next_id_allocates_next_species_id(test_db):
+    """Test create_with_next_id inserts with MAX(species_id) + 1."""
+    species_model = SpeciesModel()
+    conn = test_db.get_connection()
+
+    max_id = conn.execute("SELECT MAX(species_id) FROM species").fetchone()[0]
+
+    new_id = species_model.create_with_next_id(
+        {
+            "common_name": "Test species",
+            "scientific_name": "Testus speciesus",
+            "linnaean_name": "Testus speciesus",
+            "assemblage": "Birds",
+            "taxa": "Bird",
+            "class": "Aves",
+            "order": "Passeriformes",
+        }
+    )
+
+    assert new_id == (max_id or 0) + 1
+    created = species_model.get_by_id(new_id)
+    assert created["common_name"] == "Test species"
+    assert created["order"] == "Passeriformes"
+
+    logger.info(f"Created species {new_id}")
+
+
+def test_detail_bundle_matches_individual_getters(test_db):
+    """Test get_detail_bundle returns the same rows as the individual getters."""
+    species_model = SpeciesModel()
+    conn = test_db.get_connection()
+
+    existing = conn.execute(
+        "SELECT species_id FROM species_area_priority ORDER BY species_id LIMIT 1"
+    ).fetchone()
+    if not existing:
+        pytest.skip("No species with relationships found for testing")
+    species_id = existing[0]
+
+    bundle = species_model.get_detail_bundle(species_id)
+    assert bundle is not None
+    assert bundle["data"] == species_model.get_by_id(species_id)
+
+    getters = {
+        "measures": species_model.get_related_measures,
+        "areas": species_model.get_related_areas,
+        "priorities": species_model.get_related_priorities,
+    }
+    for name, getter in getters.items():
+        expected = getter(species_id)
+        assert bundle[name].columns == expected.columns, name
+        assert bundle[name].rows() == expected.rows(), name
+
+    assert bundle["counts"] == species_model.get_relationship_counts(species_id)
+
+    logger.info(f"Detail bundle for species {species_id}: {bundle['counts']}")
+
+
+def test_detail_bundle_missing_species(test_db):
+    """Test get_detail_bundle returns None for an unknown species."""
+    species_model = SpeciesModel()
+
+    assert species_model.get_detail_bundle(-1) is None
+
+
+def test_search_matches_in_memory_filter(test_db):
+    """Test search returns the same rows as filtering the full list."""
+    species_model = SpeciesModel()
+    columns = ["species_id", "common_name", "scientific_name"]
+
+    term = "  BIRD "
+    needle = term.strip().lower()
+    all_species = species_model.get_all(order_by="common_name")
+    expected_ids = {
+        row["species_id"]
+        for row in all_species.iter_rows(named=True)
+        if any(
+            needle in (row[column] or "").lower()
+            for column in SPECIES_SEARCH_COLUMNS
+        )
+    }
+
+    results = species_model.search(term, columns=columns)
+
+    assert results.columns == columns
+    assert set(results["species_id"].to_list()) == expected_ids
+
+    logger.info(f"Search '{needle}' matched {results.height} species")
+
+
+def test_get_all_pages_cover_full_list(test_db):
+    """Test LIMIT/OFFSET pages of get_all reassemble the full ordered list."""
+    species_model = SpeciesModel()
+    order_by = "common_name, species_id"
+    page_size = 7
+
+    full = species_model.get_all(order_by=order_by, columns=["species_id"])
+    pages = [
+        species_model.get_all(
+            limit=page_size,
+            offset=offset,
+            order_by=order_by,
+            columns=["species_id"],
+        )
+        for offset in range(0, full.height, page_size)
+    ]
+
+    assert all(page.height <= page_size for page in pages)
+    paged_ids = [sid for page in pages for sid in page["species_id"].to_list()]
+    assert paged_ids == full["species_id"].to_list()
+
+
+def test_relationship_counts_match_related_rows(test_db):
+    """Test the single count query agrees with the related-row getters."""
+    species_model = SpeciesModel()
+    conn = test_db.get_connection()
+
+    existing = conn.execute(
+        "SELECT species_id FROM measure_has_species ORDER BY species_id LIMIT 1"
+    ).fetchone()
+    if not existing:
+        pytest.skip("No species with measures found for testing")
+    species_id = existing[0]
+
+    counts = species_model.get_relationship_counts(species_id)
+
+    assert counts == {
+        "measures": len(species_model.get_related_measures(species_id)),
+        "areas": len(species_model.get_related_areas(species_id)),
+        "priorities": len(species_model.get_related_priorities(species_id)),
+    }
@@ -0,0 +1,132 @@
+"""Smoke tests for the species page.
+
+This module drives ui/pages/species.py with Streamlit's AppTest to check the
+detail view renders and the create, update and delete forms write through
+to the database.
+"""
+
+import logging
+from pathlib import Path
+
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from models.species import SpeciesModel
+
+logger = logging.getLogger(__name__)
+
+SPECIES_PAGE = Path(__file__).parent.parent / "ui" / "pages" / "species.py"
+
+
+@pytest.fixture
+def species_page(test_db):
+    """AppTest for the species page, with Streamlit caches cleared.
+
+    Args:
+        test_db: Test database connection (from fixture)
+
+    Returns:
+        AppTest: Species page test harness (not yet run)
+    """
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    return AppTest.from_file(str(SPECIES_PAGE), default_timeout=30)
+
+
+def click(at: AppTest, label: str) -> None:
+    """Click the button with the given label and rerun the page.
+
+    Args:
+        at: Page under test
+        label: Button label
+    """
+    next(button for button in at.button if button.label == label).click().run()
+
+
+def open_detail_view(at: AppTest, species_id: int) -> None:
+    """Run the page on the detail view of a species.
+
+    Args:
+        at: Page under test
+        species_id: ID of the species to show
+    """
+    at.session_state["species_view"] = "detail"
+    at.session_state["selected_species_id"] = species_id
+    at.run()
+
+
+def test_detail_view_renders(species_page, test_db):
+    """Test the detail view shows a species and its relationship counts."""
+    conn = test_db.get_connection()
+    species_id, common_name = conn.execute(
+        "SELECT species_id, common_name FROM species ORDER BY species_id LIMIT 1"
+    ).fetchone()
+
+    open_detail_view(species_page, species_id)
+
+    assert not species_page.exception
+    assert not species_page.error
+    markdown = [element.value for element in species_page.markdown]
+    assert f"**Common Name:** {common_name}" in markdown
+    assert any("**Relationship Counts:**" in text for text in markdown)
+
+
+def test_create_species(species_page):
+    """Test the create form inserts a species and returns to the list."""
+    species_page.run()
+    click(species_page, "➕ Create New Species")
+
+    inputs = {text_input.label: text_input for text_input in species_page.text_input}
+    inputs["Common Name*"].set_value("Smoke test species")
+    inputs["Scientific Name*"].set_value("Fumus testus")
+    click(species_page, "Create Species")
+
+    assert not species_page.exception
+    assert not species_page.error
+    created = SpeciesModel().search("Smoke test species")
+    assert created.height == 1
+    assert created["scientific_name"].to_list() == ["Fumus testus"]
+
+    logger.info(f"Created species {created['species_id'][0]} through the page")
+
+
+def test_update_species(species_page, test_db):
+    """Test the edit form on the detail view updates the species."""
+    conn = test_db.get_connection()
+    species_id = conn.execute("SELECT MIN(species_id) FROM species").fetchone()[0]
+
+    open_detail_view(species_page, species_id)
+    click(species_page, "✏️ Edit")
+
+    inputs = {text_input.label: text_input for text_input in species_page.text_input}
+    inputs["Common Name*"].set_value("Renamed species")
+    click(species_page, "Update Species")
+
+    assert not species_page.exception
+    assert not species_page.error
+    assert SpeciesModel().get_by_id(species_id)["common_name"] == "Renamed species"
+    markdown = [element.value for element in species_page.markdown]
+    assert "**Common Name:** Renamed species" in markdown
+
+
+def test_delete_species(species_page, test_db):
+    """Test the delete confirmation removes the species and its links."""
+    conn = test_db.get_connection()
+    species_id = conn.execute(
+        "SELECT species_id FROM species_area_priority ORDER BY species_id LIMIT 1"
+    ).fetchone()[0]
+
+    open_detail_view(species_page, species_id)
+    click(species_page, "🗑️ Delete")
+    click(species_page, "🗑️ Delete Species")
+
+    assert not species_page.exception
+    assert not species_page.error
+    assert species_page.session_state["species_view"] == "list"
+    assert SpeciesModel().get_by_id(species_id) is None
+    remaining = conn.execute(
+        "SELECT COUNT(*) FROM species_area_priority WHERE species_id = ?",
+        [species_id],
+    ).fetchone()[0]
+    assert remaining == 0
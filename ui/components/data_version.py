@@ -0,0 +1,26 @@
+"""Shared data version stamp for data kept in session state.
+
+Pages that pin a loaded frame in session state store the stamp alongside
+it and reload when the stamp changes. The stamp is itself a cached value,
+so it changes whenever st.cache_data is cleared (refresh, database switch,
+restore) or when a page that writes data calls bump_data_version().
+"""
+
+import uuid
+
+import streamlit as st
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_data_version() -> str:
+    """Get the current data version stamp (cached for 5 minutes).
+
+    Returns:
+        str: Opaque stamp, shared by all sessions until the data changes
+    """
+    return uuid.uuid4().hex
+
+
+def bump_data_version() -> None:
+    """Mark data pinned in session state as stale after a write."""
+    get_data_version.clear()
@@ -12,8 +12,9 @@ import polars as pl
 import streamlit as st
 
 # Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 
 def display_data_table(
@@ -25,6 +26,8 @@ def display_data_table(
     column_config: dict[str, Any] | None = None,
     show_actions: bool = True,
     on_view_details: Callable[[Any], None] | None = None,
+    search_fn: Callable[[str], pl.DataFrame] | None = None,
+    total_count: int | None = None,
 ) -> None:
     """Display a data table with search and actions.
 
@@ -37,19 +40,24 @@ def display_data_table(
         column_config: Streamlit column configuration dict
         show_actions: Whether to show action buttons
         on_view_details: Callback function for view details action
+        search_fn: Optional callback returning the rows matching a search term,
+            used instead of filtering ``data`` in memory (e.g. a model query)
+        total_count: Total number of records when ``data`` is a single page
+            (None = ``len(data)``)
     """
     st.subheader(title)
 
     # Display count
-    total_count = len(data)
+    if total_count is None:
+        total_count = len(data)
     st.caption(f"Total records: {total_count:,}")
 
     if total_count == 0:
         st.info("No records found.")
         return
 
-    # Convert to pandas for st.dataframe
-    df_pandas = data.to_pandas()
+    # st.dataframe renders polars natively, so no pandas copy is made
+    display_df = data
 
     # Search functionality
     search_key = f"{entity_name}_search"
@@ -60,20 +68,28 @@ def display_data_table(
             placeholder=f"Search in {', '.join(searchable_columns)}...",
         )
 
-        if search_term:
-            # Filter dataframe based on search term
-            mask = pl.lit(False)
-            for col in searchable_columns:
-                if col in data.columns:
-                    mask = mask | data[col].cast(str).str.contains(f"(?i){search_term}")
-
-            data_filtered = data.filter(mask)
-            df_pandas = data_filtered.to_pandas()
-            st.caption(f"Showing {len(df_pandas)} of {total_count} records")
-
-    # Display table
-    if column_config is None:
-        column_config = {}
+        if search_term and search_fn is not None:
+            # Delegate the search to the caller (typically pushed down to SQL)
+            display_df = search_fn(search_term)
+            st.caption(f"Showing {len(display_df)} of {total_count} records")
+        elif search_term:
+            # Case-insensitive literal match across all searchable columns,
+            # evaluated as a single vectorised filter expression
+            needle = search_term.lower()
+            predicates = [
+                pl.col(col)
+                .cast(pl.String)
+                .str.to_lowercase()
+                .str.contains(needle, literal=True)
+                for col in searchable_columns
+                if col in data.columns
+            ]
+            if predicates:
+                display_df = data.filter(pl.any_horizontal(predicates))
+            st.caption(f"Showing {len(display_df)} of {total_count} records")
+
+    # Display table - copy so shared module-level configs are never mutated
+    column_config = dict(column_config) if column_config else {}
 
     # Add ID column config if not specified
     if id_column not in column_config:
@@ -88,7 +104,7 @@ def display_data_table(
 
         selection_key = f"{entity_name}_table_selection"
         event = st.dataframe(
-            df_pandas,
+            display_df,
             width="stretch",
             hide_index=True,
             column_config=column_config,
@@ -100,8 +116,8 @@ def display_data_table(
         # Check if a row was selected
         if event.selection.rows:
             selected_row_idx = event.selection.rows[0]
-            selected_id = df_pandas.iloc[selected_row_idx][id_column]
-            # Convert numpy types to Python native types for DuckDB compatibility
+            selected_id = display_df.item(selected_row_idx, id_column)
+            # Normalise to Python int/str for DuckDB compatibility
             # Handle both integer and string IDs
             try:
                 # Try to convert to int for numeric IDs
@@ -114,13 +130,87 @@ def display_data_table(
     else:
         # No actions, just display the table
         st.dataframe(
-            df_pandas,
+            display_df,
             width="stretch",
             hide_index=True,
             column_config=column_config,
         )
 
 
+def get_page(param: str, row_count: int, page_size: int) -> int:
+    """Get the current page of a paginated table from the URL.
+
+    Invalid or out-of-range values (e.g. after a filter change shrinks the
+    table) are clamped to the nearest valid page.
+
+    Args:
+        param: Query parameter holding the page number, e.g. "map_page"
+        row_count: Number of rows in the (filtered) table
+        page_size: Rows per page
+
+    Returns:
+        int: Zero-based page number
+    """
+    last_page = max((row_count - 1) // page_size, 0)
+    try:
+        page = int(st.query_params.get(param, 0))
+    except ValueError:
+        page = 0
+    return min(max(page, 0), last_page)
+
+
+def set_page(param: str, page: int) -> None:
+    """Store the page of a paginated table in the URL.
+
+    Args:
+        param: Query parameter holding the page number
+        page: Zero-based page number
+    """
+    st.query_params[param] = str(page)
+
+
+def show_pagination_controls(
+    param: str, page: int, row_count: int, page_size: int
+) -> None:
+    """Display Previous/Next buttons for a paginated table.
+
+    Nothing is shown when the table fits on a single page.
+
+    Args:
+        param: Query parameter holding the page number (also the widget key prefix)
+        page: Zero-based page number currently displayed
+        row_count: Number of rows in the (filtered) table
+        page_size: Rows per page
+    """
+    page_count = (row_count - 1) // page_size + 1
+    if page_count <= 1:
+        return
+
+    prev_col, page_col, next_col = st.columns([1, 2, 1])
+    with prev_col:
+        st.button(
+            "← Previous",
+            key=f"{param}_prev",
+            disabled=page == 0,
+            on_click=set_page,
+            args=(param, page - 1),
+        )
+    with page_col:
+        first_row = page * page_size + 1
+        last_row = min(first_row + page_size - 1, row_count)
+        st.caption(
+            f"Page {page + 1} of {page_count} (rows {first_row:,}-{last_row:,})"
+        )
+    with next_col:
+        st.button(
+            "Next →",
+            key=f"{param}_next",
+            disabled=page >= page_count - 1,
+            on_click=set_page,
+            args=(param, page + 1),
+        )
+
+
 def display_grouped_table(
     data: pl.DataFrame,
     title: str,
@@ -148,7 +238,7 @@ def display_grouped_table(
                 group_data = group_data.select(display_columns)
 
             st.dataframe(
-                group_data.to_pandas(),
+                group_data,
                 width="stretch",
                 hide_index=True,
             )
@@ -213,11 +303,11 @@ def display_detail_view(
         # Create tabs for each relationship
         tabs = st.tabs(list(relationships.keys()))
 
-        for tab, (rel_name, rel_data) in zip(tabs, relationships.items()):
+        for tab, (rel_name, rel_data) in zip(tabs, relationships.items(), strict=True):
             with tab:
                 if len(rel_data) > 0:
                     st.dataframe(
-                        rel_data.to_pandas(),
+                        rel_data,
                         width="stretch",
                         hide_index=True,
                     )
@@ -252,7 +342,7 @@ def create_filter_widgets(
 
     cols = st.columns(len(filter_configs))
 
-    for col, (col_name, config) in zip(cols, filter_configs.items()):
+    for col, (col_name, config) in zip(cols, filter_configs.items(), strict=True):
         with col:
             filter_type = config.get("type", "selectbox")
             options = config.get("options", [])
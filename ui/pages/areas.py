@@ -8,10 +8,12 @@ from urllib.parse import urlparse
 import streamlit as st
 
 # Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from models.area import AreaModel  # noqa: E402
+from ui.components.data_version import bump_data_version  # noqa: E402
 from ui.components.tables import display_data_table  # noqa: E402
 
 # Initialize model
@@ -121,6 +123,7 @@ def show_create_form():
                         "bng_hab_creation": None,
                     }
                 )
+                bump_data_version()
                 st.success(f"✅ Successfully created area ID {next_id}!")
                 st.session_state.show_create_form = False
                 st.rerun()
@@ -188,6 +191,7 @@ def show_edit_form(area_id: int):
                         else None,
                     },
                 )
+                bump_data_version()
                 st.success(f"✅ Successfully updated area ID {area_id}!")
                 st.session_state.show_edit_form = False
                 st.rerun()
@@ -235,6 +239,7 @@ def show_delete_confirmation(area_id: int):
         if st.button("🗑️ Delete Area", type="primary", width="stretch"):
             try:
                 area_model.delete_with_cascade(area_id)
+                bump_data_version()
                 # Store success message to show after rerun
                 st.session_state.delete_success_message = f"Successfully deleted area ID {area_id}!"
                 st.session_state.show_delete_confirm = False
@@ -467,7 +472,7 @@ def show_detail_view():
     with tab1:
         if len(related_measures) > 0:
             st.dataframe(
-                related_measures.to_pandas(),
+                related_measures,
                 width="stretch",
                 hide_index=True,
                 column_config={
@@ -488,7 +493,7 @@ def show_detail_view():
     with tab2:
         if len(related_priorities) > 0:
             st.dataframe(
-                related_priorities.to_pandas(),
+                related_priorities,
                 width="stretch",
                 hide_index=True,
                 column_config={
@@ -509,7 +514,7 @@ def show_detail_view():
     with tab3:
         if len(related_species) > 0:
             st.dataframe(
-                related_species.to_pandas(),
+                related_species,
                 width="stretch",
                 hide_index=True,
                 column_config={
@@ -533,7 +538,7 @@ def show_detail_view():
     with tab4:
         if len(creation_habitats) > 0:
             st.dataframe(
-                creation_habitats.to_pandas(),
+                creation_habitats,
                 width="stretch",
                 hide_index=True,
                 column_config={
@@ -552,7 +557,7 @@ def show_detail_view():
     with tab5:
         if len(management_habitats) > 0:
             st.dataframe(
-                management_habitats.to_pandas(),
+                management_habitats,
                 width="stretch",
                 hide_index=True,
                 column_config={
@@ -571,7 +576,7 @@ def show_detail_view():
     with tab6:
         if len(funding_schemes) > 0:
             st.dataframe(
-                funding_schemes.to_pandas(),
+                funding_schemes,
                 width="stretch",
                 hide_index=True,
                 column_config={
@@ -13,8 +13,9 @@ import pandas as pd
 import streamlit as st
 
 # Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from config.backup import BackupManager  # noqa: E402
 
@@ -248,7 +249,7 @@ if st.session_state.preview_snapshot_id:
         measures_df = preview_conn.execute(
             "SELECT measure_id, measure_name FROM measure ORDER BY measure_id DESC LIMIT 10"
         ).df()
-        st.dataframe(measures_df, use_container_width=True)
+        st.dataframe(measures_df, width="stretch")
 
         preview_conn.close()
 
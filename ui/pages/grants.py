@@ -7,10 +7,12 @@ from urllib.parse import urlparse
 import streamlit as st
 
 # Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from models.grant import GrantModel  # noqa: E402
+from ui.components.data_version import bump_data_version  # noqa: E402
 from ui.components.tables import display_data_table  # noqa: E402
 
 # Initialize model
@@ -135,6 +137,7 @@ def show_create_form():
                         else None,
                     }
                 )
+                bump_data_version()
                 st.success(f"✅ Successfully created grant '{grant_id.strip()}'!")
                 st.session_state.show_create_form = False
                 st.rerun()
@@ -205,6 +208,7 @@ def show_edit_form(grant_id: str):
                         else None,
                     },
                 )
+                bump_data_version()
                 st.success(f"✅ Successfully updated grant '{grant_id}'!")
                 st.session_state.show_edit_form = False
                 st.rerun()
@@ -249,6 +253,7 @@ def show_delete_confirmation(grant_id: str):
         if st.button("🗑️ Delete Grant", type="primary", width="stretch"):
             try:
                 grant_model.delete_with_cascade(grant_id)
+                bump_data_version()
                 # Store success message to show after rerun
                 st.session_state.delete_success_message = f"Successfully deleted grant '{grant_id}'!"
                 st.session_state.show_delete_confirm = False
@@ -309,7 +314,7 @@ def show_list_view():
                 )
 
                 st.dataframe(
-                    grants_display.to_pandas(),
+                    grants_display,
                     width="stretch",
                     hide_index=True,
                     column_config={
@@ -440,7 +445,7 @@ def show_detail_view():
 
     if len(related_measures) > 0:
         st.dataframe(
-            related_measures.to_pandas(),
+            related_measures,
             width="stretch",
             hide_index=True,
             column_config={
@@ -6,10 +6,12 @@ from pathlib import Path
 import streamlit as st
 
 # Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from models.habitat import HabitatModel  # noqa: E402
+from ui.components.data_version import bump_data_version  # noqa: E402
 from ui.components.tables import display_data_table  # noqa: E402
 
 # Initialize model
@@ -70,6 +72,7 @@ def show_create_form():
                 habitat_model.create(
                     {"habitat_id": next_id, "habitat": habitat.strip()}
                 )
+                bump_data_version()
                 st.success(f"✅ Successfully created habitat ID {next_id}!")
                 st.session_state.show_create_form = False
                 st.rerun()
@@ -111,6 +114,7 @@ def show_edit_form(habitat_id: int):
             # Update habitat
             try:
                 habitat_model.update(habitat_id, {"habitat": habitat.strip()})
+                bump_data_version()
                 st.success(f"✅ Successfully updated habitat ID {habitat_id}!")
                 st.session_state.show_edit_form = False
                 st.rerun()
@@ -153,6 +157,7 @@ def show_delete_confirmation(habitat_id: int):
         if st.button("🗑️ Delete Habitat", type="primary", width="stretch"):
             try:
                 habitat_model.delete_with_cascade(habitat_id)
+                bump_data_version()
                 # Store success message to show after rerun
                 st.session_state.delete_success_message = f"Successfully deleted habitat ID {habitat_id}!"
                 st.session_state.show_delete_confirm = False
@@ -304,7 +309,7 @@ def show_detail_view():
         st.caption("Areas where this habitat type can be created")
         if len(creation_areas) > 0:
             st.dataframe(
-                creation_areas.to_pandas(),
+                creation_areas,
                 width="stretch",
                 hide_index=True,
                 column_config={
@@ -325,7 +330,7 @@ def show_detail_view():
         st.caption("Areas where this habitat type requires management")
         if len(management_areas) > 0:
             st.dataframe(
-                management_areas.to_pandas(),
+                management_areas,
                 width="stretch",
                 hide_index=True,
                 column_config={
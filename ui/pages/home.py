@@ -6,8 +6,9 @@ from pathlib import Path
 import streamlit as st
 
 # Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from config.database import db
 from ui.components.database_selector import render_database_selector
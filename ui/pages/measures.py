@@ -1,36 +1,216 @@
 """Measures page - View and manage biodiversity measures."""
 
+import io
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from urllib.parse import urlparse
 
 import polars as pl
 import streamlit as st
 
 # Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from models.measure import MeasureModel  # noqa: E402
+from ui.components.data_version import get_data_version  # noqa: E402
 from ui.components.tables import display_data_table  # noqa: E402
 
+
+@st.cache_resource
+def get_measure_model() -> MeasureModel:
+    """Get the shared measure model instance.
+
+    Cached as a resource so a single model (and its database connection)
+    is reused across reruns and sessions.
+
+    Returns:
+        MeasureModel: Shared measure model
+    """
+    return MeasureModel()
+
+
 # Initialize model
-measure_model = MeasureModel()
+measure_model = get_measure_model()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_measure_count() -> int:
+    """Get the total number of measures (cached for 5 minutes).
+
+    Returns:
+        int: Number of measures
+    """
+    return measure_model.count()
+
+
+@st.cache_data(ttl=300, show_spinner="Loading measures...")
+def load_all_measures() -> pl.DataFrame:
+    """Get all measures with relationship counts (cached for 5 minutes).
+
+    Returns:
+        pl.DataFrame: Measures with relationship counts
+    """
+    return measure_model.get_with_relationship_counts()
+
+
+def get_session_measures() -> pl.DataFrame:
+    """Get the measures list, materialised once per data version.
+
+    st.cache_data hands back a fresh copy of the frame on every call, so the
+    list is kept in session state and reused across reruns. It is stored
+    with the shared data version and reloaded once any page changes the
+    data, including link changes made on other pages or in other sessions.
+
+    Returns:
+        pl.DataFrame: Measures with relationship counts
+    """
+    version = get_data_version()
+    if st.session_state.get("measures_list_version") != version:
+        st.session_state.measures_list_df = load_all_measures()
+        st.session_state.measures_list_version = version
+    return st.session_state.measures_list_df
+
+
+def invalidate_measure_caches() -> None:
+    """Drop cached measure data after a change or an explicit refresh."""
+    st.cache_data.clear()
+    st.session_state.pop("measures_list_df", None)
+    st.session_state.pop("measures_list_version", None)
+
+
+@st.cache_data(ttl=60, max_entries=64, show_spinner=False)
+def search_measures(term: str) -> pl.DataFrame:
+    """Search measures in the database (cached per term for 1 minute).
+
+    Args:
+        term: Search text
+
+    Returns:
+        pl.DataFrame: Matching measures with relationship counts
+    """
+    return measure_model.search_with_counts(term)
+
+
+@st.cache_data(ttl=300, max_entries=128, show_spinner=False)
+def load_measure_detail(measure_id: int, data_version: str) -> dict | None:
+    """Get a measure with all related entities (cached per measure for 5 minutes).
+
+    Args:
+        measure_id: ID of the measure
+        data_version: get_data_version() stamp, so link changes and deletes
+            made on any page reload the bundle
+
+    Returns:
+        dict: Detail bundle from MeasureModel.get_detail_bundle, or None
+    """
+    return measure_model.get_detail_bundle(measure_id)
+
 
 # Initialize session state
-if "measure_view" not in st.session_state:
-    st.session_state.measure_view = "list"
-if "selected_measure_id" not in st.session_state:
-    st.session_state.selected_measure_id = None
-if "show_create_form" not in st.session_state:
-    st.session_state.show_create_form = False
-if "show_edit_form" not in st.session_state:
-    st.session_state.show_edit_form = False
-if "show_delete_confirm" not in st.session_state:
-    st.session_state.show_delete_confirm = False
-if "delete_success_message" not in st.session_state:
-    st.session_state.delete_success_message = None
+st.session_state.setdefault("measure_view", "list")
+st.session_state.setdefault("selected_measure_id", None)
+st.session_state.setdefault("show_create_form", False)
+st.session_state.setdefault("show_edit_form", False)
+st.session_state.setdefault("show_delete_confirm", False)
+st.session_state.setdefault("delete_success_message", None)
+
+# Column configurations are built once at import rather than on every rerun
+MEASURES_COLUMN_CONFIG = {
+    "measure_id": st.column_config.NumberColumn("ID", width="small"),
+    "measure": st.column_config.TextColumn("Measure", width="large"),
+    "concise_measure": st.column_config.TextColumn("Concise", width="large"),
+    "core_supplementary": st.column_config.TextColumn("Type", width="small"),
+    "mapped_unmapped": st.column_config.TextColumn("Mapped", width="small"),
+    "types": st.column_config.TextColumn("Measure Types", width="medium"),
+    "stakeholders": st.column_config.TextColumn("Stakeholders", width="medium"),
+    "areas": st.column_config.NumberColumn("Areas", width="small"),
+    "priorities": st.column_config.NumberColumn("Priorities", width="small"),
+    "species": st.column_config.NumberColumn("Species", width="small"),
+    "benefits": st.column_config.NumberColumn("Benefits", width="small"),
+}
+TYPES_COLUMN_CONFIG = {
+    "measure_type_id": st.column_config.NumberColumn("ID", width="small"),
+    "measure_type": st.column_config.TextColumn("Measure Type", width="large"),
+}
+STAKEHOLDERS_COLUMN_CONFIG = {
+    "stakeholder_id": st.column_config.NumberColumn("ID", width="small"),
+    "stakeholder": st.column_config.TextColumn("Stakeholder", width="large"),
+}
+BENEFITS_COLUMN_CONFIG = {
+    "benefit_id": st.column_config.NumberColumn("ID", width="small"),
+    "benefit": st.column_config.TextColumn("Benefit", width="large"),
+}
+AREAS_COLUMN_CONFIG = {
+    "area_id": st.column_config.NumberColumn("ID", width="small"),
+    "area_name": st.column_config.TextColumn("Area Name", width="medium"),
+    "area_description": st.column_config.TextColumn("Description", width="large"),
+}
+PRIORITIES_COLUMN_CONFIG = {
+    "priority_id": st.column_config.NumberColumn("ID", width="small"),
+    "biodiversity_priority": st.column_config.TextColumn("Priority", width="large"),
+    "theme": st.column_config.TextColumn("Theme", width="medium"),
+}
+GRANTS_COLUMN_CONFIG = {
+    "grant_id": st.column_config.TextColumn("Grant ID", width="small"),
+    "grant_name": st.column_config.TextColumn("Grant Name", width="medium"),
+    "grant_scheme": st.column_config.TextColumn("Scheme", width="medium"),
+    "url": st.column_config.LinkColumn("URL", width="medium"),
+}
+SPECIES_COLUMN_CONFIG = {
+    "species_id": st.column_config.NumberColumn("ID", width="small"),
+    "common_name": st.column_config.TextColumn("Common Name", width="medium"),
+    "linnaean_name": st.column_config.TextColumn("Scientific Name", width="medium"),
+    "assemblage": st.column_config.TextColumn("Assemblage", width="medium"),
+}
+
+# Detail view relationship label -> (bundle key, column config, empty message,
+# noun for the total caption)
+RELATIONSHIP_SECTIONS = {
+    "Types": ("types", TYPES_COLUMN_CONFIG, "No measure types linked.", None),
+    "Stakeholders": (
+        "stakeholders",
+        STAKEHOLDERS_COLUMN_CONFIG,
+        "No stakeholders linked.",
+        None,
+    ),
+    "Benefits": ("benefits", BENEFITS_COLUMN_CONFIG, "No benefits linked.", None),
+    "Areas": (
+        "areas",
+        AREAS_COLUMN_CONFIG,
+        "No areas linked to this measure.",
+        "areas",
+    ),
+    "Priorities": (
+        "priorities",
+        PRIORITIES_COLUMN_CONFIG,
+        "No priorities linked to this measure.",
+        "priorities",
+    ),
+    "Grants": (
+        "grants",
+        GRANTS_COLUMN_CONFIG,
+        "No grants linked to this measure.",
+        "grants",
+    ),
+    "Species": (
+        "species",
+        SPECIES_COLUMN_CONFIG,
+        "No species linked to this measure.",
+        "species",
+    ),
+}
+
+# Selectbox options shared by the create and edit forms, with value -> index maps
+CORE_SUPP_OPTIONS = ("Core (BNG)", "Supplementary")
+CORE_SUPP_INDEX = {option: i for i, option in enumerate(CORE_SUPP_OPTIONS)}
+MAPPED_OPTIONS = ("", "Mapped", "Unmapped")
+MAPPED_INDEX = {option: i for i, option in enumerate(MAPPED_OPTIONS)}
+
+# Scheme followed by "://" and a non-empty network location
+_URL_PATTERN = re.compile(r"^[a-z][a-z0-9+\-.]*://[^\s/?#]+", re.IGNORECASE)
 
 
 def validate_url(url: str) -> bool:
@@ -42,15 +222,27 @@ def validate_url(url: str) -> bool:
     Returns:
         bool: True if URL is valid or empty, False otherwise
     """
-    if not url or not url.strip():
-        return True  # Empty URLs are allowed
+    url = url.strip() if url else ""
+    # Empty URLs are allowed; otherwise require a scheme and a network location
+    return not url or _URL_PATTERN.match(url) is not None
+
 
-    try:
-        result = urlparse(url.strip())
-        # Check that scheme and netloc are present
-        return all([result.scheme, result.netloc])
-    except Exception:
-        return False
+def names_to_ids(
+    lookup: pl.DataFrame, name_column: str, id_column: str, names: list[str]
+) -> list[int]:
+    """Map selected option names to their IDs with a single join.
+
+    Args:
+        lookup: Lookup table containing both the name and ID columns
+        name_column: Column holding the option names
+        id_column: Column holding the IDs
+        names: Selected names to resolve
+
+    Returns:
+        list[int]: IDs for the selected names
+    """
+    selected = pl.DataFrame({name_column: names}, schema={name_column: pl.String})
+    return selected.join(lookup, on=name_column, how="inner")[id_column].to_list()
 
 
 def show_create_form():
@@ -58,9 +250,10 @@ def show_create_form():
     st.subheader("➕ Create New Measure")
 
     # Get options for dropdowns
-    all_types = measure_model.get_all_measure_types()
-    all_stakeholders = measure_model.get_all_stakeholders()
-    all_benefits = measure_model.get_all_benefits()
+    all_types, all_stakeholders, all_benefits = measure_model.get_all_lookups()
+    all_type_names = all_types["measure_type"].to_list()
+    all_stakeholder_names = all_stakeholders["stakeholder"].to_list()
+    all_benefit_names = all_benefits["benefit"].to_list()
 
     with st.form("create_measure_form", clear_on_submit=True):
         measure = st.text_area(
@@ -78,13 +271,13 @@ def show_create_form():
         with col1:
             core_supplementary = st.selectbox(
                 "Core/Supplementary*",
-                options=["Core (BNG)", "Supplementary"],
+                options=CORE_SUPP_OPTIONS,
                 help="Whether this is a core BNG measure or supplementary (required)",
             )
 
             mapped_unmapped = st.selectbox(
                 "Mapped/Unmapped",
-                options=["", "Mapped", "Unmapped"],
+                options=MAPPED_OPTIONS,
                 help="Optional: Whether this measure is mapped",
             )
 
@@ -101,21 +294,21 @@ def show_create_form():
         with col1:
             selected_types = st.multiselect(
                 "Measure Types",
-                options=all_types["measure_type"].to_list(),
+                options=all_type_names,
                 help="Select applicable measure types",
             )
 
         with col2:
             selected_stakeholders = st.multiselect(
                 "Stakeholders",
-                options=all_stakeholders["stakeholder"].to_list(),
+                options=all_stakeholder_names,
                 help="Select applicable stakeholders",
             )
 
         with col3:
             selected_benefits = st.multiselect(
                 "Benefits",
-                options=all_benefits["benefit"].to_list(),
+                options=all_benefit_names,
                 help="Select benefits delivered by this measure",
             )
 
@@ -170,33 +363,29 @@ def show_create_form():
 
                 # Add relationships
                 if selected_types:
-                    type_ids = [
-                        all_types.filter(pl.col("measure_type") == t)[
-                            "measure_type_id"
-                        ][0]
-                        for t in selected_types
-                    ]
+                    type_ids = names_to_ids(
+                        all_types, "measure_type", "measure_type_id", selected_types
+                    )
                     measure_model.add_measure_types(next_id, type_ids)
 
                 if selected_stakeholders:
-                    stakeholder_ids = [
-                        all_stakeholders.filter(pl.col("stakeholder") == s)[
-                            "stakeholder_id"
-                        ][0]
-                        for s in selected_stakeholders
-                    ]
+                    stakeholder_ids = names_to_ids(
+                        all_stakeholders,
+                        "stakeholder",
+                        "stakeholder_id",
+                        selected_stakeholders,
+                    )
                     measure_model.add_stakeholders(next_id, stakeholder_ids)
 
                 if selected_benefits:
-                    benefit_ids = [
-                        all_benefits.filter(pl.col("benefit") == b)["benefit_id"][0]
-                        for b in selected_benefits
-                    ]
+                    benefit_ids = names_to_ids(
+                        all_benefits, "benefit", "benefit_id", selected_benefits
+                    )
                     measure_model.add_benefits(next_id, benefit_ids)
 
                 st.success(f"✅ Successfully created measure ID {next_id}!")
                 # Clear caches to ensure fresh data is loaded
-                st.cache_data.clear()
+                invalidate_measure_caches()
                 st.session_state.show_create_form = False
                 st.rerun()
             except Exception as e:
@@ -205,59 +394,60 @@ def show_create_form():
 
 def show_edit_form(measure_id: int):
     """Display form to edit an existing measure."""
-    measure_data = measure_model.get_by_id(measure_id)
+    bundle = load_measure_detail(measure_id, get_data_version())
 
-    if not measure_data:
+    if not bundle:
         st.error("Measure not found")
         return
 
-    # Get current relationships
-    current_types = measure_model.get_types(measure_id)
-    current_stakeholders = measure_model.get_stakeholders(measure_id)
-    current_benefits = measure_model.get_benefits(measure_id)
+    # Current record and relationships come from the cached detail bundle
+    measure_data = bundle["measure"]
+    current_types = bundle["types"]
+    current_stakeholders = bundle["stakeholders"]
+    current_benefits = bundle["benefits"]
 
     # Get options for dropdowns
-    all_types = measure_model.get_all_measure_types()
-    all_stakeholders = measure_model.get_all_stakeholders()
-    all_benefits = measure_model.get_all_benefits()
+    all_types, all_stakeholders, all_benefits = measure_model.get_all_lookups()
+    all_type_names = all_types["measure_type"].to_list()
+    all_stakeholder_names = all_stakeholders["stakeholder"].to_list()
+    all_benefit_names = all_benefits["benefit"].to_list()
+
+    current_measure = measure_data.measure
+    current_concise = measure_data.concise_measure or ""
+    current_core_supp = measure_data.core_supplementary
+    current_mapped = measure_data.mapped_unmapped
+    current_link = measure_data.link_to_further_guidance or ""
+
+    current_type_names = current_types["measure_type"].to_list()
+    current_stakeholder_names = current_stakeholders["stakeholder"].to_list()
+    current_benefit_names = current_benefits["benefit"].to_list()
 
     st.subheader(f"✏️ Edit Measure {measure_id}")
 
     with st.form("edit_measure_form"):
         measure = st.text_area(
-            "Measure Description*", value=measure_data["measure"], height=150
+            "Measure Description*", value=current_measure, height=150
         )
 
-        concise_measure = st.text_input(
-            "Concise Measure", value=measure_data.get("concise_measure", "") or ""
-        )
+        concise_measure = st.text_input("Concise Measure", value=current_concise)
 
         col1, col2 = st.columns(2)
         with col1:
-            core_supp_options = ["Core (BNG)", "Supplementary"]
-            core_supp_index = 0
-            if measure_data["core_supplementary"] in core_supp_options:
-                core_supp_index = core_supp_options.index(
-                    measure_data["core_supplementary"]
-                )
-
             core_supplementary = st.selectbox(
-                "Core/Supplementary*", options=core_supp_options, index=core_supp_index
+                "Core/Supplementary*",
+                options=CORE_SUPP_OPTIONS,
+                index=CORE_SUPP_INDEX.get(current_core_supp, 0),
             )
 
-            mapped_options = ["", "Mapped", "Unmapped"]
-            mapped_index = 0
-            if measure_data.get("mapped_unmapped") in mapped_options:
-                mapped_index = mapped_options.index(measure_data["mapped_unmapped"])
-
             mapped_unmapped = st.selectbox(
-                "Mapped/Unmapped", options=mapped_options, index=mapped_index
+                "Mapped/Unmapped",
+                options=MAPPED_OPTIONS,
+                index=MAPPED_INDEX.get(current_mapped, 0),
             )
 
         with col2:
             link_to_further_guidance = st.text_input(
-                "Link to Further Guidance",
-                value=measure_data.get("link_to_further_guidance", "") or "",
+                "Link to Further Guidance", value=current_link
             )
 
         st.markdown("---")
@@ -265,38 +455,23 @@ def show_edit_form(measure_id: int):
 
         col1, col2, col3 = st.columns(3)
         with col1:
-            current_type_names = (
-                current_types["measure_type"].to_list()
-                if len(current_types) > 0
-                else []
-            )
             selected_types = st.multiselect(
                 "Measure Types",
-                options=all_types["measure_type"].to_list(),
+                options=all_type_names,
                 default=current_type_names,
             )
 
         with col2:
-            current_stakeholder_names = (
-                current_stakeholders["stakeholder"].to_list()
-                if len(current_stakeholders) > 0
-                else []
-            )
             selected_stakeholders = st.multiselect(
                 "Stakeholders",
-                options=all_stakeholders["stakeholder"].to_list(),
+                options=all_stakeholder_names,
                 default=current_stakeholder_names,
             )
 
         with col3:
-            current_benefit_names = (
-                current_benefits["benefit"].to_list()
-                if len(current_benefits) > 0
-                else []
-            )
             selected_benefits = st.multiselect(
                 "Benefits",
-                options=all_benefits["benefit"].to_list(),
+                options=all_benefit_names,
                 default=current_benefit_names,
             )
 
@@ -328,7 +503,7 @@ def show_edit_form(measure_id: int):
             # Update measure atomically using transaction
             try:
                 # Prepare measure data
-                measure_data = {
+                update_data = {
                     "measure": measure.strip(),
                     "concise_measure": concise_measure.strip()
                     if concise_measure and concise_measure.strip()
@@ -341,25 +516,35 @@ def show_edit_form(measure_id: int):
                 }
 
                 # Convert selected names to IDs
-                type_ids = [
-                    all_types.filter(pl.col("measure_type") == t)["measure_type_id"][0]
-                    for t in selected_types
-                ] if selected_types else None
+                type_ids = (
+                    names_to_ids(
+                        all_types, "measure_type", "measure_type_id", selected_types
+                    )
+                    if selected_types
+                    else None
+                )
 
-                stakeholder_ids = [
-                    all_stakeholders.filter(pl.col("stakeholder") == s)["stakeholder_id"][0]
-                    for s in selected_stakeholders
-                ] if selected_stakeholders else None
+                stakeholder_ids = (
+                    names_to_ids(
+                        all_stakeholders,
+                        "stakeholder",
+                        "stakeholder_id",
+                        selected_stakeholders,
+                    )
+                    if selected_stakeholders
+                    else None
+                )
 
-                benefit_ids = [
-                    all_benefits.filter(pl.col("benefit") == b)["benefit_id"][0]
-                    for b in selected_benefits
-                ] if selected_benefits else None
+                benefit_ids = (
+                    names_to_ids(all_benefits, "benefit", "benefit_id", selected_benefits)
+                    if selected_benefits
+                    else None
+                )
 
                 # Single atomic update operation
                 measure_model.update_with_relationships(
                     measure_id=measure_id,
-                    measure_data=measure_data,
+                    measure_data=update_data,
                     measure_types=type_ids,
                     stakeholders=stakeholder_ids,
                     benefits=benefit_ids
@@ -367,7 +552,7 @@ def show_edit_form(measure_id: int):
 
                 st.success(f"✅ Successfully updated measure ID {measure_id}!")
                 # Clear caches to ensure fresh data is loaded
-                st.cache_data.clear()
+                invalidate_measure_caches()
                 st.session_state.show_edit_form = False
                 st.rerun()
             except Exception as e:
@@ -376,19 +561,21 @@ def show_edit_form(measure_id: int):
 
 def show_delete_confirmation(measure_id: int):
     """Show confirmation dialog before deleting."""
-    measure_data = measure_model.get_by_id(measure_id)
+    bundle = load_measure_detail(measure_id, get_data_version())
 
-    if not measure_data:
+    if not bundle:
         st.error(f"Measure ID {measure_id} not found")
         return
 
-    counts = measure_model.get_relationship_counts(measure_id)
+    # Counts are the lengths of the bundled relationship frames
+    measure_data = bundle["measure"]
+    counts = bundle["counts"]
 
     st.warning("⚠️ Are you sure you want to delete this measure?")
 
     st.markdown(f"**ID:** {measure_id}")
-    st.markdown(f"**Concise Measure:** {measure_data.get('concise_measure') or 'N/A'}")
-    st.markdown(f"**Type:** {measure_data['core_supplementary']}")
+    st.markdown(f"**Concise Measure:** {measure_data.concise_measure or 'N/A'}")
+    st.markdown(f"**Type:** {measure_data.core_supplementary}")
 
     # Show impact
     total_relationships = sum(counts.values())
@@ -421,7 +608,7 @@ def show_delete_confirmation(measure_id: int):
                 # Store success message to show after rerun
                 st.session_state.delete_success_message = f"Successfully deleted measure ID {measure_id}!"
                 # Clear caches to ensure fresh data is loaded
-                st.cache_data.clear()
+                invalidate_measure_caches()
                 st.session_state.show_delete_confirm = False
                 st.session_state.measure_view = "list"
                 st.session_state.selected_measure_id = None
@@ -450,18 +637,27 @@ def show_list_view():
         show_create_form()
         st.markdown("---")
 
-    total_count = measure_model.count()
+    total_count = load_measure_count()
     st.info(f"**{total_count}** measures for biodiversity conservation")
 
     # Get all measures with relationship counts
-    all_measures = measure_model.get_with_relationship_counts()
+    all_measures = get_session_measures()
 
-    # Add semicolon-delimited CSV export button
-    _, col2 = st.columns([4, 1])
+    # Refresh and semicolon-delimited CSV export buttons
+    _, col1, col2 = st.columns([3, 1, 1])
+    with col1:
+        if st.button(
+            "🔄 Refresh", width="stretch", help="Reload measures from the database"
+        ):
+            invalidate_measure_caches()
+            st.rerun()
     with col2:
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         filename = f"measures_export_{timestamp}.csv"
-        csv_data = all_measures.write_csv(separator=";")
+        # Write straight into a bytes buffer rather than building a str first
+        csv_buffer = io.BytesIO()
+        all_measures.write_csv(csv_buffer, separator=";")
+        csv_data = csv_buffer.getvalue()
 
         st.download_button(
             label="📥 CSV",
@@ -485,72 +681,78 @@ def show_list_view():
         entity_name="measure",
         id_column="measure_id",
         searchable_columns=["measure", "concise_measure", "types", "stakeholders"],
-        column_config={
-            "measure_id": st.column_config.NumberColumn("ID", width="small"),
-            "measure": st.column_config.TextColumn("Measure", width="large"),
-            "concise_measure": st.column_config.TextColumn("Concise", width="large"),
-            "core_supplementary": st.column_config.TextColumn("Type", width="small"),
-            "mapped_unmapped": st.column_config.TextColumn("Mapped", width="small"),
-            "types": st.column_config.TextColumn("Measure Types", width="medium"),
-            "stakeholders": st.column_config.TextColumn("Stakeholders", width="medium"),
-            "areas": st.column_config.NumberColumn("Areas", width="small"),
-            "priorities": st.column_config.NumberColumn("Priorities", width="small"),
-            "species": st.column_config.NumberColumn("Species", width="small"),
-            "benefits": st.column_config.NumberColumn("Benefits", width="small"),
-        },
+        column_config=MEASURES_COLUMN_CONFIG,
         show_actions=True,
         on_view_details=on_view_details,
+        search_fn=search_measures,
     )
 
 
+@st.fragment
+def render_relationships(bundle: dict) -> None:
+    """Render the relationship selector and the chosen relationship table.
+
+    Only the selected relationship is sent to the browser. Runs as a fragment
+    so switching relationships reruns just this section rather than the whole
+    detail page.
+
+    Args:
+        bundle: Detail bundle from MeasureModel.get_detail_bundle
+    """
+    choice = st.radio(
+        "Related data",
+        options=list(RELATIONSHIP_SECTIONS),
+        horizontal=True,
+        key="measure_detail_relationship",
+        label_visibility="collapsed",
+    )
+
+    name, column_config, empty_message, total_label = RELATIONSHIP_SECTIONS[choice]
+    count = bundle["counts"][name]
+    if count == 0:
+        st.info(empty_message)
+        return
+
+    st.dataframe(
+        bundle[name], width="stretch", hide_index=True, column_config=column_config
+    )
+    if total_label:
+        st.caption(f"Total: {count:,} {total_label}")
+
+
+def back_to_list():
+    """Return from the detail view to the measures list."""
+    st.session_state.measure_view = "list"
+    st.session_state.selected_measure_id = None
+    st.session_state.show_edit_form = False
+    st.session_state.show_delete_confirm = False
+
+
 def show_detail_view():
     """Display details of a single measure."""
     measure_id = st.session_state.selected_measure_id
 
+    # Single back button for every path; the callback triggers the rerun
+    st.button("← Back to List", key="measure_back_to_list", on_click=back_to_list)
+
     if measure_id is None:
         st.error("No measure selected")
-        if st.button("← Back to List"):
-            st.session_state.measure_view = "list"
-            st.rerun()
         return
 
-    # Get measure data
-    measure_data = measure_model.get_by_id(measure_id)
+    # Get measure data, related entities and counts in one query
+    bundle = load_measure_detail(measure_id, get_data_version())
 
-    if not measure_data:
+    if not bundle:
         st.error(f"Measure ID {measure_id} not found")
-        if st.button("← Back to List"):
-            st.session_state.measure_view = "list"
-            st.rerun()
         return
 
-    # Get related data
-    types = measure_model.get_types(measure_id)
-    stakeholders = measure_model.get_stakeholders(measure_id)
-    related_areas = measure_model.get_related_areas(measure_id)
-    related_priorities = measure_model.get_related_priorities(measure_id)
-    related_grants = measure_model.get_related_grants(measure_id)
-    related_species = measure_model.get_related_species(measure_id)
-    benefits = measure_model.get_benefits(measure_id)
-
-    # Get counts
-    counts = measure_model.get_relationship_counts(measure_id)
-
-    # Display detail view
-    def back_to_list():
-        st.session_state.measure_view = "list"
-        st.session_state.selected_measure_id = None
-        st.session_state.show_edit_form = False
-        st.session_state.show_delete_confirm = False
+    measure_data = bundle["measure"]
+    counts = bundle["counts"]
 
     st.title(f"📋 Measure {measure_id}")
 
     # Action buttons
-    col1, col2, col3 = st.columns([2, 1, 1])
-    with col1:
-        if st.button("← Back to List"):
-            back_to_list()
-            st.rerun()
+    _, col2, col3 = st.columns([2, 1, 1])
     with col2:
         if st.button("✏️ Edit", width="stretch"):
             st.session_state.show_edit_form = True
@@ -606,21 +808,25 @@ def show_detail_view():
 
     col1, col2 = st.columns([2, 1])
 
+    concise = measure_data.concise_measure
+    full_measure = measure_data.measure
+    core_supp = measure_data.core_supplementary
+    mapped = measure_data.mapped_unmapped or "Not specified"
+    guidance_link = measure_data.link_to_further_guidance
+
     with col1:
-        st.markdown(f"**Measure ID:** {measure_data['measure_id']}")
-        st.markdown(f"**Core/Supplementary:** {measure_data['core_supplementary']}")
-        mapped = measure_data.get("mapped_unmapped") or "Not specified"
+        st.markdown(f"**Measure ID:** {measure_id}")
+        st.markdown(f"**Core/Supplementary:** {core_supp}")
         st.markdown(f"**Mapped/Unmapped:** {mapped}")
 
-        if measure_data.get("concise_measure"):
+        if concise:
             st.markdown("**Concise Measure:**")
-            st.info(measure_data["concise_measure"])
+            st.info(concise)
 
         st.markdown("**Full Measure:**")
-        st.info(measure_data["measure"])
+        st.info(full_measure)
 
-        if measure_data.get("link_to_further_guidance"):
-            guidance_link = measure_data["link_to_further_guidance"]
+        if guidance_link:
             st.markdown(f"**Guidance:** [{guidance_link}]({guidance_link})")
 
     with col2:
@@ -633,153 +839,11 @@ def show_detail_view():
         st.metric("Grants", counts["grants"])
         st.metric("Species", counts["species"])
 
-    # Display relationships in tabs
+    # Display relationships, one selected at a time
     st.markdown("---")
     st.subheader("Relationships")
 
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs(
-        [
-            "Types",
-            "Stakeholders",
-            "Benefits",
-            "Areas",
-            "Priorities",
-            "Grants",
-            "Species",
-        ]
-    )
-
-    with tab1:
-        if len(types) > 0:
-            st.dataframe(
-                types.to_pandas(),
-                width="stretch",
-                hide_index=True,
-                column_config={
-                    "measure_type_id": st.column_config.NumberColumn(
-                        "ID", width="small"
-                    ),
-                    "measure_type": st.column_config.TextColumn(
-                        "Measure Type", width="large"
-                    ),
-                },
-            )
-        else:
-            st.info("No measure types linked.")
-
-    with tab2:
-        if len(stakeholders) > 0:
-            st.dataframe(
-                stakeholders.to_pandas(),
-                width="stretch",
-                hide_index=True,
-                column_config={
-                    "stakeholder_id": st.column_config.NumberColumn(
-                        "ID", width="small"
-                    ),
-                    "stakeholder": st.column_config.TextColumn(
-                        "Stakeholder", width="large"
-                    ),
-                },
-            )
-        else:
-            st.info("No stakeholders linked.")
-
-    with tab3:
-        if len(benefits) > 0:
-            st.dataframe(
-                benefits.to_pandas(),
-                width="stretch",
-                hide_index=True,
-                column_config={
-                    "benefit_id": st.column_config.NumberColumn("ID", width="small"),
-                    "benefit": st.column_config.TextColumn("Benefit", width="large"),
-                },
-            )
-        else:
-            st.info("No benefits linked.")
-
-    with tab4:
-        if len(related_areas) > 0:
-            st.dataframe(
-                related_areas.to_pandas(),
-                width="stretch",
-                hide_index=True,
-                column_config={
-                    "area_id": st.column_config.NumberColumn("ID", width="small"),
-                    "area_name": st.column_config.TextColumn(
-                        "Area Name", width="medium"
-                    ),
-                    "area_description": st.column_config.TextColumn(
-                        "Description", width="large"
-                    ),
-                },
-            )
-            st.caption(f"Total: {len(related_areas):,} areas")
-        else:
-            st.info("No areas linked to this measure.")
-
-    with tab5:
-        if len(related_priorities) > 0:
-            st.dataframe(
-                related_priorities.to_pandas(),
-                width="stretch",
-                hide_index=True,
-                column_config={
-                    "priority_id": st.column_config.NumberColumn("ID", width="small"),
-                    "biodiversity_priority": st.column_config.TextColumn(
-                        "Priority", width="large"
-                    ),
-                    "theme": st.column_config.TextColumn("Theme", width="medium"),
-                },
-            )
-            st.caption(f"Total: {len(related_priorities):,} priorities")
-        else:
-            st.info("No priorities linked to this measure.")
-
-    with tab6:
-        if len(related_grants) > 0:
-            st.dataframe(
-                related_grants.to_pandas(),
-                width="stretch",
-                hide_index=True,
-                column_config={
-                    "grant_id": st.column_config.TextColumn("Grant ID", width="small"),
-                    "grant_name": st.column_config.TextColumn(
-                        "Grant Name", width="medium"
-                    ),
-                    "grant_scheme": st.column_config.TextColumn(
-                        "Scheme", width="medium"
-                    ),
-                    "url": st.column_config.LinkColumn("URL", width="medium"),
-                },
-            )
-            st.caption(f"Total: {len(related_grants):,} grants")
-        else:
-            st.info("No grants linked to this measure.")
-
-    with tab7:
-        if len(related_species) > 0:
-            st.dataframe(
-                related_species.to_pandas(),
-                width="stretch",
-                hide_index=True,
-                column_config={
-                    "species_id": st.column_config.NumberColumn("ID", width="small"),
-                    "common_name": st.column_config.TextColumn(
-                        "Common Name", width="medium"
-                    ),
-                    "linnaean_name": st.column_config.TextColumn(
-                        "Scientific Name", width="medium"
-                    ),
-                    "assemblage": st.column_config.TextColumn(
-                        "Assemblage", width="medium"
-                    ),
-                },
-            )
-            st.caption(f"Total: {len(related_species):,} species")
-        else:
-            st.info("No species linked to this measure.")
+    render_relationships(bundle)
 
 
 # Main page logic
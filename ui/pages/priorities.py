@@ -8,28 +8,215 @@ import polars as pl
 import streamlit as st
 
 # Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from models.priority import PriorityModel  # noqa: E402
+from ui.components.data_version import (  # noqa: E402
+    bump_data_version,
+    get_data_version,
+)
 from ui.components.tables import display_data_table  # noqa: E402
 
+
+@st.cache_resource
+def get_priority_model() -> PriorityModel:
+    """Get the shared priority model instance.
+
+    Cached as a resource so a single model (and its database connection)
+    is reused across reruns and sessions.
+
+    Returns:
+        PriorityModel: Shared priority model
+    """
+    return PriorityModel()
+
+
 # Initialize model
-priority_model = PriorityModel()
+priority_model = get_priority_model()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_priority_count() -> int:
+    """Get the total number of priorities (cached for 1 minute).
+
+    Returns:
+        int: Number of priorities
+    """
+    return priority_model.count()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_priorities_by_theme() -> dict[str, pl.DataFrame]:
+    """Get priorities grouped by theme (cached for 5 minutes).
+
+    Returns:
+        dict: Theme name -> DataFrame of priorities in that theme
+    """
+    return priority_model.get_by_theme(
+        columns=(
+            "priority_id",
+            "biodiversity_priority",
+            "simplified_biodiversity_priority",
+        )
+    )
+
+
+@st.cache_data(ttl=300, show_spinner="Loading priorities...")
+def load_all_priorities() -> pl.DataFrame:
+    """Get all priorities with cleaned theme names (cached for 5 minutes).
+
+    Returns:
+        pl.DataFrame: Priorities ordered by theme and priority
+    """
+    return priority_model.get_all_clean_theme()
+
+
+@st.cache_data(ttl=300, max_entries=128, show_spinner=False)
+def load_priority_detail(priority_id: int, data_version: str) -> dict | None:
+    """Get a priority with its related entities (cached per priority for 5 minutes).
+
+    Args:
+        priority_id: ID of the priority
+        data_version: get_data_version() stamp, so link changes and deletes
+            made on any page reload the bundle
+
+    Returns:
+        dict: Detail bundle from PriorityModel.get_detail_bundle, or None
+    """
+    return priority_model.get_detail_bundle(priority_id)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def export_priorities_csv() -> bytes:
+    """Get all priorities as semicolon-delimited CSV (cached for 5 minutes).
+
+    Serialised once per cache period rather than on every rerun of the
+    table view.
+
+    Returns:
+        bytes: UTF-8 encoded CSV
+    """
+    return load_all_priorities().write_csv(separator=";").encode()
+
+
+# Text columns matched by the table view search box
+PRIORITY_SEARCH_COLUMNS = (
+    "biodiversity_priority",
+    "simplified_biodiversity_priority",
+    "theme",
+)
+
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def search_priorities(term: str) -> pl.DataFrame:
+    """Search the priorities table view (cached per term for 5 minutes).
+
+    Matches the term case-insensitively as literal text in any searchable
+    column, using a single lazy Polars filter over the cached table.
+
+    Args:
+        term: Search text
+
+    Returns:
+        pl.DataFrame: Matching priorities
+    """
+    needle = term.strip().lower()
+    return (
+        load_all_priorities()
+        .lazy()
+        .filter(
+            pl.any_horizontal(
+                [
+                    pl.col(col).str.to_lowercase().str.contains(needle, literal=True)
+                    for col in PRIORITY_SEARCH_COLUMNS
+                ]
+            )
+        )
+        .collect()
+    )
+
+
+def invalidate_priority_caches() -> None:
+    """Drop cached priority data after a create, update or delete."""
+    load_priority_count.clear()
+    load_priorities_by_theme.clear()
+    load_all_priorities.clear()
+    load_priority_detail.clear()
+    export_priorities_csv.clear()
+    search_priorities.clear()
+    bump_data_version()
+
 
 # Initialize session state
-if "priority_view" not in st.session_state:
-    st.session_state.priority_view = "list"
-if "selected_priority_id" not in st.session_state:
-    st.session_state.selected_priority_id = None
-if "show_create_form" not in st.session_state:
-    st.session_state.show_create_form = False
-if "show_edit_form" not in st.session_state:
-    st.session_state.show_edit_form = False
-if "show_delete_confirm" not in st.session_state:
-    st.session_state.show_delete_confirm = False
-if "delete_success_message" not in st.session_state:
-    st.session_state.delete_success_message = None
+SESSION_DEFAULTS = {
+    "priority_view": "list",
+    "selected_priority_id": None,
+    "show_create_form": False,
+    "show_edit_form": False,
+    "show_delete_confirm": False,
+    "delete_success_message": None,
+}
+for key, default in SESSION_DEFAULTS.items():
+    st.session_state.setdefault(key, default)
+
+# Column configurations are built once at import rather than on every rerun
+PRIORITIES_COLUMN_CONFIG = {
+    "priority_id": st.column_config.NumberColumn("ID", width="small"),
+    "biodiversity_priority": st.column_config.TextColumn(
+        "Biodiversity Priority", width="large"
+    ),
+    "simplified_biodiversity_priority": st.column_config.TextColumn(
+        "Simplified", width="medium"
+    ),
+}
+PRIORITIES_TABLE_COLUMN_CONFIG = {
+    **PRIORITIES_COLUMN_CONFIG,
+    "theme": st.column_config.TextColumn("Theme", width="large"),
+}
+MEASURES_COLUMN_CONFIG = {
+    "measure_id": st.column_config.NumberColumn("ID", width="small"),
+    "measure": st.column_config.TextColumn("Measure", width="large"),
+    "concise_measure": st.column_config.TextColumn("Concise", width="medium"),
+    "core_supplementary": st.column_config.TextColumn("Type", width="small"),
+}
+AREAS_COLUMN_CONFIG = {
+    "area_id": st.column_config.NumberColumn("ID", width="small"),
+    "area_name": st.column_config.TextColumn("Area Name", width="medium"),
+    "area_description": st.column_config.TextColumn("Description", width="large"),
+}
+SPECIES_COLUMN_CONFIG = {
+    "species_id": st.column_config.NumberColumn("ID", width="small"),
+    "common_name": st.column_config.TextColumn("Common Name", width="medium"),
+    "linnaean_name": st.column_config.TextColumn("Scientific Name", width="medium"),
+    "assemblage": st.column_config.TextColumn("Assemblage", width="medium"),
+}
+
+# Theme options for the create/edit forms, with value -> index map
+THEMES = (
+    "Grassland and farmland",
+    "Heathland and moorland",
+    "Marine",
+    "Wetlands, rivers and floodplains",
+    "Woodland",
+    "All habitats",
+)
+THEME_INDEX = {theme: i for i, theme in enumerate(THEMES)}
+
+
+def clean_theme_name(theme: str) -> str:
+    """Strip whitespace and non-breaking spaces from a theme name.
+
+    Args:
+        theme: Theme name as stored in the database
+
+    Returns:
+        str: Theme name for display
+    """
+    theme = theme.strip()
+    # Most themes are plain text, so only rebuild the string when needed
+    return theme.replace("\xa0", "") if "\xa0" in theme else theme
 
 
 def show_create_form():
@@ -49,14 +236,7 @@ def show_create_form():
 
         theme = st.selectbox(
             "Theme*",
-            options=[
-                "Grassland and farmland",
-                "Heathland and moorland",
-                "Marine",
-                "Wetlands, rivers and floodplains",
-                "Woodland",
-                "All habitats",
-            ],
+            options=THEMES,
             help="Select the theme category (required)",
         )
 
@@ -73,8 +253,12 @@ def show_create_form():
             st.rerun()
 
         if submitted:
+            # Strip inputs once and reuse them for validation and saving
+            bio = biodiversity_priority.strip() if biodiversity_priority else ""
+            simp = simplified_priority.strip() if simplified_priority else None
+
             # Validate
-            if not biodiversity_priority or not biodiversity_priority.strip():
+            if not bio:
                 st.error("❌ Biodiversity Priority is required")
                 return
 
@@ -82,25 +266,16 @@ def show_create_form():
                 st.error("❌ Theme is required")
                 return
 
-            # Get next priority_id
-            result = priority_model.execute_raw_query(
-                "SELECT MAX(priority_id) FROM priority"
-            ).fetchone()
-            max_id = result[0] if result else None
-            next_id = (max_id or 0) + 1
-
-            # Create priority
+            # Create priority (the next priority_id is allocated by the insert)
             try:
-                priority_model.create(
+                next_id = priority_model.create_with_next_id(
                     {
-                        "priority_id": next_id,
-                        "biodiversity_priority": biodiversity_priority.strip(),
-                        "simplified_biodiversity_priority": simplified_priority.strip()
-                        if simplified_priority
-                        else None,
+                        "biodiversity_priority": bio,
+                        "simplified_biodiversity_priority": simp,
                         "theme": theme,
                     }
                 )
+                invalidate_priority_caches()
                 st.success(f"✅ Successfully created priority ID {next_id}!")
                 st.session_state.show_create_form = False
                 st.rerun()
@@ -110,12 +285,14 @@ def show_create_form():
 
 def show_edit_form(priority_id: int):
     """Display form to edit an existing priority."""
-    priority_data = priority_model.get_by_id(priority_id)
+    bundle = load_priority_detail(priority_id, get_data_version())
 
-    if not priority_data:
+    if not bundle:
         st.error("Priority not found")
         return
 
+    priority_data = bundle["data"]
+
     st.subheader(f"✏️ Edit Priority {priority_id}")
 
     with st.form("edit_priority_form"):
@@ -132,32 +309,8 @@ def show_edit_form(priority_id: int):
 
         theme = st.selectbox(
             "Theme*",
-            options=[
-                "Grassland and farmland",
-                "Heathland and moorland",
-                "Marine",
-                "Wetlands, rivers and floodplains",
-                "Woodland",
-                "All habitats",
-            ],
-            index=[
-                "Grassland and farmland",
-                "Heathland and moorland",
-                "Marine",
-                "Wetlands, rivers and floodplains",
-                "Woodland",
-                "All habitats",
-            ].index(priority_data["theme"].strip())
-            if priority_data["theme"].strip()
-            in [
-                "Grassland and farmland",
-                "Heathland and moorland",
-                "Marine",
-                "Wetlands, rivers and floodplains",
-                "Woodland",
-                "All habitats",
-            ]
-            else 0,
+            options=THEMES,
+            index=THEME_INDEX.get(clean_theme_name(priority_data["theme"]), 0),
         )
 
         col1, col2 = st.columns(2)
@@ -173,8 +326,12 @@ def show_edit_form(priority_id: int):
             st.rerun()
 
         if submitted:
+            # Strip inputs once and reuse them for validation and saving
+            bio = biodiversity_priority.strip() if biodiversity_priority else ""
+            simp = simplified_priority.strip() if simplified_priority else None
+
             # Validate
-            if not biodiversity_priority or not biodiversity_priority.strip():
+            if not bio:
                 st.error("❌ Biodiversity Priority is required")
                 return
 
@@ -183,13 +340,12 @@ def show_edit_form(priority_id: int):
                 priority_model.update(
                     priority_id,
                     {
-                        "biodiversity_priority": biodiversity_priority.strip(),
-                        "simplified_biodiversity_priority": simplified_priority.strip()
-                        if simplified_priority
-                        else None,
+                        "biodiversity_priority": bio,
+                        "simplified_biodiversity_priority": simp,
                         "theme": theme,
                     },
                 )
+                invalidate_priority_caches()
                 st.success(f"✅ Successfully updated priority ID {priority_id}!")
                 st.session_state.show_edit_form = False
                 st.rerun()
@@ -199,13 +355,14 @@ def show_edit_form(priority_id: int):
 
 def show_delete_confirmation(priority_id: int):
     """Show confirmation dialog before deleting."""
-    priority_data = priority_model.get_by_id(priority_id)
+    bundle = load_priority_detail(priority_id, get_data_version())
 
-    if not priority_data:
+    if not bundle:
         st.error(f"Priority ID {priority_id} not found")
         return
 
-    counts = priority_model.get_relationship_counts(priority_id)
+    priority_data = bundle["data"]
+    counts = bundle["counts"]
 
     st.warning("⚠️ Are you sure you want to delete this priority?")
 
@@ -232,6 +389,7 @@ def show_delete_confirmation(priority_id: int):
         if st.button("🗑️ Delete Priority", type="primary", width="stretch"):
             try:
                 priority_model.delete_with_cascade(priority_id)
+                invalidate_priority_caches()
                 # Store success message to show after rerun
                 st.session_state.delete_success_message = f"Successfully deleted priority ID {priority_id}!"
                 st.session_state.show_delete_confirm = False
@@ -262,7 +420,7 @@ def show_list_view():
         show_create_form()
         st.markdown("---")
 
-    total_count = priority_model.count()
+    total_count = load_priority_count()
     st.info(f"**{total_count}** biodiversity priorities organized by themes")
 
     # View options
@@ -274,63 +432,38 @@ def show_list_view():
 
     if view_mode == "Grouped by Theme":
         # Get priorities grouped by theme
-        by_theme = priority_model.get_by_theme()
+        by_theme = load_priorities_by_theme()
 
         for theme, priorities in by_theme.items():
-            # Clean theme name (remove non-breaking spaces and other whitespace)
-            clean_theme = theme.strip().replace("\xa0", "")
+            clean_theme = clean_theme_name(theme)
 
             with st.expander(
                 f"**{clean_theme}** ({len(priorities)} priorities)",
                 expanded=True,
             ):
                 # Display priorities in this theme
-                priorities_display = priorities.select(
-                    [
-                        "priority_id",
-                        "biodiversity_priority",
-                        "simplified_biodiversity_priority",
-                    ]
-                )
-
                 st.dataframe(
-                    priorities_display.to_pandas(),
+                    priorities,
                     width="stretch",
                     hide_index=True,
-                    column_config={
-                        "priority_id": st.column_config.NumberColumn(
-                            "ID", width="small"
-                        ),
-                        "biodiversity_priority": st.column_config.TextColumn(
-                            "Biodiversity Priority", width="large"
-                        ),
-                        "simplified_biodiversity_priority": st.column_config.TextColumn(
-                            "Simplified", width="medium"
-                        ),
-                    },
+                    column_config=PRIORITIES_COLUMN_CONFIG,
                     on_select="rerun",
                     selection_mode="single-row",
                 )
 
     else:
         # Show all priorities as a single table
-        all_priorities = priority_model.get_all(order_by="theme, biodiversity_priority")
-
-        # Clean theme names in the dataframe
-        all_priorities = all_priorities.with_columns(
-            pl.col("theme").str.strip_chars().str.replace_all("\xa0", "")
-        )
+        all_priorities = load_all_priorities()
 
         # Add semicolon-delimited CSV export button
         _, col2 = st.columns([4, 1])
         with col2:
             timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
             filename = f"priorities_export_{timestamp}.csv"
-            csv_data = all_priorities.write_csv(separator=";")
 
             st.download_button(
                 label="📥 CSV",
-                data=csv_data,
+                data=export_priorities_csv(),
                 file_name=filename,
                 mime="text/csv",
                 width="stretch",
@@ -349,25 +482,107 @@ def show_list_view():
             title="All Priorities",
             entity_name="priority",
             id_column="priority_id",
-            searchable_columns=[
-                "biodiversity_priority",
-                "simplified_biodiversity_priority",
-                "theme",
-            ],
-            column_config={
-                "priority_id": st.column_config.NumberColumn("ID", width="small"),
-                "biodiversity_priority": st.column_config.TextColumn(
-                    "Biodiversity Priority", width="large"
-                ),
-                "simplified_biodiversity_priority": st.column_config.TextColumn(
-                    "Simplified", width="medium"
-                ),
-                "theme": st.column_config.TextColumn("Theme", width="large"),
-            },
+            searchable_columns=list(PRIORITY_SEARCH_COLUMNS),
+            column_config=PRIORITIES_TABLE_COLUMN_CONFIG,
             show_actions=True,
             on_view_details=on_view_details,
+            search_fn=search_priorities,
+        )
+
+
+@st.fragment
+def render_quick_actions(priority_id: int, is_orphan: bool) -> None:
+    """Render the Quick Actions buttons for a priority.
+
+    Runs as a fragment so the buttons rerun on their own rather than
+    re-rendering the whole detail page.
+
+    Args:
+        priority_id: ID of the priority
+        is_orphan: Whether the priority has no linked measures
+    """
+    if is_orphan:
+        st.warning(
+            "⚠️ **This priority has no linked measures.** "
+            "Use Quick Actions to create links."
         )
 
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button("📋 Link Measure", width="stretch", type="secondary"):
+            # Set session state to pre-fill the form on relationships page
+            st.session_state.quick_link_priority_id = priority_id
+            st.session_state.quick_link_action = "create_map"
+            st.switch_page("ui/pages/relationships.py")
+
+    with col2:
+        if st.button("🦋 Add Species", width="stretch", type="secondary"):
+            # Navigate to species-area-priority tab
+            st.session_state.quick_link_priority_id = priority_id
+            st.session_state.quick_link_action = "create_species"
+            st.switch_page("ui/pages/relationships.py")
+
+    with col3:
+        if st.button("👁️ View All Links", width="stretch", type="secondary"):
+            # Navigate to relationships page filtered for this priority
+            st.session_state.filter_priority_id = priority_id
+            st.switch_page("ui/pages/relationships.py")
+
+
+def render_related_tabs(
+    related_measures: pl.DataFrame,
+    related_areas: pl.DataFrame,
+    related_species: pl.DataFrame,
+) -> None:
+    """Render the related measures, areas and species tabs.
+
+    Args:
+        related_measures: Measures linked to the priority
+        related_areas: Areas linked to the priority
+        related_species: Species linked to the priority
+    """
+    n_measures = related_measures.height
+    n_areas = related_areas.height
+    n_species = related_species.height
+
+    tab1, tab2, tab3 = st.tabs(["Measures", "Areas", "Species"])
+
+    with tab1:
+        if n_measures:
+            st.dataframe(
+                related_measures,
+                width="stretch",
+                hide_index=True,
+                column_config=MEASURES_COLUMN_CONFIG,
+            )
+            st.caption(f"Total: {n_measures:,} measures")
+        else:
+            st.info("No measures linked to this priority.")
+
+    with tab2:
+        if n_areas:
+            st.dataframe(
+                related_areas,
+                width="stretch",
+                hide_index=True,
+                column_config=AREAS_COLUMN_CONFIG,
+            )
+            st.caption(f"Total: {n_areas:,} areas")
+        else:
+            st.info("No areas linked to this priority.")
+
+    with tab3:
+        if n_species:
+            st.dataframe(
+                related_species,
+                width="stretch",
+                hide_index=True,
+                column_config=SPECIES_COLUMN_CONFIG,
+            )
+            st.caption(f"Total: {n_species:,} species")
+        else:
+            st.info("No species linked to this priority.")
+
 
 def show_detail_view():
     """Display details of a single priority."""
@@ -380,23 +595,21 @@ def show_detail_view():
             st.rerun()
         return
 
-    # Get priority data
-    priority_data = priority_model.get_by_id(priority_id)
+    # Get priority data, related data and counts in one cached call
+    bundle = load_priority_detail(priority_id, get_data_version())
 
-    if not priority_data:
+    if not bundle:
         st.error(f"Priority ID {priority_id} not found")
         if st.button("← Back to List"):
             st.session_state.priority_view = "list"
             st.rerun()
         return
 
-    # Get related data
-    related_measures = priority_model.get_related_measures(priority_id)
-    related_areas = priority_model.get_related_areas(priority_id)
-    related_species = priority_model.get_related_species(priority_id)
-
-    # Get counts
-    counts = priority_model.get_relationship_counts(priority_id)
+    priority_data = bundle["data"]
+    related_measures = bundle["measures"]
+    related_areas = bundle["areas"]
+    related_species = bundle["species"]
+    counts = bundle["counts"]
 
     # Display detail view
     def back_to_list():
@@ -426,35 +639,8 @@ def show_detail_view():
     st.markdown("---")
     st.subheader("⚡ Quick Actions")
 
-    # Check for orphan status (priority not linked to any measures)
-    is_orphan = counts["measures"] == 0
-
-    if is_orphan:
-        st.warning(
-            "⚠️ **This priority has no linked measures.** "
-            "Use Quick Actions to create links."
-        )
-
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        if st.button("📋 Link Measure", width="stretch", type="secondary"):
-            # Set session state to pre-fill the form on relationships page
-            st.session_state.quick_link_priority_id = priority_id
-            st.session_state.quick_link_action = "create_map"
-            st.switch_page("ui/pages/relationships.py")
-
-    with col2:
-        if st.button("🦋 Add Species", width="stretch", type="secondary"):
-            # Navigate to species-area-priority tab
-            st.session_state.quick_link_priority_id = priority_id
-            st.session_state.quick_link_action = "create_species"
-            st.switch_page("ui/pages/relationships.py")
-
-    with col3:
-        if st.button("👁️ View All Links", width="stretch", type="secondary"):
-            # Navigate to relationships page filtered for this priority
-            st.session_state.filter_priority_id = priority_id
-            st.switch_page("ui/pages/relationships.py")
+    # Orphan = priority not linked to any measures
+    render_quick_actions(priority_id, is_orphan=counts["measures"] == 0)
 
     # Show edit form if requested
     if st.session_state.show_edit_form:
@@ -475,9 +661,7 @@ def show_detail_view():
 
     with col1:
         st.markdown(f"**ID:** {priority_data['priority_id']}")
-        # Clean theme name for display
-        clean_theme = priority_data["theme"].strip().replace("\xa0", "")
-        st.markdown(f"**Theme:** {clean_theme}")
+        st.markdown(f"**Theme:** {clean_theme_name(priority_data['theme'])}")
         st.markdown("**Biodiversity Priority:**")
         st.info(priority_data["biodiversity_priority"])
 
@@ -498,71 +682,7 @@ def show_detail_view():
     st.markdown("---")
     st.subheader("Related Data")
 
-    tab1, tab2, tab3 = st.tabs(["Measures", "Areas", "Species"])
-
-    with tab1:
-        if len(related_measures) > 0:
-            st.dataframe(
-                related_measures.to_pandas(),
-                width="stretch",
-                hide_index=True,
-                column_config={
-                    "measure_id": st.column_config.NumberColumn("ID", width="small"),
-                    "measure": st.column_config.TextColumn("Measure", width="large"),
-                    "concise_measure": st.column_config.TextColumn(
-                        "Concise", width="medium"
-                    ),
-                    "core_supplementary": st.column_config.TextColumn(
-                        "Type", width="small"
-                    ),
-                },
-            )
-            st.caption(f"Total: {len(related_measures):,} measures")
-        else:
-            st.info("No measures linked to this priority.")
-
-    with tab2:
-        if len(related_areas) > 0:
-            st.dataframe(
-                related_areas.to_pandas(),
-                width="stretch",
-                hide_index=True,
-                column_config={
-                    "area_id": st.column_config.NumberColumn("ID", width="small"),
-                    "area_name": st.column_config.TextColumn(
-                        "Area Name", width="medium"
-                    ),
-                    "area_description": st.column_config.TextColumn(
-                        "Description", width="large"
-                    ),
-                },
-            )
-            st.caption(f"Total: {len(related_areas):,} areas")
-        else:
-            st.info("No areas linked to this priority.")
-
-    with tab3:
-        if len(related_species) > 0:
-            st.dataframe(
-                related_species.to_pandas(),
-                width="stretch",
-                hide_index=True,
-                column_config={
-                    "species_id": st.column_config.NumberColumn("ID", width="small"),
-                    "common_name": st.column_config.TextColumn(
-                        "Common Name", width="medium"
-                    ),
-                    "linnaean_name": st.column_config.TextColumn(
-                        "Scientific Name", width="medium"
-                    ),
-                    "assemblage": st.column_config.TextColumn(
-                        "Assemblage", width="medium"
-                    ),
-                },
-            )
-            st.caption(f"Total: {len(related_species):,} species")
-        else:
-            st.info("No species linked to this priority.")
+    render_related_tabs(related_measures, related_areas, related_species)
 
 
 # Main page logic
@@ -1,45 +1,381 @@
 """Relationships page - Manage many-to-many relationships (bridge tables)."""
 
+import re
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
 
 import polars as pl
 import streamlit as st
 
 # Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from models.area import AreaModel  # noqa: E402
-from models.grant import GrantModel  # noqa: E402
-from models.habitat import HabitatModel  # noqa: E402
 from models.measure import MeasureModel  # noqa: E402
 from models.priority import PriorityModel  # noqa: E402
 from models.relationship import RelationshipModel  # noqa: E402
-from models.species import SpeciesModel  # noqa: E402
+from ui.components.data_version import (  # noqa: E402
+    bump_data_version,
+    get_data_version,
+)
+from ui.components.tables import (  # noqa: E402
+    get_page,
+    show_pagination_controls,
+)
+
+if TYPE_CHECKING:
+    from models.grant import GrantModel
+    from models.habitat import HabitatModel
+    from models.species import SpeciesModel
+
+
+@st.cache_resource
+def get_relationship_model() -> RelationshipModel:
+    """Get the shared relationship model instance (cached as a resource)."""
+    return RelationshipModel()
+
+
+@st.cache_resource
+def get_measure_model() -> MeasureModel:
+    """Get the shared measure model instance (cached as a resource)."""
+    return MeasureModel()
+
+
+@st.cache_resource
+def get_area_model() -> AreaModel:
+    """Get the shared area model instance (cached as a resource)."""
+    return AreaModel()
+
+
+@st.cache_resource
+def get_priority_model() -> PriorityModel:
+    """Get the shared priority model instance (cached as a resource)."""
+    return PriorityModel()
+
+
+@st.cache_resource
+def get_grant_model() -> "GrantModel":
+    """Get the shared grant model instance (cached as a resource).
+
+    Imported on first use: the model is only needed once a link form opens.
+    """
+    from models.grant import GrantModel
+
+    return GrantModel()
+
+
+@st.cache_resource
+def get_species_model() -> "SpeciesModel":
+    """Get the shared species model instance (cached as a resource).
+
+    Imported on first use: the model is only needed once a link form opens.
+    """
+    from models.species import SpeciesModel
+
+    return SpeciesModel()
+
+
+@st.cache_resource
+def get_habitat_model() -> "HabitatModel":
+    """Get the shared habitat model instance (cached as a resource).
+
+    Imported on first use: the model is only needed once a link form opens.
+    """
+    from models.habitat import HabitatModel
+
+    return HabitatModel()
+
+
+# Initialize models - each is created once per process and shared by all
+# sessions, rather than once per page rerun. The grant, species and habitat
+# models are only used by the link forms, so they are fetched on demand.
+relationship_model = get_relationship_model()
+measure_model = get_measure_model()
+area_model = get_area_model()
+priority_model = get_priority_model()
+
+# Link tables send at most this many rows to the browser
+MAX_DISPLAY_ROWS = 5000
+
+# Rows per page of the paginated link tables (page number kept in the URL)
+LINK_PAGE_SIZE = 500
+
+def label_text(column: str) -> pl.Expr:
+    """Get a text column for use in a label, with missing values as "".
+
+    pl.format returns null if any of its inputs is null, so every nullable
+    column in a label goes through this.
+
+    Args:
+        column: Column name
+
+    Returns:
+        pl.Expr: The column with nulls replaced by empty strings
+    """
+    return pl.col(column).fill_null("")
+
+
+# Dropdown labels for the link forms, built as Polars expressions so a whole
+# table is formatted in one pass. Each label starts with the record ID.
+MEASURE_LABEL = pl.format(
+    "{} - {}",
+    "measure_id",
+    pl.when(label_text("concise_measure") != "")
+    .then(pl.col("concise_measure"))
+    .otherwise(label_text("measure").str.slice(0, 80)),
+)
+AREA_LABEL = pl.format("{} - {}", "area_id", label_text("area_name"))
+PRIORITY_LABEL = pl.format(
+    "{} - [{}] {}",
+    "priority_id",
+    label_text("theme"),
+    label_text("simplified_biodiversity_priority"),
+)
+UNFUNDED_LINK_LABEL = pl.format(
+    "M{} A{} P{} - {} in {}",
+    "measure_id",
+    "area_id",
+    "priority_id",
+    label_text("concise_measure").str.slice(0, 40),
+    label_text("area_name"),
+)
+GRANT_LABEL = pl.format(
+    "{} - [{}] {}",
+    "grant_id",
+    label_text("grant_scheme"),
+    label_text("grant_name"),
+)
+SPECIES_LABEL = pl.format(
+    "{} - {} ({})",
+    "species_id",
+    label_text("common_name"),
+    label_text("linnaean_name"),
+)
+HABITAT_LABEL = pl.format("{} - {}", "habitat_id", label_text("habitat"))
+
+# Reference table -> (ID column, label expression) for the form dropdowns
+REFERENCE_LABELS = {
+    "measures": ("measure_id", MEASURE_LABEL),
+    "areas": ("area_id", AREA_LABEL),
+    "priorities": ("priority_id", PRIORITY_LABEL),
+    "species": ("species_id", SPECIES_LABEL),
+    "grants": ("grant_id", GRANT_LABEL),
+    "habitats": ("habitat_id", HABITAT_LABEL),
+}
+
+
+# Reference tables behind the link form dropdowns (cached for 10 minutes)
+@st.cache_data(ttl=600, show_spinner=False)
+def load_reference_data(data_version: str) -> dict[str, pl.DataFrame]:
+    """Get every reference table used by the link form dropdowns.
+
+    The tables are fetched together and cached as one bundle, so opening
+    several forms in a session reuses the same reads.
+
+    Args:
+        data_version: get_data_version() stamp, so entity changes made on
+            any page reload the tables
+
+    Returns:
+        dict: measures, areas, priorities, species, grants and habitats
+    """
+    return {
+        "measures": measure_model.get_all(),
+        "areas": area_model.get_all(),
+        "priorities": priority_model.get_all(),
+        "species": get_species_model().get_all(),
+        "grants": get_grant_model().get_all(),
+        "habitats": get_habitat_model().get_all(),
+    }
+
+
+@st.cache_data(ttl=120, show_spinner="Loading links...")
+def load_measure_area_priority_links(data_version: str) -> pl.DataFrame:
+    """Get all measure-area-priority links with entity names.
+
+    Args:
+        data_version: get_data_version() stamp, so cascade deletes made on
+            the entity pages drop their links
+
+    Returns:
+        pl.DataFrame: All measure-area-priority links
+    """
+    return relationship_model.get_all_measure_area_priority()
+
+
+@st.cache_data(ttl=120, show_spinner="Loading links...")
+def load_grant_links(data_version: str) -> pl.DataFrame:
+    """Get all grant-funded measure-area-priority links.
+
+    Args:
+        data_version: get_data_version() stamp, so cascade deletes made on
+            the entity pages drop their links
+
+    Returns:
+        pl.DataFrame: All measure-area-priority-grant links
+    """
+    return relationship_model.get_all_measure_area_priority_grants()
+
+
+@st.cache_data(ttl=120, show_spinner="Loading links...")
+def load_unfunded_links(data_version: str) -> pl.DataFrame:
+    """Get measure-area-priority links that have no grant.
+
+    Args:
+        data_version: get_data_version() stamp, so cascade deletes made on
+            the entity pages drop their links
+
+    Returns:
+        pl.DataFrame: Unfunded measure-area-priority links
+    """
+    return relationship_model.get_unfunded_measure_area_priority_links()
+
+
+@st.cache_data(ttl=120, show_spinner="Loading links...")
+def load_species_links(data_version: str) -> pl.DataFrame:
+    """Get all species-area-priority links with entity names.
+
+    Args:
+        data_version: get_data_version() stamp, so cascade deletes made on
+            the entity pages drop their links
+
+    Returns:
+        pl.DataFrame: All species-area-priority links
+    """
+    return relationship_model.get_all_species_area_priority()
+
+
+@st.cache_data(ttl=120, show_spinner="Loading links...")
+def load_habitat_creation_links(data_version: str) -> pl.DataFrame:
+    """Get all habitat creation links with entity names.
+
+    Args:
+        data_version: get_data_version() stamp, so cascade deletes made on
+            the entity pages drop their links
+
+    Returns:
+        pl.DataFrame: All habitat-creation-area links
+    """
+    return relationship_model.get_all_habitat_creation_areas()
+
+
+@st.cache_data(ttl=120, show_spinner="Loading links...")
+def load_habitat_management_links(data_version: str) -> pl.DataFrame:
+    """Get all habitat management links with entity names.
+
+    Args:
+        data_version: get_data_version() stamp, so cascade deletes made on
+            the entity pages drop their links
+
+    Returns:
+        pl.DataFrame: All habitat-management-area links
+    """
+    return relationship_model.get_all_habitat_management_areas()
+
+
+def option_label_map(
+    options: pl.DataFrame, id_columns: str | list[str], label: pl.Expr
+) -> dict[Any, str]:
+    """Map each row's ID to its dropdown label.
+
+    Used as ``options=list(labels)`` with ``format_func=labels.get`` so the
+    widget returns IDs directly instead of strings that need parsing.
+
+    Args:
+        options: Reference table (or link listing) to label
+        id_columns: ID column, or columns for a composite key (tuple IDs)
+        label: Label expression, e.g. MEASURE_LABEL
+
+    Returns:
+        dict: ID -> label, in table order
+    """
+    labels = options.select(label.alias("label")).to_series().to_list()
+    if isinstance(id_columns, str):
+        ids = options.get_column(id_columns).to_list()
+    else:
+        ids = options.select(id_columns).rows()
+    return dict(zip(ids, labels, strict=True))
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_reference_labels(table: str, data_version: str) -> dict[int | str, str]:
+    """Get the ID -> label map for a reference table (cached for 10 minutes).
+
+    Shared by every link form, so each map is built once rather than on
+    every form render.
+
+    Args:
+        table: Key of load_reference_data, e.g. "measures"
+        data_version: get_data_version() stamp the map was built for
+
+    Returns:
+        dict: ID -> dropdown label, in table order
+    """
+    id_column, label = REFERENCE_LABELS[table]
+    reference_data = load_reference_data(data_version)
+    return option_label_map(reference_data[table], id_column, label)
+
+
+def filter_options(links: pl.DataFrame, column: str) -> list[str]:
+    """Get the sorted distinct values of a column for a filter dropdown.
+
+    Nulls and empty strings are dropped, and the de-duplication and sort
+    run in Polars before a single conversion to a Python list.
+
+    Args:
+        links: Link listing to take the values from
+        column: Column to list the values of
+
+    Returns:
+        list[str]: Sorted distinct non-empty values
+    """
+    return (
+        links.lazy()
+        .select(pl.col(column).drop_nulls().unique().sort())
+        .filter(pl.col(column) != "")
+        .collect()
+        .to_series()
+        .to_list()
+    )
+
+
+def show_row_cap_caption(filtered_count: int) -> None:
+    """Note when a link table has been truncated to MAX_DISPLAY_ROWS.
+
+    Args:
+        filtered_count: Number of rows matching the current filters
+    """
+    if filtered_count > MAX_DISPLAY_ROWS:
+        st.caption(
+            f"Displaying the first {MAX_DISPLAY_ROWS:,} rows - "
+            "use the filters to narrow the results."
+        )
+
+
+def invalidate_link_caches() -> None:
+    """Drop cached link listings after a link is created or deleted."""
+    load_measure_area_priority_links.clear()
+    load_grant_links.clear()
+    load_unfunded_links.clear()
+    load_species_links.clear()
+    load_habitat_creation_links.clear()
+    load_habitat_management_links.clear()
+    bump_data_version()
 
-# Initialize models
-relationship_model = RelationshipModel()
-measure_model = MeasureModel()
-area_model = AreaModel()
-priority_model = PriorityModel()
-grant_model = GrantModel()
-species_model = SpeciesModel()
-habitat_model = HabitatModel()
 
 # Initialize session state for each relationship type
-if "show_create_map_form" not in st.session_state:
-    st.session_state.show_create_map_form = False
-if "show_bulk_create_map_form" not in st.session_state:
-    st.session_state.show_bulk_create_map_form = False
-if "show_create_grant_form" not in st.session_state:
-    st.session_state.show_create_grant_form = False
-if "show_create_species_form" not in st.session_state:
-    st.session_state.show_create_species_form = False
-if "show_create_habitat_creation_form" not in st.session_state:
-    st.session_state.show_create_habitat_creation_form = False
-if "show_create_habitat_management_form" not in st.session_state:
-    st.session_state.show_create_habitat_management_form = False
+for form_flag in (
+    "show_create_map_form",
+    "show_bulk_create_map_form",
+    "show_create_grant_form",
+    "show_create_species_form",
+    "show_create_habitat_creation_form",
+    "show_create_habitat_management_form",
+):
+    st.session_state.setdefault(form_flag, False)
 
 # Quick Link navigation handling
 if "quick_link_action" in st.session_state and st.session_state.quick_link_action:
@@ -62,6 +398,7 @@ if "quick_link_action" in st.session_state and st.session_state.quick_link_actio
 # ==============================================================================
 
 
+@st.fragment
 def show_measure_area_priority_interface():
     """Display interface for managing measure-area-priority relationships."""
     st.header("Measure-Area-Priority Links")
@@ -90,7 +427,7 @@ def show_measure_area_priority_interface():
         st.markdown("---")
 
     # Get all links
-    all_links = relationship_model.get_all_measure_area_priority()
+    all_links = load_measure_area_priority_links(get_data_version())
 
     st.metric("Total Links", f"{len(all_links):,}")
 
@@ -102,16 +439,14 @@ def show_measure_area_priority_interface():
 
     with col1:
         # Filter by theme (filter out None values)
-        unique_themes = all_links["theme"].unique().to_list()
-        themes = sorted([t for t in unique_themes if t is not None])
+        themes = filter_options(all_links, "theme")
         selected_theme = st.selectbox(
             "Filter by Theme", ["All"] + themes, key="map_theme_filter"
         )
 
     with col2:
         # Filter by area (filter out None values)
-        unique_areas = all_links["area_name"].unique().to_list()
-        areas = sorted([a for a in unique_areas if a is not None])
+        areas = filter_options(all_links, "area_name")
         selected_area = st.selectbox(
             "Filter by Area", ["All"] + areas, key="map_area_filter"
         )
@@ -122,40 +457,50 @@ def show_measure_area_priority_interface():
             "Search Measure", placeholder="Type to search...", key="map_search"
         )
 
-    # Apply filters
-    filtered_links = all_links.clone()
+    # Apply filters as one lazy query so Polars fuses the predicates
+    links_query = all_links.lazy()
 
     if selected_theme != "All":
-        filtered_links = filtered_links.filter(pl.col("theme") == selected_theme)
+        links_query = links_query.filter(pl.col("theme") == selected_theme)
 
     if selected_area != "All":
-        filtered_links = filtered_links.filter(pl.col("area_name") == selected_area)
+        links_query = links_query.filter(pl.col("area_name") == selected_area)
 
     if search_term:
-        filtered_links = filtered_links.filter(
-            pl.col("concise_measure")
-            .str.to_lowercase()
-            .str.contains(search_term.lower())
-            | pl.col("measure").str.to_lowercase().str.contains(search_term.lower())
+        # Case-insensitive regex match on the escaped term, no lowercased copies
+        pattern = f"(?i){re.escape(search_term)}"
+        links_query = links_query.filter(
+            pl.any_horizontal(
+                pl.col("concise_measure").str.contains(pattern),
+                pl.col("measure").str.contains(pattern),
+            )
         )
 
-    st.info(f"Showing {len(filtered_links):,} of {len(all_links):,} links")
+    filtered_count = links_query.select(pl.len()).collect().item()
+
+    st.info(f"Showing {filtered_count:,} of {len(all_links):,} links")
 
     # Display table with actions
-    if len(filtered_links) > 0:
-        display_df = filtered_links.select(
-            [
-                "measure_id",
-                "concise_measure",
-                "area_name",
-                "simplified_biodiversity_priority",
-                "theme",
-            ]
+    if filtered_count > 0:
+        # Only the current page is collected and sent to the browser
+        page = get_page("map_page", filtered_count, LINK_PAGE_SIZE)
+        display_df = (
+            links_query.select(
+                [
+                    "measure_id",
+                    "concise_measure",
+                    "area_name",
+                    "simplified_biodiversity_priority",
+                    "theme",
+                ]
+            )
+            .slice(page * LINK_PAGE_SIZE, LINK_PAGE_SIZE)
+            .collect()
         )
 
         # Add delete functionality
         st.dataframe(
-            display_df.to_pandas(),
+            display_df,
             width="stretch",
             hide_index=True,
             column_config={
@@ -173,6 +518,8 @@ def show_measure_area_priority_interface():
             },
         )
 
+        show_pagination_controls("map_page", page, filtered_count, LINK_PAGE_SIZE)
+
         # Delete section
         with st.expander("🗑️ Delete Link"):
             st.warning("⚠️ Delete a measure-area-priority link")
@@ -196,19 +543,17 @@ def show_measure_area_priority_interface():
 
             if st.button("🗑️ Delete Link", type="primary", key="delete_map_link_btn"):
                 try:
-                    # Check if link exists
-                    if relationship_model.link_exists_measure_area_priority(
+                    # One round trip: the delete reports whether the link existed
+                    if relationship_model.delete_measure_area_priority_link_checked(
                         delete_measure_id, delete_area_id, delete_priority_id
                     ):
-                        relationship_model.delete_measure_area_priority_link(
-                            delete_measure_id, delete_area_id, delete_priority_id
-                        )
                         success_msg = (
                             f"✅ Successfully deleted link: Measure "
                             f"{delete_measure_id} - Area {delete_area_id} - "
                             f"Priority {delete_priority_id}"
                         )
                         st.success(success_msg)
+                        invalidate_link_caches()
                         st.rerun()
                     else:
                         st.error("❌ Link does not exist")
@@ -255,51 +600,32 @@ def show_create_map_form():
         st.session_state.quick_link_priority_id = None
 
     # Get options for dropdowns
-    all_measures = measure_model.get_all()
-    all_areas = area_model.get_all()
-    all_priorities = priority_model.get_all()
+    measure_labels = load_reference_labels("measures", get_data_version())
+    area_labels = load_reference_labels("areas", get_data_version())
+    priority_labels = load_reference_labels("priorities", get_data_version())
 
     with st.form("create_map_form", clear_on_submit=True):
         # Measure selection
-        measure_options = all_measures.select(
-            ["measure_id", "concise_measure", "measure"]
-        )
-        measure_display = [
-            f"{row['measure_id']} - {row['concise_measure'] or row['measure'][:80]}"
-            for row in measure_options.iter_rows(named=True)
-        ]
-        selected_measure = st.selectbox(
+        measure_id = st.selectbox(
             "Select Measure*",
-            options=measure_display,
+            options=list(measure_labels),
+            format_func=measure_labels.get,
             help="Select the measure to link",
         )
 
         # Area selection
-        area_options = all_areas.select(["area_id", "area_name"])
-        area_display = [
-            f"{row['area_id']} - {row['area_name']}"
-            for row in area_options.iter_rows(named=True)
-        ]
-        selected_area = st.selectbox(
+        area_id = st.selectbox(
             "Select Area*",
-            options=area_display,
+            options=list(area_labels),
+            format_func=area_labels.get,
             help="Select the priority area",
         )
 
         # Priority selection
-        priority_options = all_priorities.select(
-            ["priority_id", "simplified_biodiversity_priority", "theme"]
-        )
-        priority_display = [
-            (
-                f"{row['priority_id']} - [{row['theme']}] "
-                f"{row['simplified_biodiversity_priority']}"
-            )
-            for row in priority_options.iter_rows(named=True)
-        ]
-        selected_priority = st.selectbox(
+        priority_id = st.selectbox(
             "Select Priority*",
-            options=priority_display,
+            options=list(priority_labels),
+            format_func=priority_labels.get,
             help="Select the biodiversity priority",
         )
 
@@ -316,11 +642,6 @@ def show_create_map_form():
             st.rerun()
 
         if submitted:
-            # Parse IDs from selections
-            measure_id = int(selected_measure.split(" - ")[0])
-            area_id = int(selected_area.split(" - ")[0])
-            priority_id = int(selected_priority.split(" - ")[0])
-
             # Create link
             try:
                 relationship_model.create_measure_area_priority_link(
@@ -331,6 +652,7 @@ def show_create_map_form():
                     f"Area {area_id} - Priority {priority_id}"
                 )
                 st.session_state.show_create_map_form = False
+                invalidate_link_caches()
                 st.rerun()
             except ValueError as e:
                 st.error(f"❌ {str(e)}")
@@ -347,65 +669,42 @@ def show_bulk_create_map_form():
     )
 
     # Get options for multi-select
-    all_measures = measure_model.get_all()
-    all_areas = area_model.get_all()
-    all_priorities = priority_model.get_all()
+    measure_labels = load_reference_labels("measures", get_data_version())
+    area_labels = load_reference_labels("areas", get_data_version())
+    priority_labels = load_reference_labels("priorities", get_data_version())
 
     with st.form("bulk_create_map_form", clear_on_submit=True):
         # Measure multi-select
-        measure_options = all_measures.select(
-            ["measure_id", "concise_measure", "measure"]
-        )
-        measure_display = {
-            (
-                f"{row['measure_id']} - {row['concise_measure'] or row['measure'][:80]}"
-            ): row["measure_id"]
-            for row in measure_options.iter_rows(named=True)
-        }
-        selected_measures = st.multiselect(
+        measure_ids = st.multiselect(
             "Select Measures*",
-            options=list(measure_display.keys()),
+            options=list(measure_labels),
+            format_func=measure_labels.get,
             help="Select one or more measures to link",
         )
 
         # Area multi-select
-        area_options = all_areas.select(["area_id", "area_name"])
-        area_display = {
-            f"{row['area_id']} - {row['area_name']}": row["area_id"]
-            for row in area_options.iter_rows(named=True)
-        }
-        selected_areas = st.multiselect(
+        area_ids = st.multiselect(
             "Select Areas*",
-            options=list(area_display.keys()),
+            options=list(area_labels),
+            format_func=area_labels.get,
             help="Select one or more priority areas",
         )
 
         # Priority multi-select
-        priority_options = all_priorities.select(
-            ["priority_id", "simplified_biodiversity_priority", "theme"]
-        )
-        priority_display = {
-            (
-                f"{row['priority_id']} - [{row['theme']}] "
-                f"{row['simplified_biodiversity_priority']}"
-            ): row["priority_id"]
-            for row in priority_options.iter_rows(named=True)
-        }
-        selected_priorities = st.multiselect(
+        priority_ids = st.multiselect(
             "Select Priorities*",
-            options=list(priority_display.keys()),
+            options=list(priority_labels),
+            format_func=priority_labels.get,
             help="Select one or more biodiversity priorities",
         )
 
         # Calculate total links that will be created
-        total_links = (
-            len(selected_measures) * len(selected_areas) * len(selected_priorities)
-        )
+        total_links = len(measure_ids) * len(area_ids) * len(priority_ids)
         if total_links > 0:
             st.warning(
                 f"⚠️ This will attempt to create **{total_links}** links "
-                f"({len(selected_measures)} measures × {len(selected_areas)} areas × "
-                f"{len(selected_priorities)} priorities)"
+                f"({len(measure_ids)} measures × {len(area_ids)} areas × "
+                f"{len(priority_ids)} priorities)"
             )
 
         col1, col2 = st.columns(2)
@@ -424,35 +723,40 @@ def show_bulk_create_map_form():
             st.rerun()
 
         if submitted and total_links > 0:
-            # Parse IDs from selections
-            measure_ids = [measure_display[m] for m in selected_measures]
-            area_ids = [area_display[a] for a in selected_areas]
-            priority_ids = [priority_display[p] for p in selected_priorities]
-
-            # Create links
-            with st.spinner(f"Creating {total_links} links..."):
+            # All links are created in one transaction, so a failure leaves
+            # the links table unchanged
+            with st.status(f"Creating {total_links} links...") as status:
                 try:
                     created_count, errors = (
                         relationship_model.bulk_create_measure_area_priority_links(
                             measure_ids, area_ids, priority_ids
                         )
                     )
+                    status.update(
+                        label=f"Created {created_count:,} links", state="complete"
+                    )
+                except Exception as e:
+                    status.update(label="Bulk create failed", state="error")
+                    st.error(
+                        f"❌ Error during bulk create: {str(e)} "
+                        "(no links were created)"
+                    )
+                    return
 
-                    if created_count > 0:
-                        st.success(f"✅ Successfully created {created_count} links!")
+            if created_count > 0:
+                st.success(f"✅ Successfully created {created_count} links!")
 
-                    if errors:
-                        st.warning(f"⚠️ Encountered {len(errors)} issues:")
-                        with st.expander("Show errors"):
-                            for error in errors[:20]:  # Show first 20 errors
-                                st.text(error)
-                            if len(errors) > 20:
-                                st.text(f"... and {len(errors) - 20} more errors")
+            if errors:
+                st.warning(f"⚠️ Encountered {len(errors)} issues:")
+                with st.expander("Show errors"):
+                    for error in errors[:20]:  # Show first 20 errors
+                        st.text(error)
+                    if len(errors) > 20:
+                        st.text(f"... and {len(errors) - 20} more errors")
 
-                    st.session_state.show_bulk_create_map_form = False
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"❌ Error during bulk create: {str(e)}")
+            st.session_state.show_bulk_create_map_form = False
+            invalidate_link_caches()
+            st.rerun()
 
 
 # ==============================================================================
@@ -460,6 +764,7 @@ def show_bulk_create_map_form():
 # ==============================================================================
 
 
+@st.fragment
 def show_grant_funding_interface():
     """Display interface for managing grant funding (measure_area_priority_grant)."""
     st.header("Grant Funding")
@@ -478,8 +783,8 @@ def show_grant_funding_interface():
         st.markdown("---")
 
     # Get all grant-funded links
-    grant_links = relationship_model.get_all_measure_area_priority_grants()
-    unfunded_links = relationship_model.get_unfunded_measure_area_priority_links()
+    grant_links = load_grant_links(get_data_version())
+    unfunded_links = load_unfunded_links(get_data_version())
 
     col1, col2 = st.columns(2)
     with col1:
@@ -492,35 +797,39 @@ def show_grant_funding_interface():
 
     if len(grant_links) > 0:
         # Filter by grant scheme (filter out None values)
-        schemes = sorted(
-            [s for s in grant_links["grant_scheme"].unique().to_list() if s is not None]
-        )
+        schemes = filter_options(grant_links, "grant_scheme")
         selected_scheme = st.selectbox(
             "Filter by Grant Scheme", ["All"] + schemes, key="grant_scheme_filter"
         )
 
-        filtered_grants = grant_links.clone()
+        grants_query = grant_links.lazy()
         if selected_scheme != "All":
-            filtered_grants = filtered_grants.filter(
+            grants_query = grants_query.filter(
                 pl.col("grant_scheme") == selected_scheme
             )
 
-        st.info(f"Showing {len(filtered_grants):,} of {len(grant_links):,} grant links")
-
-        display_df = filtered_grants.select(
-            [
-                "measure_id",
-                "concise_measure",
-                "area_name",
-                "simplified_biodiversity_priority",
-                "grant_name",
-                "grant_scheme",
-                "url",
-            ]
+        filtered_count = grants_query.select(pl.len()).collect().item()
+        st.info(f"Showing {filtered_count:,} of {len(grant_links):,} grant links")
+
+        display_df = (
+            grants_query.select(
+                [
+                    "measure_id",
+                    "concise_measure",
+                    "area_name",
+                    "simplified_biodiversity_priority",
+                    "grant_name",
+                    "grant_scheme",
+                    "url",
+                ]
+            )
+            .head(MAX_DISPLAY_ROWS)
+            .collect()
         )
+        show_row_cap_caption(filtered_count)
 
         st.dataframe(
-            display_df.to_pandas(),
+            display_df,
             width="stretch",
             hide_index=True,
             column_config={
@@ -548,21 +857,21 @@ def show_create_grant_form():
     st.subheader("➕ Add Grant Funding to Link")
 
     # Get options
-    unfunded_links = relationship_model.get_unfunded_measure_area_priority_links()
-    all_grants = grant_model.get_all()
+    link_labels = option_label_map(
+        load_unfunded_links(get_data_version()),
+        ["measure_id", "area_id", "priority_id"],
+        UNFUNDED_LINK_LABEL,
+    )
+    grant_labels = load_reference_labels("grants", get_data_version())
 
     with st.form("create_grant_form", clear_on_submit=True):
         st.write("**Step 1: Select Unfunded Link**")
 
-        if len(unfunded_links) > 0:
-            link_display = [
-                f"M{row['measure_id']} A{row['area_id']} P{row['priority_id']} - "
-                f"{row['concise_measure'][:40]} in {row['area_name']}"
-                for row in unfunded_links.iter_rows(named=True)
-            ]
+        if link_labels:
             selected_link = st.selectbox(
                 "Select Link",
-                options=link_display,
+                options=list(link_labels),
+                format_func=link_labels.get,
                 help="Select an unfunded measure-area-priority link",
             )
         else:
@@ -572,14 +881,10 @@ def show_create_grant_form():
 
         st.write("**Step 2: Select Grant**")
 
-        grant_options = all_grants.select(["grant_id", "grant_name", "grant_scheme"])
-        grant_display = [
-            f"{row['grant_id']} - [{row['grant_scheme']}] {row['grant_name']}"
-            for row in grant_options.iter_rows(named=True)
-        ]
-        selected_grant = st.selectbox(
+        grant_id = st.selectbox(
             "Select Grant",
-            options=grant_display,
+            options=list(grant_labels),
+            format_func=grant_labels.get,
             help="Select the grant to link",
         )
 
@@ -596,13 +901,7 @@ def show_create_grant_form():
             st.rerun()
 
         if submitted:
-            # Parse IDs
-            link_parts = selected_link.split(" - ")[0]
-            measure_id = int(link_parts.split("M")[1].split(" A")[0])
-            area_id = int(link_parts.split(" A")[1].split(" P")[0])
-            priority_id = int(link_parts.split(" P")[1])
-
-            grant_id = int(selected_grant.split(" - ")[0])
+            measure_id, area_id, priority_id = selected_link
 
             # Add grant
             try:
@@ -614,6 +913,7 @@ def show_create_grant_form():
                     f"M{measure_id}-A{area_id}-P{priority_id}"
                 )
                 st.session_state.show_create_grant_form = False
+                invalidate_link_caches()
                 st.rerun()
             except ValueError as e:
                 st.error(f"❌ {str(e)}")
@@ -626,6 +926,7 @@ def show_create_grant_form():
 # ==============================================================================
 
 
+@st.fragment
 def show_species_area_priority_interface():
     """Display interface for managing species-area-priority relationships."""
     st.header("Species-Area-Priority Links")
@@ -644,7 +945,7 @@ def show_species_area_priority_interface():
         st.markdown("---")
 
     # Get all links
-    species_links = relationship_model.get_all_species_area_priority()
+    species_links = load_species_links(get_data_version())
 
     st.metric("Total Links", f"{len(species_links):,}")
 
@@ -653,37 +954,41 @@ def show_species_area_priority_interface():
 
     if len(species_links) > 0:
         # Filter by assemblage
-        assemblages = sorted(
-            [a for a in species_links["assemblage"].unique().to_list() if a]
-        )
+        assemblages = filter_options(species_links, "assemblage")
         selected_assemblage = st.selectbox(
             "Filter by Assemblage",
             ["All"] + assemblages,
             key="species_assemblage_filter",
         )
 
-        filtered_links = species_links.clone()
+        links_query = species_links.lazy()
         if selected_assemblage != "All":
-            filtered_links = filtered_links.filter(
+            links_query = links_query.filter(
                 pl.col("assemblage") == selected_assemblage
             )
 
-        st.info(f"Showing {len(filtered_links):,} of {len(species_links):,} links")
-
-        display_df = filtered_links.select(
-            [
-                "species_id",
-                "common_name",
-                "linnaean_name",
-                "assemblage",
-                "area_name",
-                "simplified_biodiversity_priority",
-                "theme",
-            ]
+        filtered_count = links_query.select(pl.len()).collect().item()
+        st.info(f"Showing {filtered_count:,} of {len(species_links):,} links")
+
+        display_df = (
+            links_query.select(
+                [
+                    "species_id",
+                    "common_name",
+                    "linnaean_name",
+                    "assemblage",
+                    "area_name",
+                    "simplified_biodiversity_priority",
+                    "theme",
+                ]
+            )
+            .head(MAX_DISPLAY_ROWS)
+            .collect()
         )
+        show_row_cap_caption(filtered_count)
 
         st.dataframe(
-            display_df.to_pandas(),
+            display_df,
             width="stretch",
             hide_index=True,
             column_config={
@@ -732,51 +1037,32 @@ def show_create_species_form():
         st.session_state.quick_link_priority_id = None
 
     # Get options
-    all_species = species_model.get_all()
-    all_areas = area_model.get_all()
-    all_priorities = priority_model.get_all()
+    species_labels = load_reference_labels("species", get_data_version())
+    area_labels = load_reference_labels("areas", get_data_version())
+    priority_labels = load_reference_labels("priorities", get_data_version())
 
     with st.form("create_species_form", clear_on_submit=True):
         # Species selection
-        species_options = all_species.select(
-            ["species_id", "common_name", "linnaean_name"]
-        )
-        species_display = [
-            f"{row['species_id']} - {row['common_name']} ({row['linnaean_name']})"
-            for row in species_options.iter_rows(named=True)
-        ]
-        selected_species = st.selectbox(
+        species_id = st.selectbox(
             "Select Species*",
-            options=species_display,
+            options=list(species_labels),
+            format_func=species_labels.get,
             help="Select the species",
         )
 
         # Area selection
-        area_options = all_areas.select(["area_id", "area_name"])
-        area_display = [
-            f"{row['area_id']} - {row['area_name']}"
-            for row in area_options.iter_rows(named=True)
-        ]
-        selected_area = st.selectbox(
+        area_id = st.selectbox(
             "Select Area*",
-            options=area_display,
+            options=list(area_labels),
+            format_func=area_labels.get,
             help="Select the priority area",
         )
 
         # Priority selection
-        priority_options = all_priorities.select(
-            ["priority_id", "simplified_biodiversity_priority", "theme"]
-        )
-        priority_display = [
-            (
-                f"{row['priority_id']} - [{row['theme']}] "
-                f"{row['simplified_biodiversity_priority']}"
-            )
-            for row in priority_options.iter_rows(named=True)
-        ]
-        selected_priority = st.selectbox(
+        priority_id = st.selectbox(
             "Select Priority*",
-            options=priority_display,
+            options=list(priority_labels),
+            format_func=priority_labels.get,
             help="Select the biodiversity priority",
         )
 
@@ -793,11 +1079,6 @@ def show_create_species_form():
             st.rerun()
 
         if submitted:
-            # Parse IDs
-            species_id = int(selected_species.split(" - ")[0])
-            area_id = int(selected_area.split(" - ")[0])
-            priority_id = int(selected_priority.split(" - ")[0])
-
             # Create link
             try:
                 relationship_model.create_species_area_priority_link(
@@ -808,6 +1089,7 @@ def show_create_species_form():
                     f"Area {area_id} - Priority {priority_id}"
                 )
                 st.session_state.show_create_species_form = False
+                invalidate_link_caches()
                 st.rerun()
             except ValueError as e:
                 st.error(f"❌ {str(e)}")
@@ -820,32 +1102,70 @@ def show_create_species_form():
 # ==============================================================================
 
 
-def show_habitat_creation_interface():
-    """Display interface for managing habitat creation in areas."""
-    st.header("Habitat Creation")
-    st.info(
-        "Links habitats to areas for creation - showing which habitats should be "
-        "created in which areas."
-    )
+# The creation and management tabs differ only in their bridge table, so both
+# are rendered by the same functions from this per-kind configuration
+HABITAT_LINK_KINDS: dict[str, dict[str, Any]] = {
+    "creation": {
+        "title": "Habitat Creation",
+        "description": (
+            "Links habitats to areas for creation - showing which habitats should "
+            "be created in which areas."
+        ),
+        "load_links": load_habitat_creation_links,
+        "create_link": relationship_model.create_habitat_creation_link,
+        "form_flag": "show_create_habitat_creation_form",
+        "key_prefix": "hc",
+        # Quick Link from an area page opens the creation form
+        "quick_link": True,
+    },
+    "management": {
+        "title": "Habitat Management",
+        "description": (
+            "Links habitats to areas for management - showing which existing "
+            "habitats require management in which areas."
+        ),
+        "load_links": load_habitat_management_links,
+        "create_link": relationship_model.create_habitat_management_link,
+        "form_flag": "show_create_habitat_management_form",
+        "key_prefix": "hm",
+        "quick_link": False,
+    },
+}
+
+
+@st.fragment
+def show_habitat_link_interface(kind: Literal["creation", "management"]):
+    """Display interface for managing habitat creation or management in areas.
+
+    Args:
+        kind: Which habitat-area bridge table to manage
+    """
+    config = HABITAT_LINK_KINDS[kind]
+    key_prefix = config["key_prefix"]
+
+    st.header(config["title"])
+    st.info(config["description"])
 
     # Create button
-    if st.button("➕ Create New Link", type="primary", key="create_hc_btn"):
-        st.session_state.show_create_habitat_creation_form = True
+    if st.button("➕ Create New Link", type="primary", key=f"create_{key_prefix}_btn"):
+        st.session_state[config["form_flag"]] = True
 
     # Show create form if requested
-    if st.session_state.show_create_habitat_creation_form:
-        show_create_habitat_creation_form()
+    if st.session_state[config["form_flag"]]:
+        show_create_habitat_link_form(kind)
         st.markdown("---")
 
     # Get all links
-    habitat_links = relationship_model.get_all_habitat_creation_areas()
+    habitat_links = config["load_links"](get_data_version())
 
     st.metric("Total Links", f"{len(habitat_links):,}")
 
-    # Display links
+    # Display links, one page at a time
     if len(habitat_links) > 0:
+        page_param = f"{key_prefix}_page"
+        page = get_page(page_param, len(habitat_links), LINK_PAGE_SIZE)
         st.dataframe(
-            habitat_links.to_pandas(),
+            habitat_links.slice(page * LINK_PAGE_SIZE, LINK_PAGE_SIZE),
             width="stretch",
             hide_index=True,
             column_config={
@@ -857,16 +1177,28 @@ def show_habitat_creation_interface():
                 "area_name": st.column_config.TextColumn("Area", width="medium"),
             },
         )
+        show_pagination_controls(
+            page_param, page, len(habitat_links), LINK_PAGE_SIZE
+        )
     else:
-        st.info("No habitat creation links found.")
+        st.info(f"No {config['title'].lower()} links found.")
 
 
-def show_create_habitat_creation_form():
-    """Display form to create a new habitat-creation-area link."""
-    st.subheader("➕ Create New Habitat Creation Link")
+def show_create_habitat_link_form(kind: Literal["creation", "management"]):
+    """Display form to create a new habitat-creation or habitat-management link.
+
+    Args:
+        kind: Which habitat-area bridge table to add the link to
+    """
+    config = HABITAT_LINK_KINDS[kind]
+    st.subheader(f"➕ Create New {config['title']} Link")
 
     # Show context if coming from Quick Link
-    if "quick_link_area_id" in st.session_state and st.session_state.quick_link_area_id:
+    if (
+        config["quick_link"]
+        and "quick_link_area_id" in st.session_state
+        and st.session_state.quick_link_area_id
+    ):
         area_id = st.session_state.quick_link_area_id
         area_data = area_model.get_by_id(area_id)
         if area_data:
@@ -875,136 +1207,23 @@ def show_create_habitat_creation_form():
             )
         st.session_state.quick_link_area_id = None
 
-    all_habitats = habitat_model.get_all()
-    all_areas = area_model.get_all()
-
-    with st.form("create_habitat_creation_form", clear_on_submit=True):
-        # Habitat selection
-        habitat_options = all_habitats.select(["habitat_id", "habitat"])
-        habitat_display = [
-            f"{row['habitat_id']} - {row['habitat']}"
-            for row in habitat_options.iter_rows(named=True)
-        ]
-        selected_habitat = st.selectbox(
-            "Select Habitat Type*",
-            options=habitat_display,
-            help="Select the habitat type",
-        )
-
-        # Area selection
-        area_options = all_areas.select(["area_id", "area_name"])
-        area_display = [
-            f"{row['area_id']} - {row['area_name']}"
-            for row in area_options.iter_rows(named=True)
-        ]
-        selected_area = st.selectbox(
-            "Select Area*",
-            options=area_display,
-            help="Select the priority area",
-        )
-
-        col1, col2 = st.columns(2)
-        with col1:
-            submitted = st.form_submit_button(
-                "Create Link", type="primary", width="stretch"
-            )
-        with col2:
-            cancelled = st.form_submit_button("Cancel", width="stretch")
-
-        if cancelled:
-            st.session_state.show_create_habitat_creation_form = False
-            st.rerun()
-
-        if submitted:
-            # Parse IDs
-            habitat_id = int(selected_habitat.split(" - ")[0])
-            area_id = int(selected_area.split(" - ")[0])
-
-            # Create link
-            try:
-                relationship_model.create_habitat_creation_link(habitat_id, area_id)
-                st.success(
-                    f"✅ Successfully created habitat creation link: "
-                    f"Habitat {habitat_id} - Area {area_id}"
-                )
-                st.session_state.show_create_habitat_creation_form = False
-                st.rerun()
-            except ValueError as e:
-                st.error(f"❌ {str(e)}")
-            except Exception as e:
-                st.error(f"❌ Error creating link: {str(e)}")
-
-
-def show_habitat_management_interface():
-    """Display interface for managing habitat management in areas."""
-    st.header("Habitat Management")
-    st.info(
-        "Links habitats to areas for management - showing which existing habitats "
-        "require management in which areas."
-    )
-
-    # Create button
-    if st.button("➕ Create New Link", type="primary", key="create_hm_btn"):
-        st.session_state.show_create_habitat_management_form = True
-
-    # Show create form if requested
-    if st.session_state.show_create_habitat_management_form:
-        show_create_habitat_management_form()
-        st.markdown("---")
-
-    # Get all links
-    habitat_links = relationship_model.get_all_habitat_management_areas()
-
-    st.metric("Total Links", f"{len(habitat_links):,}")
+    habitat_labels = load_reference_labels("habitats", get_data_version())
+    area_labels = load_reference_labels("areas", get_data_version())
 
-    # Display links
-    if len(habitat_links) > 0:
-        st.dataframe(
-            habitat_links.to_pandas(),
-            width="stretch",
-            hide_index=True,
-            column_config={
-                "habitat_id": st.column_config.NumberColumn(
-                    "Habitat ID", width="small"
-                ),
-                "habitat": st.column_config.TextColumn("Habitat Type", width="large"),
-                "area_id": st.column_config.NumberColumn("Area ID", width="small"),
-                "area_name": st.column_config.TextColumn("Area", width="medium"),
-            },
-        )
-    else:
-        st.info("No habitat management links found.")
-
-
-def show_create_habitat_management_form():
-    """Display form to create a new habitat-management-area link."""
-    st.subheader("➕ Create New Habitat Management Link")
-
-    all_habitats = habitat_model.get_all()
-    all_areas = area_model.get_all()
-
-    with st.form("create_habitat_management_form", clear_on_submit=True):
+    with st.form(f"create_habitat_{kind}_form", clear_on_submit=True):
         # Habitat selection
-        habitat_options = all_habitats.select(["habitat_id", "habitat"])
-        habitat_display = [
-            f"{row['habitat_id']} - {row['habitat']}"
-            for row in habitat_options.iter_rows(named=True)
-        ]
-        selected_habitat = st.selectbox(
+        habitat_id = st.selectbox(
             "Select Habitat Type*",
-            options=habitat_display,
+            options=list(habitat_labels),
+            format_func=habitat_labels.get,
             help="Select the habitat type",
         )
 
         # Area selection
-        area_options = all_areas.select(["area_id", "area_name"])
-        area_display = [
-            f"{row['area_id']} - {row['area_name']}"
-            for row in area_options.iter_rows(named=True)
-        ]
-        selected_area = st.selectbox(
+        area_id = st.selectbox(
             "Select Area*",
-            options=area_display,
+            options=list(area_labels),
+            format_func=area_labels.get,
             help="Select the priority area",
         )
 
@@ -1017,22 +1236,19 @@ def show_create_habitat_management_form():
             cancelled = st.form_submit_button("Cancel", width="stretch")
 
         if cancelled:
-            st.session_state.show_create_habitat_management_form = False
+            st.session_state[config["form_flag"]] = False
             st.rerun()
 
         if submitted:
-            # Parse IDs
-            habitat_id = int(selected_habitat.split(" - ")[0])
-            area_id = int(selected_area.split(" - ")[0])
-
             # Create link
             try:
-                relationship_model.create_habitat_management_link(habitat_id, area_id)
+                config["create_link"](habitat_id, area_id)
                 st.success(
-                    f"✅ Successfully created habitat management link: "
+                    f"✅ Successfully created {config['title'].lower()} link: "
                     f"Habitat {habitat_id} - Area {area_id}"
                 )
-                st.session_state.show_create_habitat_management_form = False
+                st.session_state[config["form_flag"]] = False
+                invalidate_link_caches()
                 st.rerun()
             except ValueError as e:
                 st.error(f"❌ {str(e)}")
@@ -1050,7 +1266,9 @@ st.markdown(
     "link measures, areas, priorities, species, habitats, and grants."
 )
 
-# Create tabs for different relationship types
+# Create tabs for different relationship types. Each tab interface is an
+# st.fragment, so interacting with one tab reruns only that tab (successful
+# creates and deletes still rerun the whole page to refresh every listing).
 tab1, tab2, tab3, tab4, tab5 = st.tabs(
     [
         "Measure-Area-Priority",
@@ -1071,7 +1289,7 @@ with tab3:
     show_species_area_priority_interface()
 
 with tab4:
-    show_habitat_creation_interface()
+    show_habitat_link_interface("creation")
 
 with tab5:
-    show_habitat_management_interface()
+    show_habitat_link_interface("management")
@@ -75,14 +75,22 @@ with col2:
         "🔗 Open Full Page",
         FULL_PAGE_URL,
         help="Open diagram in a new tab for full-screen viewing",
-        use_container_width=True,
+        width="stretch",
     )
 
 # Main diagram section
 st.subheader("📊 Database Structure")
 
-# Embed the React ERD
-components.iframe(src=EMBED_URL, height=IFRAME_HEIGHT, scrolling=True)
+# Embed the React ERD only on request - the hosted artifact is a large
+# third-party download, so it is not fetched on every page load
+if st.toggle("Load diagram", value=False, help="Load the interactive diagram"):
+    components.html(
+        f'<iframe src="{EMBED_URL}" loading="lazy" height="{IFRAME_HEIGHT}" '
+        'width="100%" style="border:1px solid #e0e0e0;border-radius:8px">'
+        "</iframe>",
+        height=IFRAME_HEIGHT + 20,
+        scrolling=True,
+    )
 
 # Usage tips
 st.info(
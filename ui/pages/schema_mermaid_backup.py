@@ -10,15 +10,19 @@ import streamlit as st
 import streamlit.components.v1 as components
 
 # Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-from utils.schema_diagram import (
+from utils.schema_diagram_mermaid_backup import (
     SchemaParser,
     generate_mermaid_html,
     get_schema_path,
 )
 
+# Height (px) of the diagram area in the generated HTML
+DIAGRAM_HEIGHT = 1000
+
 # Custom CSS to maximize vertical space
 st.markdown(
     """
@@ -58,11 +62,14 @@ st.markdown(
 )
 
 
-@st.cache_data(show_spinner="Loading schema...")
 def get_schema_parser():
-    """Get cached schema parser instance."""
-    schema_path = get_schema_path()
-    return SchemaParser(schema_path)
+    """Get the shared schema parser instance.
+
+    SchemaParser.get keeps one parser per schema file version, so every
+    session reuses it without copying. Only the generated diagram strings
+    use cache_data.
+    """
+    return SchemaParser.get(get_schema_path())
 
 
 @st.cache_data(show_spinner="Generating diagram...")
@@ -96,6 +103,22 @@ def generate_diagram(diagram_type: str, include_all_columns: bool) -> str:
         return parser.generate_full_diagram(include_all_columns)
 
 
+@st.cache_data(show_spinner=False)
+def generate_diagram_html(mermaid_code: str) -> str:
+    """Generate the interactive HTML page for a Mermaid diagram.
+
+    The same HTML is used in-page and for every download, so it is built
+    once per diagram.
+
+    Args:
+        mermaid_code: Mermaid diagram code
+
+    Returns:
+        Standalone HTML document
+    """
+    return generate_mermaid_html(mermaid_code, height=DIAGRAM_HEIGHT)
+
+
 # Page header
 st.title("🗂️ Database Schema")
 
@@ -168,9 +191,11 @@ with col3:
 # Generate and display diagram
 st.subheader(f"📊 {diagram_type}")
 
+mermaid_code = None
 try:
-    # Generate Mermaid code
+    # Generate Mermaid code and its HTML once; the export section reuses both
     mermaid_code = generate_diagram(diagram_type, include_all_columns)
+    diagram_html = generate_diagram_html(mermaid_code)
 
     # Prominent full-screen option
     st.info(
@@ -183,8 +208,7 @@ try:
     with tab1:
         # Display diagram with interactive controls
         # Use very tall iframe to give plenty of vertical space
-        html_code = generate_mermaid_html(mermaid_code, height=1000)
-        components.html(html_code, height=2000, scrolling=True)
+        components.html(diagram_html, height=2000, scrolling=True)
 
         st.info(
             "💡 **Controls:** Use the zoom buttons (top-right), mouse wheel to zoom, "
@@ -204,18 +228,15 @@ try:
             """
         )
 
-        # Generate HTML for download
-        download_html = generate_mermaid_html(mermaid_code, height=1000)
-
         col1, col2 = st.columns([1, 3])
         with col1:
             st.download_button(
                 label="📥 Download Full-Screen HTML",
-                data=download_html,
+                data=diagram_html,
                 file_name=f"lnrs_schema_{diagram_type.lower().replace(' ', '_')}.html",
                 mime="text/html",
                 help="Download standalone HTML file for full-screen viewing",
-                use_container_width=True,
+                width="stretch",
             )
         with col2:
             st.markdown(
@@ -239,32 +260,31 @@ except Exception as e:
     st.error(f"Error generating diagram: {e}")
     st.exception(e)
 
-# Download options
-st.subheader("💾 Export")
+# Download options (only when the diagram was generated)
+if mermaid_code is not None:
+    st.subheader("💾 Export")
 
-col1, col2 = st.columns(2)
+    col1, col2 = st.columns(2)
 
-with col1:
-    # Download Mermaid code
-    mermaid_code_download = generate_diagram(diagram_type, include_all_columns)
-    st.download_button(
-        label="Download Mermaid Code",
-        data=mermaid_code_download,
-        file_name=f"lnrs_schema_{diagram_type.lower().replace(' ', '_')}.mmd",
-        mime="text/plain",
-        help="Download the Mermaid diagram code",
-    )
+    with col1:
+        # Download Mermaid code
+        st.download_button(
+            label="Download Mermaid Code",
+            data=mermaid_code,
+            file_name=f"lnrs_schema_{diagram_type.lower().replace(' ', '_')}.mmd",
+            mime="text/plain",
+            help="Download the Mermaid diagram code",
+        )
 
-with col2:
-    # Download as HTML
-    html_download = generate_mermaid_html(mermaid_code_download, height=800)
-    st.download_button(
-        label="Download as HTML",
-        data=html_download,
-        file_name=f"lnrs_schema_{diagram_type.lower().replace(' ', '_')}.html",
-        mime="text/html",
-        help="Download a standalone HTML file with the diagram",
-    )
+    with col2:
+        # Download as HTML
+        st.download_button(
+            label="Download as HTML",
+            data=diagram_html,
+            file_name=f"lnrs_schema_{diagram_type.lower().replace(' ', '_')}.html",
+            mime="text/html",
+            help="Download a standalone HTML file with the diagram",
+        )
 
 # Footer
 st.divider()
@@ -2,33 +2,254 @@
 
 import sys
 from pathlib import Path
+from typing import Any
 
 import polars as pl
 import streamlit as st
 
 # Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from models.species import SPECIES_SEARCH_COLUMNS, SpeciesModel
+from ui.components.data_version import bump_data_version, get_data_version
+from ui.components.tables import (
+    display_data_table,
+    get_page,
+    show_pagination_controls,
+)
+
+
+@st.cache_resource
+def get_species_model() -> SpeciesModel:
+    """Get the shared species model instance.
+
+    Cached as a resource so a single model (and its database connection)
+    is reused across reruns and sessions.
+
+    Returns:
+        SpeciesModel: Shared species model
+    """
+    return SpeciesModel()
 
-from models.species import SpeciesModel
-from ui.components.tables import display_data_table
 
 # Initialize model
-species_model = SpeciesModel()
+species_model = get_species_model()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_species_count() -> int:
+    """Get the total number of species (cached for 1 minute).
+
+    Returns:
+        int: Number of species
+    """
+    return species_model.count()
+
+
+# Assemblage and taxa choices for the create/edit forms, with index lookups
+# used to preselect the current value when editing
+ASSEMBLAGES = (
+    "Birds",
+    "Butterflies",
+    "Fish",
+    "Mammals",
+    "Moths",
+    "Plants",
+    "Reptiles and amphibians",
+)
+ASSEMBLAGE_INDEX = {assemblage: i for i, assemblage in enumerate(ASSEMBLAGES)}
+TAXA = ("Bird", "Butterfly", "Fish", "Mammal", "Moth", "Plant", "Reptile/Amphibian")
+TAXA_INDEX = {taxon: i for i, taxon in enumerate(TAXA)}
+
+# Optional taxonomy fields on the create/edit forms: column -> (label, help)
+TAXONOMY_FIELDS = {
+    "kingdom": ("Kingdom", "e.g., Animalia, Plantae"),
+    "phylum": ("Phylum", "e.g., Chordata"),
+    "class": ("Class", "e.g., Aves, Mammalia"),
+    "order": ("Order", "e.g., Passeriformes"),
+    "family": ("Family", "e.g., Turdidae"),
+    "genus": ("Genus", "e.g., Turdus"),
+}
+
+# Rows per page of the species list (page number kept in the URL)
+SPECIES_PAGE_SIZE = 50
+
+# Columns shown in the species list; only these are fetched from the database
+SPECIES_LIST_COLUMN_CONFIG = {
+    "species_id": st.column_config.NumberColumn("ID", width="small"),
+    "common_name": st.column_config.TextColumn("Common Name", width="medium"),
+    "linnaean_name": st.column_config.TextColumn("Linnaean Name", width="medium"),
+    "scientific_name": st.column_config.TextColumn("Scientific Name", width="medium"),
+    "assemblage": st.column_config.TextColumn("Assemblage", width="medium"),
+    "taxa": st.column_config.TextColumn("Taxa", width="small"),
+    "kingdom": st.column_config.TextColumn("Kingdom", width="small"),
+    "phylum": st.column_config.TextColumn("Phylum", width="small"),
+    "class": st.column_config.TextColumn("Class", width="small"),
+    "order": st.column_config.TextColumn("Order", width="small"),
+    "family": st.column_config.TextColumn("Family", width="small"),
+    "genus": st.column_config.TextColumn("Genus", width="small"),
+    "species_link": st.column_config.LinkColumn("Info Link", width="small"),
+    "gbif_species_url": st.column_config.LinkColumn("GBIF", width="small"),
+}
+
+# Column configuration for each related-data table on the detail view
+RELATED_COLUMN_CONFIGS = {
+    "Measures": {
+        "measure_id": st.column_config.NumberColumn("ID", width="small"),
+        "measure": st.column_config.TextColumn("Measure", width="large"),
+        "concise_measure": st.column_config.TextColumn("Concise", width="medium"),
+        "core_supplementary": st.column_config.TextColumn("Type", width="small"),
+    },
+    "Areas": {
+        "area_id": st.column_config.NumberColumn("ID", width="small"),
+        "area_name": st.column_config.TextColumn("Area Name", width="medium"),
+        "area_description": st.column_config.TextColumn("Description", width="large"),
+    },
+    "Priorities": {
+        "priority_id": st.column_config.NumberColumn("ID", width="small"),
+        "biodiversity_priority": st.column_config.TextColumn(
+            "Biodiversity Priority", width="large"
+        ),
+        "simplified_biodiversity_priority": st.column_config.TextColumn(
+            "Simplified", width="medium"
+        ),
+        "theme": st.column_config.TextColumn("Theme", width="medium"),
+    },
+}
+
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner="Loading species...")
+def load_species_page(page: int) -> pl.DataFrame:
+    """Get one page of the species list (cached per page for 5 minutes).
+
+    Only the displayed columns of the requested page are fetched.
+
+    Args:
+        page: Zero-based page number
+
+    Returns:
+        pl.DataFrame: Up to SPECIES_PAGE_SIZE species ordered by common name
+    """
+    # species_id breaks ties so pages never overlap
+    return species_model.get_all(
+        limit=SPECIES_PAGE_SIZE,
+        offset=page * SPECIES_PAGE_SIZE,
+        order_by="common_name, species_id",
+        columns=list(SPECIES_LIST_COLUMN_CONFIG),
+    )
+
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def search_species(term: str) -> pl.DataFrame:
+    """Search the species list in the database (cached per term for 5 minutes).
+
+    Args:
+        term: Search text
+
+    Returns:
+        pl.DataFrame: Matching species, with the list view's columns
+    """
+    return species_model.search(term, columns=list(SPECIES_LIST_COLUMN_CONFIG))
+
+
+@st.cache_data(ttl=300, max_entries=128, show_spinner=False)
+def load_species_detail(species_id: int, data_version: str) -> dict | None:
+    """Get a species with its related entities (cached per species for 5 minutes).
+
+    Args:
+        species_id: ID of the species
+        data_version: get_data_version() stamp, so link changes and deletes
+            made on any page reload the bundle
+
+    Returns:
+        dict: Detail bundle from SpeciesModel.get_detail_bundle, or None
+    """
+    return species_model.get_detail_bundle(species_id)
+
+
+def invalidate_species_caches() -> None:
+    """Drop cached species data after a create, update or delete."""
+    load_species_count.clear()
+    load_species_detail.clear()
+    load_species_page.clear()
+    search_species.clear()
+    bump_data_version()
+
+
+def clean_optional_text(value: str | None) -> str | None:
+    """Strip an optional text input, treating blank values as missing.
+
+    Args:
+        value: Raw text input value
+
+    Returns:
+        str | None: Stripped value, or None if empty
+    """
+    value = (value or "").strip()
+    return value or None
+
+
+def taxonomy_inputs(species_data: dict[str, Any] | None = None) -> dict[str, str]:
+    """Render a text input for each optional taxonomy field.
+
+    Args:
+        species_data: Existing species record to prefill from (None = blank)
+
+    Returns:
+        dict: Column name -> raw input value
+    """
+    species_data = species_data or {}
+    return {
+        field: st.text_input(
+            label, value=species_data.get(field) or "", help=help_text
+        )
+        for field, (label, help_text) in TAXONOMY_FIELDS.items()
+    }
+
+
+def build_species_payload(
+    common_name: str,
+    scientific_name: str,
+    assemblage: str,
+    taxa: str,
+    taxonomy: dict[str, str],
+) -> dict[str, Any]:
+    """Build the species insert/update payload from validated form values.
+
+    Args:
+        common_name: Common name (required, non-blank)
+        scientific_name: Scientific name (required, non-blank)
+        assemblage: Selected assemblage
+        taxa: Selected taxa
+        taxonomy: Optional taxonomy inputs from taxonomy_inputs()
+
+    Returns:
+        dict: Column name -> value, with blank optional fields set to None
+    """
+    scientific_name = scientific_name.strip()
+    return {
+        "common_name": common_name.strip(),
+        "scientific_name": scientific_name,
+        "linnaean_name": scientific_name,  # Use same as scientific_name
+        "assemblage": assemblage,
+        "taxa": taxa,
+        **{field: clean_optional_text(value) for field, value in taxonomy.items()},
+    }
+
 
 # Initialize session state
-if "species_view" not in st.session_state:
-    st.session_state.species_view = "list"
-if "selected_species_id" not in st.session_state:
-    st.session_state.selected_species_id = None
-if "show_create_form" not in st.session_state:
-    st.session_state.show_create_form = False
-if "show_edit_form" not in st.session_state:
-    st.session_state.show_edit_form = False
-if "show_delete_confirm" not in st.session_state:
-    st.session_state.show_delete_confirm = False
-if "delete_success_message" not in st.session_state:
-    st.session_state.delete_success_message = None
+SESSION_DEFAULTS = {
+    "species_view": "list",
+    "selected_species_id": None,
+    "show_create_form": False,
+    "show_edit_form": False,
+    "show_delete_confirm": False,
+    "delete_success_message": None,
+}
+for key, default in SESSION_DEFAULTS.items():
+    st.session_state.setdefault(key, default)
 
 
 def show_create_form():
@@ -51,32 +272,19 @@ def show_create_form():
 
             assemblage = st.selectbox(
                 "Assemblage*",
-                options=[
-                    "Birds",
-                    "Butterflies",
-                    "Fish",
-                    "Mammals",
-                    "Moths",
-                    "Plants",
-                    "Reptiles and amphibians",
-                ],
+                options=ASSEMBLAGES,
                 help="Assemblage group (required)"
             )
 
             taxa = st.selectbox(
                 "Taxa*",
-                options=["Bird", "Butterfly", "Fish", "Mammal", "Moth", "Plant", "Reptile/Amphibian"],
+                options=TAXA,
                 help="Taxa classification (required)"
             )
 
         with col2:
             st.markdown("**Taxonomy (Optional)**")
-            kingdom = st.text_input("Kingdom", help="e.g., Animalia, Plantae")
-            phylum = st.text_input("Phylum", help="e.g., Chordata")
-            class_name = st.text_input("Class", help="e.g., Aves, Mammalia")
-            order = st.text_input("Order", help="e.g., Passeriformes")
-            family = st.text_input("Family", help="e.g., Turdidae")
-            genus = st.text_input("Genus", help="e.g., Turdus")
+            taxonomy = taxonomy_inputs()
 
         col1, col2 = st.columns(2)
         with col1:
@@ -98,41 +306,28 @@ def show_create_form():
                 st.error("❌ Scientific Name is required")
                 return
 
-            # Get next species_id
-            max_id = species_model.execute_raw_query("SELECT MAX(species_id) FROM species").fetchone()[0]
-            next_id = (max_id or 0) + 1
-
-            # Create species
+            # Create species (the next species_id is allocated by the insert)
             try:
-                species_model.create({
-                    "species_id": next_id,
-                    "common_name": common_name.strip(),
-                    "scientific_name": scientific_name.strip(),
-                    "linnaean_name": scientific_name.strip(),  # Use same as scientific_name
-                    "assemblage": assemblage,
-                    "taxa": taxa,
-                    "kingdom": kingdom.strip() if kingdom and kingdom.strip() else None,
-                    "phylum": phylum.strip() if phylum and phylum.strip() else None,
-                    "class": class_name.strip() if class_name and class_name.strip() else None,
-                    "order": order.strip() if order and order.strip() else None,
-                    "family": family.strip() if family and family.strip() else None,
-                    "genus": genus.strip() if genus and genus.strip() else None,
-                })
+                next_id = species_model.create_with_next_id(
+                    build_species_payload(
+                        common_name, scientific_name, assemblage, taxa, taxonomy
+                    )
+                )
                 st.success(f"✅ Successfully created species ID {next_id}!")
                 st.session_state.show_create_form = False
+                invalidate_species_caches()
                 st.rerun()
             except Exception as e:
                 st.error(f"❌ Error creating species: {str(e)}")
 
 
-def show_edit_form(species_id: int):
-    """Display form to edit an existing species."""
-    species_data = species_model.get_by_id(species_id)
-
-    if not species_data:
-        st.error("Species not found")
-        return
+def show_edit_form(species_id: int, species_data: dict[str, Any]):
+    """Display form to edit an existing species.
 
+    Args:
+        species_id: ID of the species to edit
+        species_data: Species record already loaded by the detail view
+    """
     st.subheader(f"✏️ Edit Species {species_id}")
 
     with st.form("edit_species_form"):
@@ -149,36 +344,21 @@ def show_edit_form(species_id: int):
                 value=species_data['scientific_name']
             )
 
-            assemblage_options = [
-                "Birds",
-                "Butterflies",
-                "Fish",
-                "Mammals",
-                "Moths",
-                "Plants",
-                "Reptiles and amphibians",
-            ]
             assemblage = st.selectbox(
                 "Assemblage*",
-                options=assemblage_options,
-                index=assemblage_options.index(species_data['assemblage']) if species_data['assemblage'] in assemblage_options else 0
+                options=ASSEMBLAGES,
+                index=ASSEMBLAGE_INDEX.get(species_data['assemblage'], 0)
             )
 
-            taxa_options = ["Bird", "Butterfly", "Fish", "Mammal", "Moth", "Plant", "Reptile/Amphibian"]
             taxa = st.selectbox(
                 "Taxa*",
-                options=taxa_options,
-                index=taxa_options.index(species_data['taxa']) if species_data['taxa'] in taxa_options else 0
+                options=TAXA,
+                index=TAXA_INDEX.get(species_data['taxa'], 0)
             )
 
         with col2:
             st.markdown("**Taxonomy (Optional)**")
-            kingdom = st.text_input("Kingdom", value=species_data.get('kingdom', '') or '')
-            phylum = st.text_input("Phylum", value=species_data.get('phylum', '') or '')
-            class_name = st.text_input("Class", value=species_data.get('class', '') or '')
-            order = st.text_input("Order", value=species_data.get('order', '') or '')
-            family = st.text_input("Family", value=species_data.get('family', '') or '')
-            genus = st.text_input("Genus", value=species_data.get('genus', '') or '')
+            taxonomy = taxonomy_inputs(species_data)
 
         col1, col2 = st.columns(2)
         with col1:
@@ -202,30 +382,30 @@ def show_edit_form(species_id: int):
 
             # Update species
             try:
-                species_model.update(species_id, {
-                    "common_name": common_name.strip(),
-                    "scientific_name": scientific_name.strip(),
-                    "linnaean_name": scientific_name.strip(),
-                    "assemblage": assemblage,
-                    "taxa": taxa,
-                    "kingdom": kingdom.strip() if kingdom and kingdom.strip() else None,
-                    "phylum": phylum.strip() if phylum and phylum.strip() else None,
-                    "class": class_name.strip() if class_name and class_name.strip() else None,
-                    "order": order.strip() if order and order.strip() else None,
-                    "family": family.strip() if family and family.strip() else None,
-                    "genus": genus.strip() if genus and genus.strip() else None,
-                })
+                species_model.update(
+                    species_id,
+                    build_species_payload(
+                        common_name, scientific_name, assemblage, taxa, taxonomy
+                    ),
+                )
                 st.success(f"✅ Successfully updated species ID {species_id}!")
                 st.session_state.show_edit_form = False
+                invalidate_species_caches()
                 st.rerun()
             except Exception as e:
                 st.error(f"❌ Error updating species: {str(e)}")
 
 
-def show_delete_confirmation(species_id: int):
-    """Show confirmation dialog before deleting."""
-    species_data = species_model.get_by_id(species_id)
-    counts = species_model.get_relationship_counts(species_id)
+def show_delete_confirmation(
+    species_id: int, species_data: dict[str, Any], counts: dict[str, int]
+):
+    """Show confirmation dialog before deleting.
+
+    Args:
+        species_id: ID of the species to delete
+        species_data: Species record already loaded by the detail view
+        counts: Relationship counts already loaded by the detail view
+    """
 
     st.warning(f"⚠️ Are you sure you want to delete this species?")
 
@@ -259,6 +439,7 @@ def show_delete_confirmation(species_id: int):
                 st.session_state.show_delete_confirm = False
                 st.session_state.species_view = "list"
                 st.session_state.selected_species_id = None
+                invalidate_species_caches()
                 st.rerun()
             except Exception as e:
                 st.error(f"❌ Error deleting species: {str(e)}")
@@ -284,82 +465,95 @@ def show_list_view():
         show_create_form()
         st.markdown("---")
 
-    total_count = species_model.count()
+    total_count = load_species_count()
     st.info(f"**{total_count}** species with GBIF taxonomy data")
 
-    # Get all species
-    all_species = species_model.get_all(order_by="common_name")
+    # Only the current page is read from the database
+    page = get_page("species_page", total_count, SPECIES_PAGE_SIZE)
+    species_page = load_species_page(page)
 
     def on_view_details(species_id):
         st.session_state.selected_species_id = species_id
         st.session_state.species_view = "detail"
 
     display_data_table(
-        data=all_species,
+        data=species_page,
         title="All Species",
         entity_name="species",
         id_column="species_id",
-        searchable_columns=["common_name", "scientific_name", "assemblage", "taxa"],
-        column_config={
-            "species_id": st.column_config.NumberColumn("ID", width="small"),
-            "common_name": st.column_config.TextColumn("Common Name", width="medium"),
-            "linnaean_name": st.column_config.TextColumn("Linnaean Name", width="medium"),
-            "scientific_name": st.column_config.TextColumn("Scientific Name", width="medium"),
-            "assemblage": st.column_config.TextColumn("Assemblage", width="medium"),
-            "taxa": st.column_config.TextColumn("Taxa", width="small"),
-            "kingdom": st.column_config.TextColumn("Kingdom", width="small"),
-            "phylum": st.column_config.TextColumn("Phylum", width="small"),
-            "class": st.column_config.TextColumn("Class", width="small"),
-            "order": st.column_config.TextColumn("Order", width="small"),
-            "family": st.column_config.TextColumn("Family", width="small"),
-            "genus": st.column_config.TextColumn("Genus", width="small"),
-            "species_link": st.column_config.LinkColumn("Info Link", width="small"),
-            "gbif_species_url": st.column_config.LinkColumn("GBIF", width="small"),
-        },
+        searchable_columns=list(SPECIES_SEARCH_COLUMNS),
+        column_config=SPECIES_LIST_COLUMN_CONFIG,
         show_actions=True,
         on_view_details=on_view_details,
+        search_fn=search_species,
+        total_count=total_count,
     )
 
-
-def show_detail_view():
-    """Display details of a single species."""
-    species_id = st.session_state.selected_species_id
-
-    if species_id is None:
-        st.error("No species selected")
-        if st.button("← Back to List"):
-            st.session_state.species_view = "list"
-            st.rerun()
+    # Search results are not paginated
+    if not st.session_state.get("species_search"):
+        show_pagination_controls(
+            "species_page", page, total_count, SPECIES_PAGE_SIZE
+        )
+
+
+@st.fragment
+def render_related_data(related: dict[str, pl.DataFrame]) -> None:
+    """Render one related-data table, chosen with a segmented control.
+
+    Unlike st.tabs, which sends every tab's table to the browser, only the
+    selected table is rendered. Runs as a fragment so switching tables
+    doesn't rerun the rest of the detail page.
+
+    Args:
+        related: Relation name (as in RELATED_COLUMN_CONFIGS) -> DataFrame
+    """
+    selected = st.segmented_control(
+        "Related data",
+        options=list(related),
+        format_func=lambda name: f"{name} ({related[name].height:,})",
+        default="Measures",
+        key="species_related_view",
+        label_visibility="collapsed",
+    )
+    if selected is None:
         return
 
-    # Get species data
-    species_data = species_model.get_by_id(species_id)
+    frame = related[selected]
+    if frame.height:
+        st.dataframe(
+            frame,
+            width="stretch",
+            hide_index=True,
+            column_config=RELATED_COLUMN_CONFIGS[selected],
+        )
+        st.caption(f"Total: {frame.height:,} {selected.lower()}")
+    else:
+        st.info(f"No {selected.lower()} linked to this species.")
 
-    if not species_data:
-        st.error(f"Species ID {species_id} not found")
-        if st.button("← Back to List"):
-            st.session_state.species_view = "list"
-            st.rerun()
-        return
 
-    # Get related data
-    related_measures = species_model.get_related_measures(species_id)
-    related_areas = species_model.get_related_areas(species_id)
-    related_priorities = species_model.get_related_priorities(species_id)
+def back_to_list():
+    """Return from the detail view to the species list."""
+    st.session_state.species_view = "list"
+    st.session_state.selected_species_id = None
+    st.session_state.show_edit_form = False
+    st.session_state.show_delete_confirm = False
 
-    # Get counts
-    counts = species_model.get_relationship_counts(species_id)
 
-    # Display detail view
-    def back_to_list():
-        st.session_state.species_view = "list"
-        st.session_state.selected_species_id = None
-        st.session_state.show_edit_form = False
-        st.session_state.show_delete_confirm = False
+@st.fragment
+def render_detail_actions(
+    species_id: int, species_data: dict[str, Any], counts: dict[str, int]
+) -> None:
+    """Render the detail view's action buttons and edit/delete panels.
 
-    st.title(f"🦋 Species Details")
+    Runs as a fragment, so opening the edit form or delete confirmation
+    reruns only this section rather than the whole detail page. Actions that
+    change data or leave the page trigger a full rerun.
 
-    # Action buttons
+    Args:
+        species_id: ID of the displayed species
+        species_data: Species record from the detail bundle
+        counts: Relationship counts from the detail bundle
+    """
     col1, col2, col3 = st.columns([2, 1, 1])
     with col1:
         if st.button("← Back to List"):
@@ -377,15 +571,47 @@ def show_detail_view():
     # Show edit form if requested
     if st.session_state.show_edit_form:
         st.markdown("---")
-        show_edit_form(species_id)
+        show_edit_form(species_id, species_data)
         st.markdown("---")
 
     # Show delete confirmation if requested
     if st.session_state.show_delete_confirm:
         st.markdown("---")
-        show_delete_confirmation(species_id)
+        show_delete_confirmation(species_id, species_data, counts)
         st.markdown("---")
 
+
+def show_detail_view():
+    """Display details of a single species."""
+    species_id = st.session_state.selected_species_id
+
+    if species_id is None:
+        st.error("No species selected")
+        if st.button("← Back to List"):
+            st.session_state.species_view = "list"
+            st.rerun()
+        return
+
+    # Get species data and related entities in one query
+    bundle = load_species_detail(species_id, get_data_version())
+
+    if not bundle:
+        st.error(f"Species ID {species_id} not found")
+        if st.button("← Back to List"):
+            st.session_state.species_view = "list"
+            st.rerun()
+        return
+
+    species_data = bundle["data"]
+    related_measures = bundle["measures"]
+    related_areas = bundle["areas"]
+    related_priorities = bundle["priorities"]
+    counts = bundle["counts"]
+
+    st.title(f"🦋 Species Details")
+
+    render_detail_actions(species_id, species_data, counts)
+
     # Display basic information
     st.subheader("Basic Information")
 
@@ -405,10 +631,13 @@ def show_detail_view():
             st.markdown(f"**GBIF:** [{species_data['gbif_species_url']}]({species_data['gbif_species_url']})")
 
     with col2:
-        st.markdown("**Relationship Counts:**")
-        st.metric("Measures", counts['measures'])
-        st.metric("Areas", counts['areas'])
-        st.metric("Priorities", counts['priorities'])
+        # One markdown element instead of a metric widget per count
+        st.markdown(
+            "**Relationship Counts:**\n"
+            f"- Measures: **{counts['measures']}**\n"
+            f"- Areas: **{counts['areas']}**\n"
+            f"- Priorities: **{counts['priorities']}**"
+        )
 
     # Taxonomy section
     st.markdown("---")
@@ -425,69 +654,22 @@ def show_detail_view():
         st.markdown(f"**Family:** {species_data.get('family') or '_Not provided_'}")
         st.markdown(f"**Genus:** {species_data.get('genus') or '_Not provided_'}")
 
-    # Display related data in tabs
+    # Display related data
     st.markdown("---")
     st.subheader("Related Data")
 
-    tab1, tab2, tab3 = st.tabs(["Measures", "Areas", "Priorities"])
-
-    with tab1:
-        if len(related_measures) > 0:
-            st.dataframe(
-                related_measures.to_pandas(),
-                width="stretch",
-                hide_index=True,
-                column_config={
-                    "measure_id": st.column_config.NumberColumn("ID", width="small"),
-                    "measure": st.column_config.TextColumn("Measure", width="large"),
-                    "concise_measure": st.column_config.TextColumn("Concise", width="medium"),
-                    "core_supplementary": st.column_config.TextColumn("Type", width="small"),
-                },
-            )
-            st.caption(f"Total: {len(related_measures):,} measures")
-        else:
-            st.info("No measures linked to this species.")
-
-    with tab2:
-        if len(related_areas) > 0:
-            st.dataframe(
-                related_areas.to_pandas(),
-                width="stretch",
-                hide_index=True,
-                column_config={
-                    "area_id": st.column_config.NumberColumn("ID", width="small"),
-                    "area_name": st.column_config.TextColumn("Area Name", width="medium"),
-                    "area_description": st.column_config.TextColumn("Description", width="large"),
-                },
-            )
-            st.caption(f"Total: {len(related_areas):,} areas")
-        else:
-            st.info("No areas linked to this species.")
-
-    with tab3:
-        if len(related_priorities) > 0:
-            st.dataframe(
-                related_priorities.to_pandas(),
-                width="stretch",
-                hide_index=True,
-                column_config={
-                    "priority_id": st.column_config.NumberColumn("ID", width="small"),
-                    "biodiversity_priority": st.column_config.TextColumn(
-                        "Biodiversity Priority", width="large"
-                    ),
-                    "simplified_biodiversity_priority": st.column_config.TextColumn(
-                        "Simplified", width="medium"
-                    ),
-                    "theme": st.column_config.TextColumn("Theme", width="medium"),
-                },
-            )
-            st.caption(f"Total: {len(related_priorities):,} priorities")
-        else:
-            st.info("No priorities linked to this species.")
+    render_related_data(
+        {
+            "Measures": related_measures,
+            "Areas": related_areas,
+            "Priorities": related_priorities,
+        }
+    )
 
 
-# Main page logic
-if st.session_state.species_view == "list":
-    show_list_view()
-elif st.session_state.species_view == "detail":
-    show_detail_view()
+# Main page logic - view name -> render function
+VIEWS = {
+    "list": show_list_view,
+    "detail": show_detail_view,
+}
+VIEWS.get(st.session_state.species_view, show_list_view)()
@@ -4,181 +4,246 @@ This module provides functions to parse the database schema XML file
 and generate Mermaid ER diagrams for visualization in Streamlit.
 """
 
+import functools
+import io
+import re
+import sys
+import types
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+from utils.schema_xml import get_schema_path  # noqa: F401 - re-exported
+
+# Name fragments that mark a bridge/junction table for many-to-many
+# relationships, compiled into one pattern
+BRIDGE_TABLE_PATTERN = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            [
+                "_has_",
+                "_area_priority",
+                "habitat_creation_area",
+                "habitat_management_area",
+                "species_area_priority",
+                "area_funding_schemes",
+            ],
+        )
+    )
+)
 
 
 class Table:
     """Represents a database table."""
 
+    __slots__ = (
+        "name",
+        "_is_bridge",
+        "columns",
+        "primary_keys",
+        "foreign_keys",
+        "_mermaid",
+    )
+
     def __init__(self, name: str):
         self.name = name
+        # The name never changes, so classify the table once
+        self._is_bridge = BRIDGE_TABLE_PATTERN.search(name) is not None
         self.columns: List[Tuple[str, str, str]] = []  # (name, type, nullable)
         self.primary_keys: Set[str] = set()
         self.foreign_keys: Dict[str, str] = {}  # {column_name: referenced_table}
+        # Mermaid block per include_all_columns value, set by render_mermaid()
+        self._mermaid: Dict[bool, str] = {}
 
     def add_column(self, name: str, col_type: str, nullable: str):
         """Add a column to the table."""
         self.columns.append((name, col_type, nullable))
 
-    def infer_primary_key(self):
-        """Infer primary key from column names."""
+    def infer_keys(self, table_names: FrozenSet[str]):
+        """Infer primary and foreign keys from column names in one pass.
+
+        Args:
+            table_names: Names of every table in the schema
+        """
         # Common PK patterns: <table>_id, id
-        for col_name, _, _ in self.columns:
-            if col_name == f"{self.name}_id" or (
-                col_name == "id" and self.name != "source_table"
-            ):
-                self.primary_keys.add(col_name)
+        own_id = f"{self.name}_id"
+        id_is_pk = self.name != "source_table"
+        primary_keys = self.primary_keys
+        foreign_keys = self.foreign_keys
 
-    def infer_foreign_keys(self, all_tables: Dict[str, "Table"]):
-        """Infer foreign keys from column names."""
         for col_name, _, _ in self.columns:
-            # Skip if it's this table's PK
+            if col_name == own_id or (col_name == "id" and id_is_pk):
+                primary_keys.add(col_name)
+            # Look for _id suffix pattern naming an existing table
+            elif col_name.endswith("_id"):
+                potential_table = col_name[:-3]  # Remove '_id'
+                if potential_table in table_names:
+                    foreign_keys[col_name] = potential_table
+
+    def render_mermaid(self):
+        """Render this table's Mermaid blocks once its keys are inferred.
+
+        Both variants (all columns, and key columns only) are built in one
+        pass and then returned by mermaid() without re-formatting.
+        """
+        header = f"    {self.name.upper()} {{\n"
+        all_lines = []
+        key_lines = []
+
+        for col_name, col_type, _ in self.columns:
+            # Determine key type
+            key_type = ""
             if col_name in self.primary_keys:
-                continue
+                key_type = " PK"
+            elif col_name in self.foreign_keys:
+                key_type = " FK"
 
-            # Look for _id suffix pattern
-            if col_name.endswith("_id"):
-                # Extract potential table name
-                potential_table = col_name[:-3]  # Remove '_id'
+            line = f"        {col_type} {col_name}{key_type}\n"
+            all_lines.append(line)
+            # Key-only diagrams show just PKs and FKs
+            if key_type:
+                key_lines.append(line)
 
-                # Check if this table exists
-                if potential_table in all_tables:
-                    self.foreign_keys[col_name] = potential_table
+        self._mermaid = {
+            True: header + "".join(all_lines) + "    }\n",
+            False: header + "".join(key_lines) + "    }\n",
+        }
+
+    def mermaid(self, include_all_columns: bool = False) -> str:
+        """Get the Mermaid block for this table.
+
+        Args:
+            include_all_columns: Whether to show all columns or just keys
+        """
+        return self._mermaid[include_all_columns]
 
     def is_bridge_table(self) -> bool:
         """Check if this is a bridge/junction table for many-to-many relationships."""
-        bridge_indicators = [
-            "_has_",
-            "_area_priority",
-            "habitat_creation_area",
-            "habitat_management_area",
-            "species_area_priority",
-            "area_funding_schemes",
-        ]
-        return any(indicator in self.name for indicator in bridge_indicators)
+        return self._is_bridge
 
 
 class SchemaParser:
     """Parses XML schema and generates Mermaid diagrams."""
 
+    __slots__ = (
+        "schema_path",
+        "tables",
+        "_diagram_cache",
+        "_edges",
+        "_bridge_tables",
+        "_core_tables",
+        "_core_bridge_tables",
+    )
+
     def __init__(self, schema_path: str | Path):
         self.schema_path = Path(schema_path)
         self.tables: Dict[str, Table] = {}
+        # Generated diagrams, keyed by (tables included, include_all_columns)
+        self._diagram_cache: Dict[Tuple[frozenset, bool], str] = {}
         self._parse_schema()
 
-    def _parse_schema(self):
-        """Parse the XML schema file."""
-        tree = ET.parse(self.schema_path)
-        root = tree.getroot()
+    @classmethod
+    def get(cls, schema_path: str | Path) -> "SchemaParser":
+        """Get a shared parser for a schema file.
+
+        Parsers are cached per path and modification time, so the XML is
+        only re-parsed when the file changes.
 
-        # Parse all tables
-        for table_elem in root.findall("table"):
-            table_name = table_elem.get("name")
-            table = Table(table_name)
+        Args:
+            schema_path: Path to the schema XML file
 
-            # Parse columns
-            for col_elem in table_elem.findall("column"):
-                col_name = col_elem.get("name")
-                col_type = col_elem.get("type")
-                nullable = col_elem.get("nullable")
-                table.add_column(col_name, col_type, nullable)
+        Returns:
+            SchemaParser: Cached parser for the current version of the file
+        """
+        path = Path(schema_path)
+        return _load_parser(str(path), path.stat().st_mtime)
 
-            self.tables[table_name] = table
+    def _parse_schema(self):
+        """Parse the XML schema file."""
+        # Stream the file, building one table at a time and clearing each
+        # element once read, so the whole tree is never held in memory.
+        # Names and types are interned: the same strings recur across tables
+        # and key sets, and interned strings compare by identity.
+        intern = sys.intern
+        table = None
+        for event, elem in ET.iterparse(self.schema_path, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                if tag == "table":
+                    table = Table(intern(elem.get("name")))
+            elif tag == "column" and table is not None:
+                attrib = elem.attrib
+                table.add_column(
+                    intern(attrib.get("name")),
+                    intern(attrib.get("type")),
+                    intern(attrib.get("nullable")),
+                )
+                elem.clear()
+            elif tag == "table" and table is not None:
+                self.tables[table.name] = table
+                elem.clear()
+                table = None
 
         # Infer primary and foreign keys
+        table_names = frozenset(self.tables)
         for table in self.tables.values():
-            table.infer_primary_key()
-
-        for table in self.tables.values():
-            table.infer_foreign_keys(self.tables)
+            table.infer_keys(table_names)
+            # Keys are fixed once inferred
+            table.primary_keys = frozenset(table.primary_keys)
+            table.foreign_keys = types.MappingProxyType(table.foreign_keys)
+            table.render_mermaid()
+
+        # Precompute relationships and table groups once, since the schema is
+        # immutable: each diagram then only filters these.
+        # (parent, child) pairs, without duplicates, in schema order, each
+        # with its Mermaid line. Bridge tables have a many-to-one
+        # relationship with each parent, exactly like a regular one-to-many
+        # child, so every edge is drawn the same way.
+        self._edges: Dict[Tuple[str, str], str] = {
+            (ref_table, table.name): (
+                f"    {ref_table.upper()} ||--o{{ {table.name.upper()} : \"has\"\n"
+            )
+            for table in self.tables.values()
+            for ref_table in table.foreign_keys.values()
+        }
+        self._bridge_tables: FrozenSet[str] = frozenset(
+            name for name, table in self.tables.items() if table.is_bridge_table()
+        )
+        self._core_tables: FrozenSet[str] = frozenset(
+            name
+            for name in self.tables
+            if not name.endswith("_vw")  # Skip views
+            and name not in self._bridge_tables
+            and name != "source_table"  # Skip source_table (legacy)
+        )
+        # Bridge tables whose parents are all core tables
+        self._core_bridge_tables: FrozenSet[str] = frozenset(
+            name
+            for name in self._bridge_tables
+            if all(
+                ref_table in self._core_tables
+                for ref_table in self.tables[name].foreign_keys.values()
+            )
+        )
 
-    def get_core_tables(self) -> Set[str]:
+    def get_core_tables(self) -> FrozenSet[str]:
         """Get the core entity tables (non-bridge, non-view)."""
-        core = set()
-        for name, table in self.tables.items():
-            # Skip views
-            if name.endswith("_vw"):
-                continue
-            # Skip bridge tables
-            if table.is_bridge_table():
-                continue
-            # Skip source_table (legacy)
-            if name == "source_table":
-                continue
-            core.add(name)
-        return core
-
-    def get_bridge_tables(self) -> Set[str]:
-        """Get bridge/junction tables for many-to-many relationships."""
-        return {name for name, table in self.tables.items() if table.is_bridge_table()}
-
-    def _generate_table_mermaid(self, table: Table, include_all_columns: bool = False) -> str:
-        """Generate Mermaid syntax for a single table."""
-        lines = [f"    {table.name.upper()} {{"]
-
-        # Determine which columns to include
-        columns_to_show = []
-        if include_all_columns:
-            columns_to_show = table.columns
-        else:
-            # Show only key columns (PKs and FKs)
-            for col_name, col_type, _ in table.columns:
-                if col_name in table.primary_keys or col_name in table.foreign_keys:
-                    columns_to_show.append((col_name, col_type, ""))
-
-        # Add columns
-        for col_name, col_type, _ in columns_to_show:
-            # Determine key type
-            key_type = ""
-            if col_name in table.primary_keys:
-                key_type = " PK"
-            elif col_name in table.foreign_keys:
-                key_type = " FK"
+        return self._core_tables
 
-            lines.append(f"        {col_type} {col_name}{key_type}")
-
-        lines.append("    }")
-        return "\n".join(lines)
+    def get_bridge_tables(self) -> FrozenSet[str]:
+        """Get bridge/junction tables for many-to-many relationships."""
+        return self._bridge_tables
 
     def _generate_relationships_mermaid(
-        self, tables_to_include: Set[str]
-    ) -> List[str]:
-        """Generate Mermaid relationship syntax."""
-        relationships = []
-        added_relationships = set()
-
-        for table_name in tables_to_include:
-            table = self.tables.get(table_name)
-            if not table:
-                continue
-
-            for fk_col, ref_table in table.foreign_keys.items():
-                # Only include if both tables are in the diagram
-                if ref_table not in tables_to_include:
-                    continue
-
-                # Avoid duplicate relationships
-                rel_key = f"{ref_table}-{table_name}"
-                if rel_key in added_relationships:
-                    continue
-                added_relationships.add(rel_key)
-
-                # Determine relationship cardinality
-                # If this is a bridge table, it's many-to-many
-                if table.is_bridge_table():
-                    # Bridge table has many-to-one relationship with each parent
-                    relationships.append(
-                        f"    {ref_table.upper()} ||--o{{ {table_name.upper()} : \"has\""
-                    )
-                else:
-                    # Regular one-to-many
-                    relationships.append(
-                        f"    {ref_table.upper()} ||--o{{ {table_name.upper()} : \"has\""
-                    )
-
-        return relationships
+        self, buf: io.StringIO, tables_to_include: Set[str]
+    ):
+        """Write Mermaid relationship syntax to the buffer."""
+        # One pass over the precomputed edges; only include relationships
+        # where both tables are in the diagram
+        for (ref_table, table_name), line in self._edges.items():
+            if ref_table in tables_to_include and table_name in tables_to_include:
+                buf.write(line)
 
     def generate_full_diagram(self, include_all_columns: bool = False) -> str:
         """Generate a complete ER diagram with all tables."""
@@ -193,23 +258,8 @@ class SchemaParser:
 
     def generate_core_diagram(self, include_all_columns: bool = False) -> str:
         """Generate ER diagram with core tables and their immediate relationships."""
-        core_tables = self.get_core_tables()
-
-        # Add bridge tables that connect core tables
-        bridge_tables = set()
-        for bridge_name, bridge_table in self.tables.items():
-            if not bridge_table.is_bridge_table():
-                continue
-
-            # Check if this bridge connects core tables
-            connects_core = all(
-                ref_table in core_tables
-                for ref_table in bridge_table.foreign_keys.values()
-            )
-            if connects_core:
-                bridge_tables.add(bridge_name)
-
-        tables_to_include = core_tables | bridge_tables
+        # Core tables plus the bridge tables that connect them
+        tables_to_include = self._core_tables | self._core_bridge_tables
         return self._generate_diagram(tables_to_include, include_all_columns)
 
     def generate_domain_diagram(
@@ -262,92 +312,106 @@ class SchemaParser:
     def _generate_diagram(
         self, tables_to_include: Set[str], include_all_columns: bool = False
     ) -> str:
-        """Generate Mermaid ER diagram syntax."""
-        lines = ["erDiagram"]
+        """Generate Mermaid ER diagram syntax.
+
+        The parsed schema is immutable, so each diagram is generated once per
+        parser and then served from the cache.
+        """
+        cache_key = (frozenset(tables_to_include), include_all_columns)
+        if cache_key in self._diagram_cache:
+            return self._diagram_cache[cache_key]
+
+        # Every section writes newline-terminated lines into one buffer
+        buf = io.StringIO()
+        buf.write("erDiagram\n")
 
         # Add table definitions
         for table_name in sorted(tables_to_include):
             table = self.tables.get(table_name)
             if table:
-                lines.append(self._generate_table_mermaid(table, include_all_columns))
+                buf.write(table.mermaid(include_all_columns))
 
         # Add relationships
-        lines.append("")
-        lines.extend(self._generate_relationships_mermaid(tables_to_include))
+        buf.write("\n")
+        self._generate_relationships_mermaid(buf, tables_to_include)
 
-        return "\n".join(lines)
+        diagram = buf.getvalue()
+        self._diagram_cache[cache_key] = diagram
+        return diagram
 
 
-def generate_mermaid_html(mermaid_code: str, height: int = 600) -> str:
-    """Generate HTML with embedded Mermaid diagram with interactive zoom/pan.
-
-    Args:
-        mermaid_code: Mermaid diagram syntax
-        height: Height of the diagram container in pixels
+@functools.lru_cache(maxsize=4)
+def _load_parser(schema_path: str, mtime: float) -> SchemaParser:
+    """Parse a schema file (cached per path and modification time).
 
-    Returns:
-        HTML string with embedded Mermaid diagram and zoom controls
+    Use SchemaParser.get rather than calling this directly. The mtime
+    argument is only part of the cache key.
     """
-    html = f"""
+    return SchemaParser(schema_path)
+
+
+# Page wrapping a Mermaid diagram with zoom/pan controls; __MERMAID_CODE__ is
+# replaced with the diagram syntax
+MERMAID_HTML_TEMPLATE = """
     <!DOCTYPE html>
     <html>
     <head>
         <script src="https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.min.js"></script>
         <script src="https://cdn.jsdelivr.net/npm/svg-pan-zoom@3.6.1/dist/svg-pan-zoom.min.js"></script>
         <script>
-            mermaid.initialize({{
+            mermaid.initialize({
                 startOnLoad: true,
                 theme: 'default',
-                er: {{
+                er: {
                     fontSize: 18,
                     useMaxWidth: false,
                     layoutDirection: 'TB'
-                }}
-            }});
+                }
+            });
         </script>
         <style>
-            * {{
+            * {
                 margin: 0;
                 padding: 0;
                 box-sizing: border-box;
-            }}
-            body {{
+            }
+            body {
                 margin: 0;
                 padding: 0;
                 background-color: #f8f9fa;
                 font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
                 overflow: hidden;
-            }}
-            #container {{
+            }
+            #container {
                 position: relative;
                 width: 100vw;
                 height: 100vh;
                 overflow: hidden;
                 background-color: white;
-            }}
-            #diagram-container {{
+            }
+            #diagram-container {
                 width: 100%;
                 height: calc(100% - 60px);
                 overflow: hidden;
                 position: relative;
                 cursor: grab;
-            }}
-            #diagram-container:active {{
+            }
+            #diagram-container:active {
                 cursor: grabbing;
-            }}
-            .mermaid {{
+            }
+            .mermaid {
                 min-width: 100%;
                 min-height: 100%;
                 display: flex;
                 justify-content: center;
                 align-items: flex-start;
                 padding: 20px;
-            }}
-            .mermaid svg {{
+            }
+            .mermaid svg {
                 max-width: none !important;
                 height: auto !important;
-            }}
-            #controls {{
+            }
+            #controls {
                 position: absolute;
                 top: 10px;
                 right: 10px;
@@ -358,8 +422,8 @@ def generate_mermaid_html(mermaid_code: str, height: int = 600) -> str:
                 padding: 10px;
                 border-radius: 8px;
                 box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-            }}
-            .control-btn {{
+            }
+            .control-btn {
                 background: #0066cc;
                 color: white;
                 border: none;
@@ -372,16 +436,16 @@ def generate_mermaid_html(mermaid_code: str, height: int = 600) -> str:
                 display: flex;
                 align-items: center;
                 gap: 6px;
-            }}
-            .control-btn:hover {{
+            }
+            .control-btn:hover {
                 background: #0052a3;
                 transform: translateY(-1px);
                 box-shadow: 0 2px 4px rgba(0,0,0,0.2);
-            }}
-            .control-btn:active {{
+            }
+            .control-btn:active {
                 transform: translateY(0);
-            }}
-            #info {{
+            }
+            #info {
                 position: absolute;
                 bottom: 10px;
                 left: 10px;
@@ -392,7 +456,7 @@ def generate_mermaid_html(mermaid_code: str, height: int = 600) -> str:
                 color: #666;
                 box-shadow: 0 2px 8px rgba(0,0,0,0.1);
                 z-index: 1000;
-            }}
+            }
         </style>
     </head>
     <body>
@@ -416,7 +480,7 @@ def generate_mermaid_html(mermaid_code: str, height: int = 600) -> str:
             </div>
             <div id="diagram-container">
                 <div class="mermaid">
-{mermaid_code}
+__MERMAID_CODE__
                 </div>
             </div>
         </div>
@@ -425,11 +489,11 @@ def generate_mermaid_html(mermaid_code: str, height: int = 600) -> str:
             let currentScale = 1;
 
             // Wait for Mermaid to render
-            setTimeout(() => {{
+            setTimeout(() => {
                 const svg = document.querySelector('.mermaid svg');
-                if (svg) {{
+                if (svg) {
                     // Initialize svg-pan-zoom
-                    panZoomInstance = svgPanZoom(svg, {{
+                    panZoomInstance = svgPanZoom(svg, {
                         zoomEnabled: true,
                         controlIconsEnabled: false,
                         fit: true,
@@ -441,52 +505,59 @@ def generate_mermaid_html(mermaid_code: str, height: int = 600) -> str:
                         mouseWheelZoomEnabled: true,
                         preventMouseEventsDefault: true,
                         contain: false
-                    }});
+                    });
 
                     // Initial zoom to fit
-                    setTimeout(() => {{
+                    setTimeout(() => {
                         panZoomInstance.fit();
                         panZoomInstance.center();
                         // Zoom out slightly for better initial view
                         panZoomInstance.zoom(0.9);
-                    }}, 100);
-                }}
-            }}, 500);
+                    }, 100);
+                }
+            }, 500);
 
-            function zoomIn() {{
-                if (panZoomInstance) {{
+            function zoomIn() {
+                if (panZoomInstance) {
                     panZoomInstance.zoomIn();
-                }}
-            }}
+                }
+            }
 
-            function zoomOut() {{
-                if (panZoomInstance) {{
+            function zoomOut() {
+                if (panZoomInstance) {
                     panZoomInstance.zoomOut();
-                }}
-            }}
+                }
+            }
 
-            function resetZoom() {{
-                if (panZoomInstance) {{
+            function resetZoom() {
+                if (panZoomInstance) {
                     panZoomInstance.resetZoom();
                     panZoomInstance.center();
-                }}
-            }}
+                }
+            }
 
-            function fitToScreen() {{
-                if (panZoomInstance) {{
+            function fitToScreen() {
+                if (panZoomInstance) {
                     panZoomInstance.fit();
                     panZoomInstance.center();
                     panZoomInstance.zoom(0.9);
-                }}
-            }}
+                }
+            }
         </script>
     </body>
     </html>
     """
-    return html
 
 
-def get_schema_path() -> Path:
-    """Get the path to the schema XML file."""
-    # Assume we're running from project root
-    return Path(__file__).parent.parent / "lnrs_3nf_o1_schema.xml"
+def generate_mermaid_html(mermaid_code: str, height: int = 600) -> str:
+    """Generate HTML with embedded Mermaid diagram with interactive zoom/pan.
+
+    Args:
+        mermaid_code: Mermaid diagram syntax
+        height: Height of the diagram container in pixels
+
+    Returns:
+        HTML string with embedded Mermaid diagram and zoom controls
+    """
+    # str.replace avoids escaping the template's CSS/JS braces for str.format
+    return MERMAID_HTML_TEMPLATE.replace("__MERMAID_CODE__", mermaid_code)
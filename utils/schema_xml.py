@@ -0,0 +1,38 @@
+"""Schema XML reading utilities.
+
+This module reads table and view names from the exported schema XML file,
+without the column and key handling needed to draw diagrams.
+"""
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+
+def get_schema_path() -> Path:
+    """Get the path to the schema XML file."""
+    # Assume we're running from project root
+    return Path(__file__).parent.parent / "lnrs_3nf_o1_schema.xml"
+
+
+def read_schema_relations(
+    schema_path: str | Path | None = None,
+) -> tuple[list[str], list[str]]:
+    """Read the table and view names from the schema XML.
+
+    Views are the relations whose names end in "_vw".
+
+    Args:
+        schema_path: Path to the schema XML file (None = get_schema_path())
+
+    Returns:
+        tuple: (table names, view names), in schema order
+    """
+    tables: list[str] = []
+    views: list[str] = []
+    # Stream the file, clearing each table once read
+    for _, elem in ET.iterparse(schema_path or get_schema_path()):
+        if elem.tag == "table":
+            name = elem.get("name")
+            (views if name.endswith("_vw") else tables).append(name)
+            elem.clear()
+    return tables, views
@@ -6,6 +6,7 @@ and data as the local DuckDB database.
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import duckdb
@@ -15,6 +16,46 @@ from dotenv import load_dotenv
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from utils.schema_xml import read_schema_relations  # noqa: E402
+
+# Sample of critical FK relationships checked for orphaned rows:
+# check name -> (child table, FK column, parent table, PK column)
+FK_CHECKS = {
+    "measure_has_type -> measure": (
+        "measure_has_type", "measure_id", "measure", "measure_id"
+    ),
+    "measure_has_type -> measure_type": (
+        "measure_has_type", "measure_type_id", "measure_type", "measure_type_id"
+    ),
+    "measure_area_priority -> measure": (
+        "measure_area_priority", "measure_id", "measure", "measure_id"
+    ),
+    "measure_area_priority -> area": (
+        "measure_area_priority", "area_id", "area", "area_id"
+    ),
+    "measure_area_priority -> priority": (
+        "measure_area_priority", "priority_id", "priority", "priority_id"
+    ),
+}
+
+# Counts child rows whose FK has no matching parent row
+ORPHAN_QUERY_TEMPLATE = (
+    "SELECT COUNT(*) FROM {child} c "
+    "LEFT JOIN {parent} p ON c.{fk} = p.{pk} "
+    "WHERE p.{pk} IS NULL"
+)
+
+# Orphan queries are built once at import: one per check, plus all of them
+# combined so the checks cost a single round trip
+FK_ORPHAN_QUERIES = {
+    name: ORPHAN_QUERY_TEMPLATE.format(child=child, fk=fk, parent=parent, pk=pk)
+    for name, (child, fk, parent, pk) in FK_CHECKS.items()
+}
+FK_ORPHAN_BATCH_QUERY = " UNION ALL ".join(
+    f"SELECT '{name}' AS check_name, ({query}) AS orphans"
+    for name, query in FK_ORPHAN_QUERIES.items()
+)
+
 
 def get_local_connection() -> duckdb.DuckDBPyConnection:
     """Get connection to local database."""
@@ -69,10 +110,104 @@ def validate_connections() -> tuple[duckdb.DuckDBPyConnection, duckdb.DuckDBPyCo
         print(f"[FAIL] MotherDuck connection failed: {e}")
         sys.exit(1)
 
-    print()
+    print(flush=True)
     return local_conn, md_conn
 
 
+def count_rows(
+    conn: duckdb.DuckDBPyConnection, relations: list[str]
+) -> dict[str, int | Exception]:
+    """Count the rows of each table or view in a single UNION ALL query.
+
+    If the batched query fails (e.g. a table is missing), each relation is
+    counted separately so the failing ones can be reported individually.
+
+    Args:
+        conn: Database connection
+        relations: Table or view names
+
+    Returns:
+        dict: Relation name -> row count, or the error raised counting it
+    """
+    query = " UNION ALL ".join(
+        f"SELECT '{name}' AS name, COUNT(*) AS n FROM {name}" for name in relations
+    )
+    try:
+        return dict(conn.execute(query).fetchall())
+    except duckdb.Error:
+        counts: dict[str, int | Exception] = {}
+        for name in relations:
+            try:
+                counts[name] = conn.execute(
+                    f"SELECT COUNT(*) FROM {name}"
+                ).fetchone()[0]
+            except Exception as e:
+                counts[name] = e
+        return counts
+
+
+def count_rows_in_both(
+    local_conn: duckdb.DuckDBPyConnection,
+    md_conn: duckdb.DuckDBPyConnection,
+    relations: list[str],
+) -> tuple[dict[str, int | Exception], dict[str, int | Exception]]:
+    """Run count_rows against the local database and MotherDuck concurrently.
+
+    DuckDB releases the GIL while executing, so the local count overlaps the
+    MotherDuck network round trip. Each connection is used by one thread only.
+
+    Args:
+        local_conn: Local database connection
+        md_conn: MotherDuck connection
+        relations: Table or view names
+
+    Returns:
+        tuple: (local counts, MotherDuck counts)
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        local_future = executor.submit(count_rows, local_conn, relations)
+        md_future = executor.submit(count_rows, md_conn, relations)
+        return local_future.result(), md_future.result()
+
+
+def compare_counts(
+    relations: list[str],
+    local_counts: dict[str, int | Exception],
+    md_counts: dict[str, int | Exception],
+) -> bool:
+    """Print a line per relation comparing local and MotherDuck row counts.
+
+    Args:
+        relations: Table or view names, in display order
+        local_counts: Counts from count_rows on the local database
+        md_counts: Counts from count_rows on MotherDuck
+
+    Returns:
+        bool: True if every count was read and matches
+    """
+    all_match = True
+
+    for name in relations:
+        local_count = local_counts[name]
+        md_count = md_counts[name]
+        error = next(
+            (c for c in (local_count, md_count) if isinstance(c, Exception)), None
+        )
+
+        if error is not None:
+            print(f"[FAIL] {name:30s}: Error - {error}")
+            all_match = False
+        elif local_count == md_count:
+            print(f"[OK] {name:30s}: {local_count:5d} rows (match)")
+        else:
+            print(
+                f"[FAIL] {name:30s}: local={local_count}, motherduck={md_count} (MISMATCH)"
+            )
+            all_match = False
+
+    return all_match
+
+
 def validate_table_counts(
     local_conn: duckdb.DuckDBPyConnection, md_conn: duckdb.DuckDBPyConnection
 ) -> bool:
@@ -84,51 +219,15 @@ def validate_table_counts(
     print("Step 2: Validating Table Row Counts")
     print("-" * 70)
 
-    tables = [
-        "measure",
-        "area",
-        "priority",
-        "species",
-        "grant_table",
-        "measure_type",
-        "stakeholder",
-        "benefits",
-        "habitat",
-        "measure_has_type",
-        "measure_has_stakeholder",
-        "measure_area_priority",
-        "species_area_priority",
-        "area_funding_schemes",
-        "measure_has_benefits",
-        "measure_has_species",
-        "habitat_creation_area",
-        "habitat_management_area",
-        "area_geom",
-        "measure_area_priority_grant",
-        "source_table",
-    ]
+    # Tables listed in the schema XML, so new tables are validated automatically
+    tables, _ = read_schema_relations()
 
-    all_match = True
-
-    for table in tables:
-        try:
-            local_count = local_conn.execute(
-                f"SELECT COUNT(*) FROM {table}"
-            ).fetchone()[0]
-            md_count = md_conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
-
-            if local_count == md_count:
-                print(f"[OK] {table:30s}: {local_count:5d} rows (match)")
-            else:
-                print(
-                    f"[FAIL] {table:30s}: local={local_count}, motherduck={md_count} (MISMATCH)"
-                )
-                all_match = False
-        except Exception as e:
-            print(f"[FAIL] {table:30s}: Error - {e}")
-            all_match = False
+    # One round trip per database, both in flight at once
+    all_match = compare_counts(
+        tables, *count_rows_in_both(local_conn, md_conn, tables)
+    )
 
-    print()
+    print(flush=True)
     return all_match
 
 
@@ -143,32 +242,12 @@ def validate_views(
     print("Step 3: Validating Views")
     print("-" * 70)
 
-    views = ["source_table_recreated_vw", "apmg_slim_vw"]
-
-    all_work = True
-
-    for view in views:
-        try:
-            # Test local view
-            local_count = local_conn.execute(f"SELECT COUNT(*) FROM {view}").fetchone()[
-                0
-            ]
+    _, views = read_schema_relations()
 
-            # Test MotherDuck view
-            md_count = md_conn.execute(f"SELECT COUNT(*) FROM {view}").fetchone()[0]
+    # Test both databases' views concurrently, one round trip per database
+    all_work = compare_counts(views, *count_rows_in_both(local_conn, md_conn, views))
 
-            if local_count == md_count:
-                print(f"[OK] {view:30s}: {local_count:5d} rows (match)")
-            else:
-                print(
-                    f"[FAIL] {view:30s}: local={local_count}, motherduck={md_count} (MISMATCH)"
-                )
-                all_work = False
-        except Exception as e:
-            print(f"[FAIL] {view:30s}: Error - {e}")
-            all_work = False
-
-    print()
+    print(flush=True)
     return all_work
 
 
@@ -201,80 +280,49 @@ def validate_macros(md_conn: duckdb.DuckDBPyConnection) -> bool:
         print(f"[FAIL] Macro validation failed: {e}")
         return False
 
-    print()
+    print(flush=True)
     return True
 
 
 def validate_foreign_keys(md_conn: duckdb.DuckDBPyConnection) -> bool:
     """Validate that foreign key constraints exist in MotherDuck.
 
+    All orphan checks run as one UNION ALL query. If it fails, each check
+    is run on its own so failures are reported per relationship.
+
     Returns:
         bool: True if constraints exist
     """
     print("Step 5: Validating Foreign Key Constraints")
     print("-" * 70)
 
-    # Sample a few critical FK relationships
-    fk_checks = [
-        {
-            "name": "measure_has_type -> measure",
-            "query": """
-                SELECT COUNT(*) FROM measure_has_type mht
-                LEFT JOIN measure m ON mht.measure_id = m.measure_id
-                WHERE m.measure_id IS NULL
-            """,
-        },
-        {
-            "name": "measure_has_type -> measure_type",
-            "query": """
-                SELECT COUNT(*) FROM measure_has_type mht
-                LEFT JOIN measure_type mt ON mht.measure_type_id = mt.measure_type_id
-                WHERE mt.measure_type_id IS NULL
-            """,
-        },
-        {
-            "name": "measure_area_priority -> measure",
-            "query": """
-                SELECT COUNT(*) FROM measure_area_priority map
-                LEFT JOIN measure m ON map.measure_id = m.measure_id
-                WHERE m.measure_id IS NULL
-            """,
-        },
-        {
-            "name": "measure_area_priority -> area",
-            "query": """
-                SELECT COUNT(*) FROM measure_area_priority map
-                LEFT JOIN area a ON map.area_id = a.area_id
-                WHERE a.area_id IS NULL
-            """,
-        },
-        {
-            "name": "measure_area_priority -> priority",
-            "query": """
-                SELECT COUNT(*) FROM measure_area_priority map
-                LEFT JOIN priority p ON map.priority_id = p.priority_id
-                WHERE p.priority_id IS NULL
-            """,
-        },
-    ]
+    results: dict[str, int | Exception]
+    try:
+        results = dict(md_conn.execute(FK_ORPHAN_BATCH_QUERY).fetchall())
+    except duckdb.Error:
+        results = {}
+        for name, query in FK_ORPHAN_QUERIES.items():
+            try:
+                results[name] = md_conn.execute(query).fetchone()[0]
+            except Exception as e:
+                results[name] = e
 
     all_valid = True
 
-    for check in fk_checks:
-        try:
-            orphans = md_conn.execute(check["query"]).fetchone()[0]
-            if orphans == 0:
-                print(f"[OK] {check['name']:45s}: No orphaned records")
-            else:
-                print(
-                    f"[FAIL] {check['name']:45s}: {orphans} orphaned records found (ERROR)"
-                )
-                all_valid = False
-        except Exception as e:
-            print(f"[FAIL] {check['name']:45s}: Error - {e}")
+    for name in FK_CHECKS:
+        orphans = results[name]
+        if isinstance(orphans, Exception):
+            print(f"[FAIL] {name:45s}: Error - {orphans}")
+            all_valid = False
+        elif orphans == 0:
+            print(f"[OK] {name:45s}: No orphaned records")
+        else:
+            print(
+                f"[FAIL] {name:45s}: {orphans} orphaned records found (ERROR)"
+            )
             all_valid = False
 
-    print()
+    print(flush=True)
     return all_valid
 
 
@@ -313,6 +361,10 @@ def print_summary(results: dict[str, bool]) -> None:
 
 def main() -> None:
     """Run all validation checks."""
+    # Buffer the report rather than writing it line by line; each step
+    # flushes once when it finishes, so progress still appears per step
+    sys.stdout.reconfigure(line_buffering=False)
+
     try:
         # Step 1: Connect to both databases
         local_conn, md_conn = validate_connections()